@@ -482,7 +482,11 @@ class UserAuthTokenAuthentication(StandardAuthentication):
         if SiloMode.get_current_mode() == SiloMode.CELL:
             try:
                 # Try to find the token by its hashed value first
-                return ApiTokenReplica.objects.get(hashed_token=hashed_token)
+                replica = ApiTokenReplica.objects.get_from_cache(hashed_token=hashed_token)
+                if replica.hashed_token != hashed_token:
+                    # The cached entry is stale, so it can't be trusted for auth.
+                    replica = ApiTokenReplica.objects.get(hashed_token=hashed_token)
+                return replica
             except ApiTokenReplica.DoesNotExist:
                 try:
                     # If we can't find it by hash, use the plaintext string
@@ -17,7 +17,7 @@ from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from rest_framework.authentication import BaseAuthentication, SessionAuthentication
 from rest_framework.exceptions import ParseError
-from rest_framework.permissions import BasePermission
+from rest_framework.permissions import SAFE_METHODS, BasePermission
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -43,6 +43,7 @@ from sentry.apidocs.hooks import HTTP_METHOD_NAME
 from sentry.auth import access
 from sentry.auth.staff import has_staff_option
 from sentry.hybridcloud.apigateway.cell_request_resolvers import CellRequestResolver
+from sentry.hybridcloud.rpc.service import rpc_memoization_scope
 from sentry.middleware import is_frontend_request
 from sentry.organizations.absolute_url import generate_organization_url
 from sentry.ratelimits.config import DEFAULT_RATE_LIMIT_CONFIG, RateLimitConfig
@@ -483,7 +484,12 @@ class Endpoint(APIView):
                     getattr(part, "__name__", None) or str(part) for part in (type(self), handler)
                 ),
             ) as span:
-                response = handler(request, *args, **kwargs)
+                if request.method in SAFE_METHODS:
+                    # Read-only requests may memoise repeated cross-silo RPC lookups.
+                    with rpc_memoization_scope():
+                        response = handler(request, *args, **kwargs)
+                else:
+                    response = handler(request, *args, **kwargs)
 
         except Exception as exc:
             response = self.handle_exception_with_details(request, exc)
@@ -1979,6 +1979,17 @@ default_config = SearchConfig(
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_search_tree(query: str) -> Node:
+    """
+    Parses a query string into its grammar tree. The tree only depends on the
+    query text, so it is cached and only the visitor, which applies the search
+    config and params, is rerun for repeated queries. Parse errors are raised
+    and never cached.
+    """
+    return event_search_grammar.parse(query)
+
+
 @overload
 def parse_search_query(
     query: str,
@@ -2013,7 +2024,7 @@ def parse_search_query(
         config = default_config
 
     try:
-        tree = event_search_grammar.parse(query)
+        tree = _parse_search_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
@@ -3,14 +3,16 @@ from __future__ import annotations
 import functools
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from datetime import datetime, timedelta
 from typing import Any, NamedTuple, NotRequired, Protocol, TypedDict
 
 from django.contrib.auth.models import AnonymousUser
+from django.db import connections
+from django.db.models import prefetch_related_objects
 from django.utils import timezone
 
-from sentry import features, release_health, tsdb
+from sentry import features, options, release_health, tsdb
 from sentry.api.serializers import serialize
 from sentry.api.serializers.models.actor import ActorSerializerResponse
 from sentry.api.serializers.models.group import (
@@ -51,6 +53,7 @@ from sentry.users.models.user import User
 from sentry.users.services.user.model import RpcUser
 from sentry.utils import metrics
 from sentry.utils.cache import cache
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.hashlib import hash_values
 from sentry.utils.snuba import get_snuba_column_name, resolve_column, resolve_conditions
 
@@ -304,6 +307,62 @@ class StreamGroupSerializerSnubaResponse(TypedDict):
     matchingEventEnvironment: NotRequired[str | None]
 
 
+class _AttrLoader(NamedTuple):
+    name: str
+    load: Callable[[], Mapping[Group, Mapping[str, Any]]]
+    # Loaders that populate thread-local state used later in `serialize` (such
+    # as the GroupMeta cache) have to run on the calling thread.
+    thread_local: bool = False
+
+
+def _load_attrs(loader: _AttrLoader, in_worker: bool) -> Mapping[Group, Mapping[str, Any]]:
+    try:
+        with metrics.timer("group_stream.get_attrs.loader.duration", tags={"loader": loader.name}):
+            return loader.load()
+    finally:
+        if in_worker:
+            # Worker threads open their own database connections, close them
+            # so they are not left behind once the pool shuts down.
+            connections.close_all()
+
+
+def _run_attr_loaders(
+    loaders: Sequence[_AttrLoader], item_list: Sequence[Group]
+) -> dict[Group, dict[str, Any]]:
+    """
+    Runs the given attribute loaders and merges their per-group attrs in order.
+
+    Loaders do not depend on one another, so they are fanned out over a thread
+    pool when `api.group-stream.attr-loader-workers` is greater than one.
+    """
+    pooled = [loader for loader in loaders if not loader.thread_local]
+    max_workers = min(options.get("api.group-stream.attr-loader-workers"), len(pooled))
+    results: dict[str, Mapping[Group, Mapping[str, Any]]] = {}
+    if max_workers > 1:
+        # Loaders read `group.project.organization`; populate it once up front
+        # rather than racing to lazily load it from each thread.
+        prefetch_related_objects(item_list, "project__organization")
+        with ContextPropagatingThreadPoolExecutor(
+            thread_name_prefix=__name__, max_workers=max_workers
+        ) as pool:
+            futures = {loader.name: pool.submit(_load_attrs, loader, True) for loader in pooled}
+            for loader in loaders:
+                if loader.thread_local:
+                    results[loader.name] = _load_attrs(loader, False)
+        for name, future in futures.items():
+            results[name] = future.result()
+    else:
+        for loader in loaders:
+            results[loader.name] = _load_attrs(loader, False)
+
+    attrs: dict[Group, dict[str, Any]] = {item: {} for item in item_list}
+    for loader in loaders:
+        for item, item_attrs in results[loader.name].items():
+            if item in attrs:
+                attrs[item].update(item_attrs)
+    return attrs
+
+
 class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
     def __init__(
         self,
@@ -346,163 +405,243 @@ class StreamGroupSerializerSnuba(GroupSerializerSnuba, GroupStatsMixin):
         user: User | RpcUser | AnonymousUser,
         **kwargs: Any,
     ) -> dict[Group, dict[str, Any]]:
-        if not self._collapse("base"):
-            attrs = super().get_attrs(item_list, user)
-        else:
-            seen_stats = self._get_seen_stats(item_list, user)
-
-            attrs = {item: {} for item in item_list}
-            if seen_stats is not None:
-                for item, stats_dct in seen_stats.items():
-                    if item in attrs:
-                        attrs[item].update(stats_dct)
-
-            if len(item_list) > 0:
-                unhandled_stats = self._get_group_snuba_stats(item_list, seen_stats)
-
-                if unhandled_stats is not None:
-                    for item in item_list:
-                        attrs[item]["is_unhandled"] = bool(
-                            unhandled_stats.get(item.id, {}).get("unhandled")
-                        )
+        loaders = [
+            _AttrLoader(
+                "base",
+                functools.partial(self._load_base_attrs, item_list, user),
+                thread_local=True,
+            )
+        ]
 
         if self.stats_period and not self._collapse("stats"):
-            partial_get_stats = functools.partial(
-                self.get_stats,
-                item_list=item_list,
-                user=user,
-                stats_query_args=GroupStatsQueryArgs(
-                    self.stats_period, self.stats_period_start, self.stats_period_end
-                ),
-                environment_ids=self.environment_ids,
+            stats_query_args = GroupStatsQueryArgs(
+                self.stats_period, self.stats_period_start, self.stats_period_end
             )
-            stats = partial_get_stats()
-            filtered_stats = (
-                partial_get_stats(conditions=self.conditions)
-                if self.conditions and not self._collapse("filtered")
-                else None
+            loaders.append(
+                _AttrLoader(
+                    "stats",
+                    functools.partial(
+                        self._load_stats_attrs, "stats", item_list, user, stats_query_args
+                    ),
+                )
             )
-            for item in item_list:
-                if filtered_stats:
-                    attrs[item]["filtered_stats"] = filtered_stats[item.id]
-                attrs[item]["stats"] = stats[item.id]
-
-            if self._expand("sessions"):
-                uniq_project_ids = list({item.project_id for item in item_list})
-                cache_keys = {pid: self._build_session_cache_key(pid) for pid in uniq_project_ids}
-                cache_data = cache.get_many(cache_keys.values())
-                missed_items = []
-                for item in item_list:
-                    num_sessions = cache_data.get(cache_keys[item.project_id])
-                    if num_sessions is None:
-                        found = "miss"
-                        missed_items.append(item)
-                    else:
-                        found = "hit"
-                        attrs[item]["sessionCount"] = num_sessions
-                    metrics.incr(f"group.get_session_counts.{found}")
-
-                if missed_items:
-                    project_ids = list({item.project_id for item in missed_items})
-                    project_sessions = release_health.backend.get_num_sessions_per_project(
-                        project_ids,
-                        self.start,
-                        self.end,
-                        self.environment_ids,
+            if self.conditions and not self._collapse("filtered"):
+                loaders.append(
+                    _AttrLoader(
+                        "filtered_stats",
+                        functools.partial(
+                            self._load_stats_attrs,
+                            "filtered_stats",
+                            item_list,
+                            user,
+                            stats_query_args,
+                            conditions=self.conditions,
+                        ),
                     )
-
-                    results = {}
-                    for project_id, count in project_sessions:
-                        cache_key = self._build_session_cache_key(project_id)
-                        results[project_id] = count
-                        cache.set(cache_key, count, 3600)
-
-                    for item in missed_items:
-                        if item.project_id in results.keys():
-                            attrs[item]["sessionCount"] = results[item.project_id]
-                        else:
-                            attrs[item]["sessionCount"] = None
+                )
+            if self._expand("sessions"):
+                loaders.append(
+                    _AttrLoader("sessions", functools.partial(self._load_session_attrs, item_list))
+                )
 
         if self._expand("inbox"):
-            inbox_stats = get_inbox_details(item_list)
-            for item in item_list:
-                attrs[item]["inbox"] = inbox_stats.get(item.id)
+            loaders.append(
+                _AttrLoader("inbox", functools.partial(self._load_inbox_attrs, item_list))
+            )
 
         if self._expand("owners"):
-            owner_details = get_owner_details(item_list)
-            for item in item_list:
-                attrs[item]["owners"] = owner_details.get(item.id)
+            loaders.append(
+                _AttrLoader("owners", functools.partial(self._load_owner_attrs, item_list))
+            )
 
         if self._expand("integrationIssues"):
-            group_ids_by_external_issue_id: dict[int, list[int]] = defaultdict(list)
-            for group_id, linked_id in GroupLink.objects.filter(
-                group_id__in=[item.id for item in item_list],
-                linked_type=GroupLink.LinkedType.issue,
-            ).values_list("group_id", "linked_id"):
-                group_ids_by_external_issue_id[linked_id].append(group_id)
-
-            external_issues = list(
-                ExternalIssue.objects.filter(id__in=group_ids_by_external_issue_id)
-            )
-            serialized_external_issues = serialize(
-                external_issues, serializer=ExternalIssueSerializer()
+            loaders.append(
+                _AttrLoader(
+                    "integrationIssues",
+                    functools.partial(self._load_integration_issue_attrs, item_list),
+                )
             )
-            integration_issues_by_group_id: dict[int, list[dict[str, Any]]] = defaultdict(list)
-            for external_issue, serialized_external_issue in zip(
-                external_issues, serialized_external_issues
-            ):
-                for group_id in group_ids_by_external_issue_id[external_issue.id]:
-                    integration_issues_by_group_id[group_id].append(serialized_external_issue)
-
-            for item in item_list:
-                attrs[item]["integrationIssues"] = integration_issues_by_group_id[item.id]
 
         if self._expand("sentryAppIssues"):
-            platform_external_issues = list(
-                PlatformExternalIssue.objects.filter(group_id__in=[item.id for item in item_list])
-            )
-            serialized_sentry_app_issues = serialize(
-                platform_external_issues, serializer=PlatformExternalIssueSerializer()
+            loaders.append(
+                _AttrLoader(
+                    "sentryAppIssues",
+                    functools.partial(self._load_sentry_app_issue_attrs, item_list),
+                )
             )
-            sentry_app_issues_by_group_id: dict[
-                int, list[PlatformExternalIssueSerializerResponse]
-            ] = defaultdict(list)
-            for platform_external_issue, serialized_sentry_app_issue in zip(
-                platform_external_issues, serialized_sentry_app_issues
-            ):
-                sentry_app_issues_by_group_id[platform_external_issue.group_id].append(
-                    serialized_sentry_app_issue
+
+        if self._expand("latestEventHasAttachments") and item_list:
+            loaders.append(
+                _AttrLoader(
+                    "latestEventHasAttachments",
+                    functools.partial(self._load_latest_event_attachment_attrs, item_list),
                 )
+            )
 
-            for item in item_list:
-                attrs[item]["sentryAppIssues"] = sentry_app_issues_by_group_id[item.id]
+        return _run_attr_loaders(loaders, item_list)
 
-        if (
-            self._expand("latestEventHasAttachments")
-            and item_list
-            and features.has("organizations:event-attachments", item_list[0].project.organization)
-        ):
-            with metrics.timer(
-                "group_stream.get_attrs.latest_event_attachments.duration",
-                tags={"strategy": "bulk"},
-            ):
-                latest_events = bulk_get_latest_event_ids(item_list)
-                latest_event_keys = set(latest_events.values())
-                attachment_event_keys = set(
-                    EventAttachment.objects.filter(
-                        project_id__in={project_id for project_id, _ in latest_event_keys},
-                        event_id__in={event_id for _, event_id in latest_event_keys},
-                    ).values_list("project_id", "event_id")
-                )
+    def _load_base_attrs(
+        self, item_list: Sequence[Group], user: User | RpcUser | AnonymousUser
+    ) -> Mapping[Group, dict[str, Any]]:
+        if not self._collapse("base"):
+            return super().get_attrs(item_list, user)
+
+        seen_stats = self._get_seen_stats(item_list, user)
+
+        attrs: dict[Group, dict[str, Any]] = {item: {} for item in item_list}
+        if seen_stats is not None:
+            for item, stats_dct in seen_stats.items():
+                if item in attrs:
+                    attrs[item].update(stats_dct)
+
+        if len(item_list) > 0:
+            unhandled_stats = self._get_group_snuba_stats(item_list, seen_stats)
+
+            if unhandled_stats is not None:
                 for item in item_list:
-                    latest_event_key = latest_events.get(item.id)
-                    if latest_event_key is not None:
-                        attrs[item]["latestEventHasAttachments"] = (
-                            latest_event_key in attachment_event_keys
-                        )
+                    attrs[item]["is_unhandled"] = bool(
+                        unhandled_stats.get(item.id, {}).get("unhandled")
+                    )
+        return attrs
 
+    def _load_stats_attrs(
+        self,
+        attr_name: str,
+        item_list: Sequence[Group],
+        user: User | RpcUser | AnonymousUser,
+        stats_query_args: GroupStatsQueryArgs,
+        conditions=None,
+    ) -> Mapping[Group, dict[str, Any]]:
+        stats = self.get_stats(
+            item_list=item_list,
+            user=user,
+            stats_query_args=stats_query_args,
+            environment_ids=self.environment_ids,
+            conditions=conditions,
+        )
+        if not stats:
+            return {}
+        return {item: {attr_name: stats[item.id]} for item in item_list}
+
+    def _load_session_attrs(self, item_list: Sequence[Group]) -> Mapping[Group, dict[str, Any]]:
+        attrs: dict[Group, dict[str, Any]] = {}
+        uniq_project_ids = list({item.project_id for item in item_list})
+        cache_keys = {pid: self._build_session_cache_key(pid) for pid in uniq_project_ids}
+        cache_data = cache.get_many(cache_keys.values())
+        missed_items = []
+        for item in item_list:
+            num_sessions = cache_data.get(cache_keys[item.project_id])
+            if num_sessions is None:
+                found = "miss"
+                missed_items.append(item)
+            else:
+                found = "hit"
+                attrs[item] = {"sessionCount": num_sessions}
+            metrics.incr(f"group.get_session_counts.{found}")
+
+        if missed_items:
+            project_ids = list({item.project_id for item in missed_items})
+            project_sessions = release_health.backend.get_num_sessions_per_project(
+                project_ids,
+                self.start,
+                self.end,
+                self.environment_ids,
+            )
+
+            results = {}
+            for project_id, count in project_sessions:
+                cache_key = self._build_session_cache_key(project_id)
+                results[project_id] = count
+                cache.set(cache_key, count, 3600)
+
+            for item in missed_items:
+                attrs[item] = {"sessionCount": results.get(item.project_id)}
         return attrs
 
+    def _load_inbox_attrs(self, item_list: Sequence[Group]) -> Mapping[Group, dict[str, Any]]:
+        inbox_stats = get_inbox_details(item_list)
+        return {item: {"inbox": inbox_stats.get(item.id)} for item in item_list}
+
+    def _load_owner_attrs(self, item_list: Sequence[Group]) -> Mapping[Group, dict[str, Any]]:
+        owner_details = get_owner_details(item_list)
+        return {item: {"owners": owner_details.get(item.id)} for item in item_list}
+
+    def _load_integration_issue_attrs(
+        self, item_list: Sequence[Group]
+    ) -> Mapping[Group, dict[str, Any]]:
+        group_ids_by_external_issue_id: dict[int, list[int]] = defaultdict(list)
+        for group_id, linked_id in GroupLink.objects.filter(
+            group_id__in=[item.id for item in item_list],
+            linked_type=GroupLink.LinkedType.issue,
+        ).values_list("group_id", "linked_id"):
+            group_ids_by_external_issue_id[linked_id].append(group_id)
+
+        external_issues = list(ExternalIssue.objects.filter(id__in=group_ids_by_external_issue_id))
+        serialized_external_issues = serialize(
+            external_issues, serializer=ExternalIssueSerializer()
+        )
+        integration_issues_by_group_id: dict[int, list[dict[str, Any]]] = defaultdict(list)
+        for external_issue, serialized_external_issue in zip(
+            external_issues, serialized_external_issues
+        ):
+            for group_id in group_ids_by_external_issue_id[external_issue.id]:
+                integration_issues_by_group_id[group_id].append(serialized_external_issue)
+
+        return {
+            item: {"integrationIssues": integration_issues_by_group_id[item.id]}
+            for item in item_list
+        }
+
+    def _load_sentry_app_issue_attrs(
+        self, item_list: Sequence[Group]
+    ) -> Mapping[Group, dict[str, Any]]:
+        platform_external_issues = list(
+            PlatformExternalIssue.objects.filter(group_id__in=[item.id for item in item_list])
+        )
+        serialized_sentry_app_issues = serialize(
+            platform_external_issues, serializer=PlatformExternalIssueSerializer()
+        )
+        sentry_app_issues_by_group_id: dict[int, list[PlatformExternalIssueSerializerResponse]] = (
+            defaultdict(list)
+        )
+        for platform_external_issue, serialized_sentry_app_issue in zip(
+            platform_external_issues, serialized_sentry_app_issues
+        ):
+            sentry_app_issues_by_group_id[platform_external_issue.group_id].append(
+                serialized_sentry_app_issue
+            )
+
+        return {
+            item: {"sentryAppIssues": sentry_app_issues_by_group_id[item.id]} for item in item_list
+        }
+
+    def _load_latest_event_attachment_attrs(
+        self, item_list: Sequence[Group]
+    ) -> Mapping[Group, dict[str, Any]]:
+        if not features.has("organizations:event-attachments", item_list[0].project.organization):
+            return {}
+
+        with metrics.timer(
+            "group_stream.get_attrs.latest_event_attachments.duration",
+            tags={"strategy": "bulk"},
+        ):
+            latest_events = bulk_get_latest_event_ids(item_list)
+            latest_event_keys = set(latest_events.values())
+            attachment_event_keys = set(
+                EventAttachment.objects.filter(
+                    project_id__in={project_id for project_id, _ in latest_event_keys},
+                    event_id__in={event_id for _, event_id in latest_event_keys},
+                ).values_list("project_id", "event_id")
+            )
+            attrs = {}
+            for item in item_list:
+                latest_event_key = latest_events.get(item.id)
+                if latest_event_key is not None:
+                    attrs[item] = {
+                        "latestEventHasAttachments": latest_event_key in attachment_event_keys
+                    }
+            return attrs
+
     def serialize(  # type: ignore[override]  # intentionally different shape
         self,
         obj: Group,
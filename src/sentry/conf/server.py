@@ -3174,6 +3174,14 @@ SENTRY_PROCESSING_SERVICES: Mapping[str, Any] = {
 #     router implementation.
 SENTRY_MODEL_CACHE_USE_REPLICA = False
 
+# If set to true, models whose manager sets `cache_process_ttl` keep the instances returned by
+# `get_from_cache` in a process-wide cache as well. See sentry.db.models.manager.process_cache.
+SENTRY_MODEL_PROCESS_CACHE_ENABLED = False
+
+# Redis cluster used to broadcast process-wide model cache invalidations between processes. If
+# unset, other processes only see changes once their entries expire.
+SENTRY_MODEL_PROCESS_CACHE_INVALIDATION_CLUSTER: str | None = None
+
 # Additional consumer definitions beyond the ones defined in sentry.consumers.
 # Necessary for getsentry to define custom consumers.
 SENTRY_KAFKA_CONSUMERS: Mapping[str, ConsumerDefinition] = {}
@@ -768,16 +768,22 @@ def merge_export_blobs(
                     type=get_file_type(output_mode),
                     headers={"Content-Type": get_content_type(output_mode)},
                 )
+                export_blobs = list(
+                    ExportedDataBlob.objects.filter(data_export=data_export).order_by("offset")
+                )
+                blobs_by_id = FileBlob.objects.in_bulk({b.blob_id for b in export_blobs})
+
                 size = 0
                 file_checksum = sha1(b"")
                 blob_offsets: list[int] = []
+                blob_indexes: list[FileBlobIndex] = []
 
-                for export_blob in ExportedDataBlob.objects.filter(
-                    data_export=data_export
-                ).order_by("offset"):
+                for export_blob in export_blobs:
                     blob_offsets.append(int(export_blob.offset))
-                    blob = FileBlob.objects.get(pk=export_blob.blob_id)
-                    FileBlobIndex.objects.create(file=file, blob=blob, offset=size)
+                    blob = blobs_by_id.get(export_blob.blob_id)
+                    if blob is None:
+                        raise FileBlob.DoesNotExist(f"FileBlob {export_blob.blob_id} not found")
+                    blob_indexes.append(FileBlobIndex(file=file, blob=blob, offset=size))
                     size += blob.size
                     blob_checksum = sha1(b"")
 
@@ -789,6 +795,8 @@ def merge_export_blobs(
                     if blob.checksum != blob_checksum.hexdigest():
                         raise AssembleChecksumMismatch("Checksum mismatch")
 
+                FileBlobIndex.objects.bulk_create(blob_indexes)
+
                 set_span_data(span, "blob_offsets", blob_offsets)
                 sentry_sdk.logger.info(
                     "dataexport.blob_offsets",
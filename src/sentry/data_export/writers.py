@@ -1,6 +1,7 @@
 import codecs
 import csv
 import enum
+import io
 from collections.abc import Mapping, Sequence
 from typing import Any, BinaryIO
 
@@ -43,12 +44,16 @@ class FileWriter:
         self._csv_headers = csv_headers
         self._writer: csv.DictWriter[str] | None = None
 
+    def _get_csv_headers(self) -> list[str]:
+        if self._csv_headers is None:
+            raise ValueError("csv_headers are required for CSV exports")
+        return self._csv_headers
+
     def _get_csv_writer(self) -> csv.DictWriter[str]:
         if self._writer is None:
-            if self._csv_headers is None:
-                raise ValueError("csv_headers are required for CSV exports")
+            csv_headers = self._get_csv_headers()
             tfw = codecs.getwriter("utf-8")(self._buffer)
-            self._writer = csv.DictWriter(tfw, self._csv_headers, **self._config)
+            self._writer = csv.DictWriter(tfw, csv_headers, **self._config)
         return self._writer
 
     def writeheader(self) -> None:
@@ -67,8 +72,18 @@ class FileWriter:
         writer.writerow(row)
 
     def writerows(self, rows: Sequence[Mapping[str, Any]]) -> None:
-        for row in rows:
-            self.writerow(row)
+        if not rows:
+            return
+
+        # Encode a whole page of rows and write it to the buffer at once, rather than
+        # going through the codecs writer (and an encode + write call) for every row.
+        if self.output_mode == OutputMode.JSONL:
+            page = "".join(f"{json.dumps(row)}\n" for row in rows)
+        else:
+            text = io.StringIO()
+            csv.DictWriter(text, self._get_csv_headers(), **self._config).writerows(rows)
+            page = text.getvalue()
+        self._buffer.write(page.encode("utf-8"))
 
 
 def get_file_type(output_mode: OutputMode) -> str:
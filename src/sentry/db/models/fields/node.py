@@ -6,7 +6,8 @@ from typing import Any
 
 from django.utils.functional import cached_property
 
-from sentry import nodestore
+from sentry import nodestore, options
+from sentry.services.nodestore.encoding import EncodedPayload
 
 __all__ = ("NodeData",)
 
@@ -27,6 +28,11 @@ class NodeData(MutableMapping[str, Any]):
     data={...} means, this is an object that should be saved to nodestore.
     """
 
+    #: The payload as last encoded by `save`, reused by the eventstream.
+    #: Dropped when top-level keys change, nested values must not be mutated
+    #: after saving.
+    encoded: EncodedPayload | None = None
+
     def __init__(self, id, data=None, wrapper=None, ref_version=None, ref_func=None):
         self.id = id
         self.ref = None
@@ -43,6 +49,7 @@ class NodeData(MutableMapping[str, Any]):
     def __getstate__(self):
         data = dict(self.__dict__)
         data.pop("data", None)
+        data.pop("encoded", None)
         # downgrade this into a normal dict in case it's a shim dict.
         data["_node_data"] = dict(data["_node_data"].items())
         return data
@@ -55,9 +62,11 @@ class NodeData(MutableMapping[str, Any]):
 
     def __setitem__(self, key, value):
         self.data[key] = value
+        self.encoded = None
 
     def __delitem__(self, key):
         del self.data[key]
+        self.encoded = None
 
     def __iter__(self):
         return iter(self.data)
@@ -107,6 +116,7 @@ class NodeData(MutableMapping[str, Any]):
         if self.wrapper is not None:
             data = self.wrapper(data)
         self._node_data = data
+        self.encoded = None
 
     def bind_ref(self, instance):
         ref = self.get_ref(instance)
@@ -137,4 +147,11 @@ class NodeData(MutableMapping[str, Any]):
         subkeys = subkeys or {}
         subkeys[None] = to_write
 
-        nodestore.backend.set_subkeys(self.id, subkeys)
+        encoded = None
+        if options.get("nodestore.encode-payload-once"):
+            encoded = EncodedPayload.encode(to_write)
+
+        nodestore.backend.set_subkeys(
+            self.id, subkeys, encoded=encoded.to_bytes() if encoded is not None else None
+        )
+        self.encoded = encoded
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import copy
+import datetime
+import decimal
 import logging
 import threading
+import time
+import uuid
 import weakref
 from collections.abc import Callable, Collection, Generator, Mapping, MutableMapping, Sequence
 from contextlib import contextmanager
@@ -9,19 +14,22 @@ from enum import IntEnum, auto
 from typing import Any
 
 from django.conf import settings
-from django.db import models, router
+from django.db import models, router, transaction
 from django.db.models import Model
 from django.db.models.fields import Field
 from django.db.models.manager import Manager as DjangoBaseManager
 from django.db.models.signals import class_prepared, post_delete, post_init, post_save
 
+from sentry.db.models.manager import process_cache
 from sentry.db.models.manager.base_query_set import BaseQuerySet
 from sentry.db.models.manager.types import M
 from sentry.db.models.query import create_or_update
 from sentry.db.postgres.transactions import django_test_transaction_water_mark
 from sentry.silo.base import SiloLimit
+from sentry.utils import metrics
 from sentry.utils.cache import cache
 from sentry.utils.hashlib import md5_text
+from sentry.utils.local_cache import ThreadSafeCache
 
 logger = logging.getLogger("sentry")
 
@@ -30,6 +38,21 @@ _local_cache_generation = 0
 _local_cache_enabled = False
 
 
+#: Field values that the process-wide cache can hand out without copying.
+_IMMUTABLE_FIELD_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    type(None),
+    datetime.date,
+    datetime.time,
+    datetime.timedelta,
+    decimal.Decimal,
+    uuid.UUID,
+)
+
+
 def flush_manager_local_cache() -> None:
     global _local_cache
     _local_cache = threading.local()
@@ -82,6 +105,10 @@ class BaseManager(_base_manager_base[M]):
         *args: Any,
         cache_fields: Sequence[str] | None = None,
         cache_ttl: int = 60 * 5,
+        cache_metrics: bool = False,
+        cache_process_ttl: int = 0,
+        cache_process_size: int = 1000,
+        cache_invalidate_on_commit: bool = False,
         **kwargs: Any,
     ) -> None:
         #: Model fields for which we should build up a cache to be used with
@@ -92,6 +119,18 @@ class BaseManager(_base_manager_base[M]):
         #: project slug is not.
         self.cache_fields = cache_fields if cache_fields is not None else ()
         self.cache_ttl = cache_ttl
+        #: Whether `get_from_cache` reports cache hits and misses as metrics.
+        self.cache_metrics = cache_metrics
+        #: How long `get_from_cache` keeps instances in a process-wide cache in
+        #: front of the django cache, 0 to disable. Only meant for models that
+        #: rarely change, see `sentry.db.models.manager.process_cache`.
+        self.cache_process_ttl = cache_process_ttl
+        #: Maximum number of lookup keys kept in the process-wide cache.
+        self.cache_process_size = cache_process_size
+        #: Whether saves and deletes drop the cached entries again once their
+        #: transaction commits. Without it, a concurrent `get_from_cache` can
+        #: cache the previously committed row until `cache_ttl` expires.
+        self.cache_invalidate_on_commit = cache_invalidate_on_commit
         self._cache_version: str | None = kwargs.pop("cache_version", None)
         self.__local_cache = threading.local()
 
@@ -192,6 +231,12 @@ class BaseManager(_base_manager_base[M]):
         Pushes changes to an instance into the cache, and removes invalid (changed)
         lookup values.
         """
+        # Only actual saves (as opposed to cache fills from `get_from_cache`)
+        # come in through the signal.
+        if kwargs.get("signal") is not None:
+            self.__invalidate_process_cache(instance)
+            self.__invalidate_on_commit(instance)
+
         pk_name = instance._meta.pk.name
         pk_names = ("pk", pk_name)
         pk_val = instance.pk
@@ -242,6 +287,9 @@ class BaseManager(_base_manager_base[M]):
         """
         Drops instance from all cache storages.
         """
+        self.__invalidate_process_cache(instance)
+        self.__invalidate_on_commit(instance)
+
         pk_name = instance._meta.pk.name
         for key in self.cache_fields:
             if key in ("pk", pk_name):
@@ -261,6 +309,102 @@ class BaseManager(_base_manager_base[M]):
     def __get_lookup_cache_key(self, **kwargs: Any) -> str:
         return make_key(self.model, "modelcache", kwargs)
 
+    def _get_process_cache(self) -> ThreadSafeCache[str, tuple[float, Any]] | None:
+        if not self.cache_process_ttl or not process_cache.is_enabled():
+            return None
+        return process_cache.get_process_cache(self.model._meta.label, self.cache_process_size)
+
+    def __get_from_process_cache(self, cache_key: str, is_pk: bool) -> M | None:
+        entries = self._get_process_cache()
+        if entries is None:
+            return None
+
+        now = time.monotonic()
+        entry = entries.get(cache_key)
+        if entry is not None and not is_pk and entry[0] > now:
+            # Lookups by other fields point to the pk entry.
+            entry = entries.get(self.__get_lookup_cache_key(**{self.model._meta.pk.name: entry[1]}))
+        if entry is None or entry[0] <= now:
+            return None
+
+        # Build a fresh instance so callers never share (and mutate) one.
+        values = [
+            value if isinstance(value, _IMMUTABLE_FIELD_TYPES) else copy.deepcopy(value)
+            for value in entry[1]
+        ]
+        return self.model.from_db(
+            router.db_for_read(self.model),
+            [f.attname for f in self.model._meta.concrete_fields],
+            values,
+        )
+
+    def __set_in_process_cache(self, instance: M, cache_key: str | None = None) -> None:
+        """
+        Stores a compact copy of the instance, plus a pointer from ``cache_key``
+        if it was looked up by something other than its primary key.
+        """
+        entries = self._get_process_cache()
+        if entries is None:
+            return
+
+        process_cache.ensure_subscriber()
+        expires_at = time.monotonic() + self.cache_process_ttl
+        pk_cache_key = self.__get_lookup_cache_key(**{self.model._meta.pk.name: instance.pk})
+        entries[pk_cache_key] = (
+            expires_at,
+            tuple(getattr(instance, f.attname) for f in self.model._meta.concrete_fields),
+        )
+        if cache_key is not None and cache_key != pk_cache_key:
+            entries[cache_key] = (expires_at, instance.pk)
+
+    def __get_instance_cache_keys(self, instance: M) -> set[str]:
+        """
+        Returns the lookup cache keys of an instance by its primary key and by
+        every ``cache_fields`` value, both current and as last loaded.
+        """
+        pk_name = instance._meta.pk.name
+        keys = {self.__get_lookup_cache_key(**{pk_name: instance.pk})}
+        previous_values = self.__cache.get(instance, {})
+        for key in self.cache_fields:
+            if key in ("pk", pk_name):
+                continue
+            keys.add(self.__get_lookup_cache_key(**{key: self.__value_for_field(instance, key)}))
+            if key in previous_values:
+                keys.add(self.__get_lookup_cache_key(**{key: previous_values[key]}))
+        return keys
+
+    def __invalidate_process_cache(self, instance: M) -> None:
+        """
+        Drops all process cache keys of an instance, in this process right away
+        and everywhere once the change is committed.
+        """
+        if not self.cache_process_ttl or not process_cache.is_enabled():
+            return
+
+        keys = self.__get_instance_cache_keys(instance)
+
+        label = self.model._meta.label
+        process_cache.invalidate(label, keys)
+        transaction.on_commit(
+            lambda: process_cache.broadcast_invalidation(label, sorted(keys)),
+            using=router.db_for_write(self.model),
+        )
+
+    def __invalidate_on_commit(self, instance: M) -> None:
+        """
+        Drops all cache keys of an instance once the current transaction commits.
+        """
+        if not self.cache_invalidate_on_commit:
+            return
+
+        keys = self.__get_instance_cache_keys(instance)
+
+        def invalidate() -> None:
+            for key in keys:
+                cache.delete(key, version=self.cache_version)
+
+        transaction.on_commit(invalidate, using=router.db_for_write(self.model))
+
     def __value_for_field(self, instance: M, key: str) -> Any:
         """
         Return the cacheable value for a field.
@@ -279,6 +423,13 @@ class BaseManager(_base_manager_base[M]):
         super().contribute_to_class(model, name)
         class_prepared.connect(self.__class_prepared, sender=model)
 
+    def _record_cache_lookup(self, key: str, result: str) -> None:
+        if self.cache_metrics:
+            metrics.incr(
+                "modelcache.lookup",
+                tags={"model": self.model.__name__, "key": key, "result": result},
+            )
+
     @django_test_transaction_water_mark()
     def get_from_cache(
         self, use_replica: bool = settings.SENTRY_MODEL_CACHE_USE_REPLICA, **kwargs: Any
@@ -314,9 +465,16 @@ class BaseManager(_base_manager_base[M]):
             return self.using_replica().get(**kwargs) if use_replica else self.get(**kwargs)
 
         if local_cache is not None and cache_key in local_cache:
+            self._record_cache_lookup(key, "local")
             return validate_result(local_cache[cache_key])
 
+        process_result = self.__get_from_process_cache(cache_key, is_pk=key == pk_name)
+        if process_result is not None:
+            self._record_cache_lookup(key, "process")
+            return validate_result(process_result)
+
         retval = cache.get(cache_key, version=self.cache_version)
+        self._record_cache_lookup(key, "miss" if retval is None else "hit")
         # If we don't have a hit in the django level cache, collect
         # the result, and store it both in django and local caches.
         if retval is None:
@@ -326,6 +484,7 @@ class BaseManager(_base_manager_base[M]):
             self.__post_save(instance=result)
             if local_cache is not None:
                 local_cache[cache_key] = result
+            self.__set_in_process_cache(result, cache_key)
             return validate_result(result)
 
         # If we didn't look up by pk we need to hit the reffed
@@ -334,9 +493,11 @@ class BaseManager(_base_manager_base[M]):
             result = self.get_from_cache(**{pk_name: retval})
             if local_cache is not None:
                 local_cache[cache_key] = result
+            self.__set_in_process_cache(result, cache_key)
             return validate_result(result)
 
         retval = validate_result(retval)
+        self.__set_in_process_cache(retval)
 
         kwargs = {**kwargs, "replica": True} if use_replica else {**kwargs}
         retval._state.db = router.db_for_read(self.model, **kwargs)
@@ -395,6 +556,8 @@ class BaseManager(_base_manager_base[M]):
         for value in values:
             cache_key = self.__get_lookup_cache_key(**{key: value})
             result = local_cache and local_cache.get(cache_key)
+            if result is None:
+                result = self.__get_from_process_cache(cache_key, is_pk=key == pk_name)
             if result is not None:
                 final_results.append(result)
             else:
@@ -441,16 +604,18 @@ class BaseManager(_base_manager_base[M]):
                 db_lookup_values.append(value)
                 continue
 
+            self.__set_in_process_cache(cache_result)
             final_results.append(cache_result)
 
         if nested_lookup_values:
             nested_results = self.get_many_from_cache(nested_lookup_values, key=pk_name)
             final_results.extend(nested_results)
-            if local_cache is not None:
-                for nested_result in nested_results:
-                    value = getattr(nested_result, key)
-                    cache_key = self.__get_lookup_cache_key(**{key: value})
+            for nested_result in nested_results:
+                value = getattr(nested_result, key)
+                cache_key = self.__get_lookup_cache_key(**{key: value})
+                if local_cache is not None:
                     local_cache[cache_key] = nested_result
+                self.__set_in_process_cache(nested_result, cache_key)
 
         if not db_lookup_values:
             return final_results
@@ -467,6 +632,7 @@ class BaseManager(_base_manager_base[M]):
             cache_writes.append(db_result)
             if local_cache is not None:
                 local_cache[cache_key] = db_result
+            self.__set_in_process_cache(db_result, cache_key)
 
             final_results.append(db_result)
 
@@ -483,6 +649,8 @@ class BaseManager(_base_manager_base[M]):
         pk_name = self.model._meta.pk.name
         cache_key = self.__get_lookup_cache_key(**{pk_name: instance_id})
         cache.delete(cache_key, version=self.cache_version)
+        if self.cache_process_ttl and process_cache.is_enabled():
+            process_cache.broadcast_invalidation(self.model._meta.label, [cache_key])
 
     def post_save(self, *, instance: M, created: bool, **kwargs: object) -> None:  # type: ignore[misc]  # python/mypy#6178
         """
@@ -0,0 +1,129 @@
+"""
+Process-wide tier for ``BaseManager.get_from_cache``.
+
+Models opt in with ``cache_process_ttl``. Their cached rows are kept as plain
+tuples of field values in a bounded per-model LRU, and every lookup builds a
+fresh instance from them, so instances are never shared between threads.
+
+Entries expire after the TTL. Saves and deletes drop them right away in the
+current process and, once the transaction commits, broadcast the dropped keys
+to all other processes over Redis pub/sub if
+``SENTRY_MODEL_PROCESS_CACHE_INVALIDATION_CLUSTER`` is configured.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from django.conf import settings
+
+from sentry.utils import json, metrics
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "modelcache:invalidate"
+
+#: The process caches of all models that opted in, by model label.
+_process_caches: dict[str, ThreadSafeCache[str, tuple[float, Any]]] = {}
+
+_subscriber_lock = threading.Lock()
+_subscriber_pid: int | None = None
+
+
+def is_enabled() -> bool:
+    return settings.SENTRY_MODEL_PROCESS_CACHE_ENABLED
+
+
+def get_process_cache(label: str, maxlen: int) -> ThreadSafeCache[str, tuple[float, Any]]:
+    try:
+        return _process_caches[label]
+    except KeyError:
+        return _process_caches.setdefault(label, ThreadSafeCache(LRUCache(maxlen)))
+
+
+def flush_manager_process_cache() -> None:
+    for process_cache in _process_caches.values():
+        for key in list(process_cache.keys()):
+            process_cache.pop(key)
+
+
+def invalidate(label: str, keys: Iterable[str]) -> None:
+    process_cache = _process_caches.get(label)
+    if process_cache is None:
+        return
+    for key in keys:
+        process_cache.pop(key)
+
+
+def broadcast_invalidation(label: str, keys: list[str]) -> None:
+    """
+    Drops the keys in this process and publishes them to all other processes.
+    """
+    invalidate(label, keys)
+
+    cluster_key = settings.SENTRY_MODEL_PROCESS_CACHE_INVALIDATION_CLUSTER
+    if cluster_key is None:
+        return
+
+    from sentry.utils import redis
+
+    try:
+        redis.redis_clusters.get(cluster_key).publish(
+            INVALIDATION_CHANNEL, json.dumps([label, keys])
+        )
+    except Exception:
+        # Other processes pick the change up once their entries expire.
+        logger.exception("modelcache.process.broadcast_failed", extra={"label": label})
+
+
+def ensure_subscriber() -> None:
+    """
+    Starts the thread receiving invalidations from other processes, once per
+    process (the thread does not survive a fork).
+    """
+    global _subscriber_pid
+
+    cluster_key = settings.SENTRY_MODEL_PROCESS_CACHE_INVALIDATION_CLUSTER
+    if cluster_key is None or _subscriber_pid == os.getpid():
+        return
+
+    with _subscriber_lock:
+        if _subscriber_pid == os.getpid():
+            return
+        _subscriber_pid = os.getpid()
+        threading.Thread(
+            target=_listen,
+            args=(cluster_key,),
+            name="modelcache-invalidation",
+            daemon=True,
+        ).start()
+
+
+def handle_invalidation_message(data: bytes | str) -> None:
+    label, keys = json.loads(data)
+    invalidate(label, keys)
+
+
+def _listen(cluster_key: str) -> None:
+    from sentry.utils import redis
+
+    while True:
+        try:
+            pubsub = redis.redis_clusters.get(cluster_key).pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            # Invalidations published while we were not subscribed are lost,
+            # so start over with empty caches.
+            flush_manager_process_cache()
+            for message in pubsub.listen():
+                if message["type"] == "message":
+                    handle_invalidation_message(message["data"])
+        except Exception:
+            logger.exception("modelcache.process.subscriber_failed")
+            metrics.incr("modelcache.process.subscriber_failed")
+            time.sleep(1)
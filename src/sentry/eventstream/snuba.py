@@ -19,7 +19,7 @@ from sentry.eventstream.item_helpers import serialize_event_data_as_item
 from sentry.eventstream.types import EventStreamEventType
 from sentry.models.project import Project
 from sentry.options.rollout import in_rollout_group
-from sentry.services.eventstore.models import GroupEvent
+from sentry.services.eventstore.models import EVENTSTREAM_PRUNED_KEYS, GroupEvent
 from sentry.utils import json, metrics, snuba
 from sentry.utils.eap import EAP_ITEMS_INSERT_ENDPOINT, item_id_to_hex
 from sentry.utils.safe import get_path
@@ -176,6 +176,13 @@ class SnubaProtocolEventStream(EventStream):
             # transactions processing has a configurable 'skipped contexts' to skip writing specific contexts maps
             # to the row. for now, we're ignoring that until we have a need for it
 
+        stream_data: Any = event_data
+        # Reuse the payload as it was encoded for nodestore if it has not
+        # changed since, instead of encoding it once more.
+        encoded = getattr(event.data, "encoded", None)
+        if encoded is not None and event_type != EventStreamEventType.Generic:
+            stream_data = encoded.to_raw_json(exclude=EVENTSTREAM_PRUNED_KEYS)
+
         self._send(
             project.id,
             "insert",
@@ -196,7 +203,7 @@ class SnubaProtocolEventStream(EventStream):
                     "message": event.search_message,
                     "platform": event.platform,
                     "datetime": json.datetime_to_str(event.datetime),
-                    "data": event_data,
+                    "data": stream_data,
                     "primary_hash": primary_hash,
                     "retention_days": retention_days,
                     "occurrence_id": occurrence_data.get("id"),
@@ -16,10 +16,13 @@ from sentry_ophio.enhancers import Cache as RustCache
 from sentry_ophio.enhancers import Component as RustFrame
 from sentry_ophio.enhancers import Enhancements as RustEnhancements
 
+from sentry import options
 from sentry.grouping.component import FrameGroupingComponent, StacktraceGroupingComponent
 from sentry.models.project import Project
 from sentry.stacktraces.functions import set_in_app
 from sentry.utils import metrics
+from sentry.utils.hashlib import md5_text
+from sentry.utils.local_cache import LRUCache, SizedKeyCache, ThreadSafeCache
 from sentry.utils.safe import get_path, set_path
 from sentry.utils.tracing import trace
 
@@ -32,6 +35,13 @@ from .rules import EnhancementRule
 # So this leaves quite a bit of headroom for custom enhancement rules as well.
 RUST_CACHE = RustCache(1_000)
 
+# Category and `in_app` results of the classifier rules for recently seen stacktraces, keyed by a
+# hash of the rules and of everything the rules can match on. Identical stacktraces repeat a lot
+# within a project, so this skips building match frames and running the rules for most of them.
+FRAME_RESULTS_CACHE: SizedKeyCache[tuple[tuple[str | None, bool | None], ...]] = SizedKeyCache(
+    ThreadSafeCache(LRUCache(maxlen=10_000))
+)
+
 # TODO: Version 2 can be removed once all events with that config have expired, 90 days after this
 # comment is merged
 VERSIONS = [2, 3]
@@ -122,12 +132,10 @@ def _get_rust_enhancements(
 RustExceptionData = dict[str, bytes | None]
 
 
-def _make_rust_exception_data(
-    exception_data: dict[str, Any] | None,
-) -> RustExceptionData:
+def _get_exception_fields(exception_data: dict[str, Any] | None) -> dict[str, Any]:
     exception_data = exception_data or {}
     mechanism = exception_data.get("mechanism")
-    rust_data = {
+    return {
         "type": exception_data.get("type"),
         "value": exception_data.get("value"),
         "mechanism": (
@@ -137,6 +145,12 @@ def _make_rust_exception_data(
         ),
     }
 
+
+def _make_rust_exception_data(
+    exception_data: dict[str, Any] | None,
+) -> RustExceptionData:
+    rust_data = _get_exception_fields(exception_data)
+
     # Convert string values to bytes
     for key, value in rust_data.items():
         if isinstance(value, str):
@@ -149,6 +163,40 @@ def _make_rust_exception_data(
     )
 
 
+def _get_frame_results_key(
+    rules_hash: str,
+    frames: Sequence[dict[str, Any]],
+    platform: str,
+    exception_data: dict[str, Any],
+) -> str:
+    """
+    Build a key from everything `create_match_frame` and `_make_rust_exception_data` read, so that
+    stacktraces sharing a key are matched the same way by the same rules.
+    """
+    frame_values = []
+    for frame in frames:
+        frame_metadata = frame.get("data")
+        if not isinstance(frame_metadata, Mapping):
+            frame_metadata = {}
+        frame_values.append(
+            (
+                frame.get("function"),
+                frame.get("raw_function"),
+                frame.get("platform"),
+                frame.get("module"),
+                frame.get("package"),
+                frame.get("abs_path"),
+                frame.get("filename"),
+                frame.get("in_app"),
+                frame_metadata.get("category"),
+                frame_metadata.get("orig_in_app"),
+            )
+        )
+
+    exception_fields = _get_exception_fields(exception_data)
+    return repr((rules_hash, platform, tuple(exception_fields.values()), frame_values))
+
+
 def _can_use_hint(
     variant_name: str,
     frame_component: FrameGroupingComponent,
@@ -436,18 +484,35 @@ class EnhancementsConfig:
         also be persisted in the saved event, so they can be used in the UI and when determining
         things like suspect commits and suggested assignees.
         """
-        # TODO: Fix this type to list[MatchFrame] once it's fixed in ophio
-        match_frames: list[Any] = [create_match_frame(frame, platform) for frame in frames]
-        rust_exception_data = _make_rust_exception_data(exception_data)
-
-        with metrics.timer("grouping.enhancements.get_in_app") as metrics_timer_tags:
-            metrics_timer_tags["split"] = True
-            category_and_in_app_results = (
-                self.classifier_rust_enhancements.apply_modifications_to_frames(
-                    match_frames, rust_exception_data
-                )
+        cache_key = None
+        category_and_in_app_results = None
+        if options.get("grouping.enhancements.frame_results_cache"):
+            cache_key = _get_frame_results_key(self.rules_hash, frames, platform, exception_data)
+            category_and_in_app_results = FRAME_RESULTS_CACHE.get(cache_key)
+            metrics.incr(
+                "grouping.enhancements.frame_results_cache",
+                tags={
+                    "result": "miss" if category_and_in_app_results is None else "hit",
+                    "platform": platform,
+                },
             )
 
+        if category_and_in_app_results is None:
+            # TODO: Fix this type to list[MatchFrame] once it's fixed in ophio
+            match_frames: list[Any] = [create_match_frame(frame, platform) for frame in frames]
+            rust_exception_data = _make_rust_exception_data(exception_data)
+
+            with metrics.timer("grouping.enhancements.get_in_app") as metrics_timer_tags:
+                metrics_timer_tags["split"] = True
+                category_and_in_app_results = tuple(
+                    self.classifier_rust_enhancements.apply_modifications_to_frames(
+                        match_frames, rust_exception_data
+                    )
+                )
+
+            if cache_key is not None:
+                FRAME_RESULTS_CACHE[cache_key] = category_and_in_app_results
+
         for frame, (category, in_app) in zip(frames, category_and_in_app_results):
             if in_app is not None:
                 # If the `in_app` value changes as a result of this call, the original value (in
@@ -570,6 +635,11 @@ class EnhancementsConfig:
         base64_str = base64_bytes.decode("ascii")
         return base64_str
 
+    @cached_property
+    def rules_hash(self) -> str:
+        """A hash identifying the rules of the enhancements object"""
+        return md5_text(self.base64_string).hexdigest()
+
     @classmethod
     def _get_config_from_base64_bytes(cls, bytes_str: bytes) -> EnhancementsConfigData:
         padded_bytes = bytes_str + b"=" * (4 - (len(bytes_str) % 4))
@@ -631,12 +701,16 @@ class EnhancementsConfig:
 
             metrics_timer_tags.update({"split": version == 3})
 
-            return cls(
+            enhancements = cls(
                 rules=unsplit_config.rules,
                 split_enhancement_configs=split_configs,
                 version=version,
                 bases=bases,
             )
+            # The string we loaded from identifies the rules just as well, and is much cheaper to
+            # hash than `base64_string` is to rebuild.
+            enhancements.rules_hash = md5_text(raw_bytes_str).hexdigest()
+            return enhancements
 
     @classmethod
     @trace
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, ClassVar, Self
 
 from django.db import models
 from django.utils import timezone
@@ -7,6 +7,7 @@ from django.utils.encoding import force_str
 from sentry.backup.scopes import RelocationScope
 from sentry.db.models import FlexibleForeignKey, Model, cell_silo_model, sane_repr
 from sentry.db.models.fields.hybrid_cloud_foreign_key import HybridCloudForeignKey
+from sentry.db.models.manager.base import BaseManager
 from sentry.models.apiscopes import HasApiScopes
 
 
@@ -28,6 +29,18 @@ class ApiTokenReplica(Model, HasApiScopes):
         "sentry.Organization", null=True, on_delete="CASCADE"
     )
 
+    # Token authentication looks replicas up by hash on every API request. Replica
+    # updates and deletions (including revocations replicated through outboxes)
+    # invalidate the cached entries, again once they commit; the short TTLs bound
+    # staleness otherwise.
+    objects: ClassVar[BaseManager[Self]] = BaseManager(
+        cache_fields=("hashed_token",),
+        cache_ttl=60,
+        cache_metrics=True,
+        cache_process_ttl=10,
+        cache_invalidate_on_commit=True,
+    )
+
     class Meta:
         app_label = "hybridcloud"
         db_table = "hybridcloud_apitokenreplica"
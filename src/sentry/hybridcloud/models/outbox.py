@@ -97,20 +97,26 @@ class OutboxBase(Model):
                 return cursor.fetchone()[0]
 
     @classmethod
-    def find_scheduled_shards(cls, low: int = 0, hi: int | None = None) -> list[Mapping[str, Any]]:
+    def find_scheduled_shards(
+        cls, low: int = 0, hi: int | None = None, with_depth: bool = False
+    ) -> list[Mapping[str, Any]]:
+        """
+        :param with_depth: Also return the number of scheduled messages of each shard within
+        the id range, under the `depth` key.
+        """
         q = cls.objects.values(*cls.sharding_columns).filter(
             scheduled_for__lte=timezone.now(), id__gte=low
         )
         if hi is not None:
             q = q.filter(id__lt=hi)
 
-        return list(
-            {k: row[k] for k in cls.sharding_columns}
-            for row in q.annotate(
-                scheduled_for=Min("scheduled_for"),
-                max_id=Max("id"),
-            ).order_by("scheduled_for", "max_id")
-        )
+        q = q.annotate(scheduled_for=Min("scheduled_for"), max_id=Max("id"))
+        columns = list(cls.sharding_columns)
+        if with_depth:
+            q = q.annotate(depth=Count("id"))
+            columns.append("depth")
+
+        return list({k: row[k] for k in columns} for row in q.order_by("scheduled_for", "max_id"))
 
     @classmethod
     def prepare_next_from_shard(cls, row: Mapping[str, Any]) -> Self | None:
@@ -4,6 +4,7 @@ from typing import TypeVar
 from django.core.cache import cache
 from django.core.cache.backends.base import DEFAULT_TIMEOUT
 
+from sentry import options
 from sentry.hybridcloud.models.cacheversion import (
     CacheVersionBase,
     CellCacheVersion,
@@ -11,12 +12,29 @@ from sentry.hybridcloud.models.cacheversion import (
 )
 from sentry.hybridcloud.rpc.caching.service import CellCachingService, ControlCachingService
 from sentry.silo.base import SiloMode
+from sentry.utils import metrics
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
 
 _V = TypeVar("_V")
 
 # Implementation uses generators so that testing concurrent read after writer properties is much easier.
 # In practice all generators are synchronously consumed, except for tests.
 
+# Process-local tier in front of the shared cache, keyed by versioned key. Entries are
+# never stale: a value stored for a version stays valid until the version is bumped,
+# at which point lookups use the new versioned key and the old entry ages out.
+_LOCAL_CACHE_MAX_SIZE = 10_000
+_local_cache: ThreadSafeCache[str, str] = ThreadSafeCache(LRUCache(_LOCAL_CACHE_MAX_SIZE))
+
+
+def _local_cache_enabled() -> bool:
+    return options.get("hybridcloud.caching.local-tier.enabled")
+
+
+def clear_local_cache() -> None:
+    for versioned_key in list(_local_cache.keys()):
+        _local_cache.pop(versioned_key)
+
 
 def _consume_generator(g: Generator[None, None, _V]) -> _V:
     while True:
@@ -31,7 +49,10 @@ def _set_cache(
 ) -> Generator[None, None, bool]:
     if timeout is None:
         timeout = DEFAULT_TIMEOUT
-    result = cache.add(_versioned_key(key, version), value, timeout=timeout)
+    versioned_key = _versioned_key(key, version)
+    result = cache.add(versioned_key, value, timeout=timeout)
+    if result and value is not None and _local_cache_enabled():
+        _local_cache[versioned_key] = value
     yield
     return result
 
@@ -50,6 +71,9 @@ def _version_model(mode: SiloMode) -> type[CacheVersionBase]:
 
 def _delete_cache(key: str, mode: SiloMode) -> Generator[None, None, int]:
     version = _version_model(mode).incr_version(key)
+    # Other processes observe the new version on their next read; evict the
+    # superseded entry here right away rather than waiting for it to age out.
+    _local_cache.pop(_versioned_key(key, version - 1))
     yield
     return version
 
@@ -59,7 +83,22 @@ def _get_cache(keys: list[str], mode: SiloMode) -> Generator[None, None, Mapping
     yield
 
     versioned_keys = [_versioned_key(key, versions.get(key, 0)) for key in keys]
-    existing = cache.get_many(versioned_keys)
+    existing: dict[str, str] = {}
+    if _local_cache_enabled():
+        for versioned_key in versioned_keys:
+            if (local_value := _local_cache.get(versioned_key)) is not None:
+                existing[versioned_key] = local_value
+        metrics.incr("hybridcloud.caching.local.hit", len(existing))
+        metrics.incr("hybridcloud.caching.local.miss", len(versioned_keys) - len(existing))
+        remote_keys = [k for k in versioned_keys if k not in existing]
+        if remote_keys:
+            remote = cache.get_many(remote_keys)
+            for versioned_key, value in remote.items():
+                if isinstance(value, str):
+                    _local_cache[versioned_key] = value
+            existing.update(remote)
+    else:
+        existing = cache.get_many(versioned_keys)
     yield
     result: dict[str, str | int] = {}
     for k, versioned_key in zip(keys, versioned_keys):
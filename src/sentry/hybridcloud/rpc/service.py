@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import contextvars
 import hashlib
 import hmac
 import importlib
@@ -485,6 +486,34 @@ def dispatch_to_local_service(
 _RPC_CONTENT_CHARSET = "utf-8"
 
 
+_memoized_rpc_responses: contextvars.ContextVar[
+    dict[tuple[str | None, str, str, str], Any] | None
+] = contextvars.ContextVar("memoized_rpc_responses", default=None)
+
+
+@contextmanager
+def rpc_memoization_scope() -> Generator[None]:
+    """
+    Memoise the responses of remote RPC calls made within this scope.
+
+    Identical calls (same destination, method and arguments) made while the
+    scope is open are answered from the first response rather than sending
+    another request to the remote silo. Only methods listed in the
+    `hybrid_cloud.rpc.memoized-service-methods` option are memoised, as the
+    method must be free of side effects for this to be safe. Nested scopes
+    share the responses of the outermost scope.
+    """
+    if _memoized_rpc_responses.get() is not None:
+        yield
+        return
+
+    token = _memoized_rpc_responses.set({})
+    try:
+        yield
+    finally:
+        _memoized_rpc_responses.reset(token)
+
+
 def dispatch_remote_call(
     cell: Cell | None,
     service_name: str,
@@ -563,7 +592,7 @@ class _RemoteSiloCall:
         )
 
     def dispatch(self, use_test_client: bool = False) -> Any:
-        serial_response = self._send_to_remote_silo(use_test_client)
+        serial_response = self._send_to_remote_silo_memoized(use_test_client)
 
         return_value = serial_response["value"]
         service, _ = _look_up_service_method(self.service_name, self.method_name)
@@ -609,6 +638,33 @@ class _RemoteSiloCall:
 
         return settings.RPC_TIMEOUT
 
+    def _is_memoized(self) -> bool:
+        if memoized_service_methods := options.get("hybrid_cloud.rpc.memoized-service-methods"):
+            return f"{self.service_name}.{self.method_name}" in memoized_service_methods
+        return False
+
+    def _send_to_remote_silo_memoized(self, use_test_client: bool) -> Any:
+        memoized_responses = _memoized_rpc_responses.get()
+        if memoized_responses is None or not self._is_memoized():
+            return self._send_to_remote_silo(use_test_client)
+
+        key = (
+            self.cell.name if self.cell else None,
+            self.service_name,
+            self.method_name,
+            json.dumps(self.serial_arguments, sort_keys=True),
+        )
+        # Serial responses are stored rather than deserialized values, so that
+        # every caller receives its own copy of the RPC models.
+        if key in memoized_responses:
+            metrics.incr("hybrid_cloud.dispatch_rpc.memoized", tags=self._metrics_tags(hit=1))
+            return memoized_responses[key]
+
+        metrics.incr("hybrid_cloud.dispatch_rpc.memoized", tags=self._metrics_tags(hit=0))
+        serial_response = self._send_to_remote_silo(use_test_client)
+        memoized_responses[key] = serial_response
+        return serial_response
+
     def _send_to_remote_silo(self, use_test_client: bool) -> Any:
         vc = get_viewer_context()
         meta: dict[str, Any] = {}
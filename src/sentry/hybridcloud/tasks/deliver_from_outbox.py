@@ -1,25 +1,31 @@
 from __future__ import annotations
 
 import math
+import queue
+import threading
 from collections.abc import Mapping
 from typing import Any
 
 import sentry_sdk
 from django.conf import settings
+from django.db import connections
 from django.db.models import Max, Min
 from taskbroker_client.task import Task
 
+from sentry import options
 from sentry.hybridcloud.models.outbox import (
     CellOutboxBase,
     ControlOutboxBase,
     OutboxBase,
     OutboxFlushError,
 )
+from sentry.hybridcloud.outbox.category import OutboxScope
 from sentry.hybridcloud.tasks.backfill_outboxes import backfill_outboxes_for
 from sentry.silo.base import SiloMode
 from sentry.tasks.base import instrumented_task
 from sentry.taskworker.namespaces import hybridcloud_control_tasks, hybridcloud_tasks
 from sentry.utils import metrics
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.env import in_test_environment
 
 
@@ -198,33 +204,123 @@ def drain_outbox_shards_control(
 def process_outbox_batch(
     outbox_identifier_hi: int, outbox_identifier_low: int, outbox_model: type[OutboxBase]
 ) -> int:
-    processed_count: int = 0
-    for shard_attributes in outbox_model.find_scheduled_shards(
-        outbox_identifier_low, outbox_identifier_hi
-    ):
-        shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
-        if not shard_outbox:
-            continue
+    drain_workers = options.get("hybridcloud.outbox.drain_workers")
+    shards = outbox_model.find_scheduled_shards(
+        outbox_identifier_low, outbox_identifier_hi, with_depth=drain_workers > 1
+    )
+    metrics_tags = {"outbox_name": outbox_model._meta.label, "concurrent": int(drain_workers > 1)}
 
-        try:
-            processed_count += 1
-            shard_outbox.drain_shard(flush_all=True)
-        except Exception as e:
-            with sentry_sdk.isolation_scope() as scope:
-                if isinstance(e, OutboxFlushError):
-                    scope.set_tag("outbox.category", e.outbox.category)
-                    scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
-                    scope.set_context(
-                        "outbox",
-                        {
-                            "shard_identifier": e.outbox.shard_identifier,
-                            "object_identifier": e.outbox.object_identifier,
-                            "payload": e.outbox.payload,
-                        },
-                    )
-                sentry_sdk.capture_exception(e)
-                # In production, it's ok to just continue processing forward, but in tests we aim to surface
-                # problems aggressively.
-                if in_test_environment():
-                    raise
+    with metrics.timer("deliver_from_outbox.process_batch.duration", tags=metrics_tags):
+        if drain_workers > 1:
+            processed_count = _drain_shards_concurrently(outbox_model, shards, drain_workers)
+        else:
+            processed_count = sum(
+                _drain_next_from_shard(outbox_model, shard_attributes)
+                for shard_attributes in shards
+            )
+
+    metrics.incr("deliver_from_outbox.shards_scheduled", len(shards), tags=metrics_tags)
+    metrics.incr("deliver_from_outbox.shards_drained", processed_count, tags=metrics_tags)
     return processed_count
+
+
+def _drain_shards_concurrently(
+    outbox_model: type[OutboxBase], shards: list[Mapping[str, Any]], drain_workers: int
+) -> int:
+    """
+    Drain independent shards in a pool of worker threads.
+
+    Shards are claimed one at a time through `prepare_next_from_shard`, so concurrent
+    drains of the same shard (from this pool or other tasks) skip rather than contend.
+    The deepest shards of the batch are started first so that long drains do not end up
+    running alone at the tail of the batch, and the number of shards drained concurrently
+    per shard scope can be capped with `hybridcloud.outbox.drain_scope_concurrency`.
+    Shards of a scope at its cap are deferred to the workers draining that scope, so
+    that the other workers move on to shards of other scopes instead of waiting.
+    """
+    # `sorted` is stable, so shards of the same depth keep their scheduling order.
+    pending: queue.SimpleQueue[Mapping[str, Any]] = queue.SimpleQueue()
+    for shard in sorted(shards, key=lambda shard: -shard["depth"]):
+        pending.put({column: shard[column] for column in outbox_model.sharding_columns})
+
+    scope_semaphores = {
+        OutboxScope[scope_name].value: threading.BoundedSemaphore(max(int(cap), 1))
+        for scope_name, cap in options.get("hybridcloud.outbox.drain_scope_concurrency").items()
+        if scope_name in OutboxScope.__members__
+    }
+    deferred: dict[int, queue.SimpleQueue[Mapping[str, Any]]] = {
+        scope: queue.SimpleQueue() for scope in scope_semaphores
+    }
+
+    def drain_deferred(scope: int) -> int:
+        # Drain the deferred shards of a scope for as long as one of its slots is free.
+        # A shard is always deferred before its worker tries to take a slot, and a slot
+        # is only given up after checking for deferred shards, so none are left behind.
+        drained = 0
+        semaphore = scope_semaphores[scope]
+        while semaphore.acquire(blocking=False):
+            try:
+                shard_attributes = deferred[scope].get_nowait()
+            except queue.Empty:
+                semaphore.release()
+                if deferred[scope].empty():
+                    return drained
+                continue
+            try:
+                drained += _drain_next_from_shard(outbox_model, shard_attributes)
+            finally:
+                semaphore.release()
+        return drained
+
+    def drain_worker() -> int:
+        drained = 0
+        try:
+            while True:
+                try:
+                    shard_attributes = pending.get_nowait()
+                except queue.Empty:
+                    return drained
+
+                scope = shard_attributes["shard_scope"]
+                if scope in deferred:
+                    deferred[scope].put(shard_attributes)
+                    drained += drain_deferred(scope)
+                else:
+                    drained += _drain_next_from_shard(outbox_model, shard_attributes)
+        finally:
+            # Worker threads open their own database connections.
+            connections.close_all()
+
+    with ContextPropagatingThreadPoolExecutor(max_workers=drain_workers) as executor:
+        futures = [executor.submit(drain_worker) for _ in range(min(drain_workers, len(shards)))]
+        return sum(future.result() for future in futures)
+
+
+def _drain_next_from_shard(
+    outbox_model: type[OutboxBase], shard_attributes: Mapping[str, Any]
+) -> bool:
+    shard_outbox: OutboxBase | None = outbox_model.prepare_next_from_shard(shard_attributes)
+    if not shard_outbox:
+        return False
+
+    try:
+        shard_outbox.drain_shard(flush_all=True)
+    except Exception as e:
+        with sentry_sdk.isolation_scope() as scope:
+            if isinstance(e, OutboxFlushError):
+                scope.set_tag("outbox.category", e.outbox.category)
+                scope.set_tag("outbox.shard_scope", e.outbox.shard_scope)
+                scope.set_context(
+                    "outbox",
+                    {
+                        "shard_identifier": e.outbox.shard_identifier,
+                        "object_identifier": e.outbox.object_identifier,
+                        "payload": e.outbox.payload,
+                    },
+                )
+            sentry_sdk.capture_exception(e)
+            # In production, it's ok to just continue processing forward, but in tests we aim to surface
+            # problems aggressively.
+            if in_test_environment():
+                raise
+    return True
@@ -8,11 +8,13 @@ from typing import Literal, TypedDict, TypeVar
 from django.conf import settings
 from sentry_redis_tools.retrying_cluster import RetryingRedisCluster
 
-from sentry import features
+from sentry import features, options
 from sentry.constants import ObjectStatus
 from sentry.incidents.models.alert_rule import AlertRuleDetectionType
 from sentry.incidents.utils.process_update_helpers import (
+    get_aggregation_value_helper,
     get_comparison_aggregation_value,
+    get_comparison_percentage,
     get_crash_rate_alert_metrics_aggregation_value_helper,
 )
 from sentry.incidents.utils.subscription_limits import is_metric_subscription_allowed
@@ -28,6 +30,7 @@ from sentry.snuba.dataset import Dataset
 from sentry.snuba.models import QuerySubscription
 from sentry.utils import metrics, redis
 from sentry.utils.dates import to_datetime
+from sentry.utils.hashlib import md5_text
 from sentry.utils.memory import track_memory_usage
 from sentry.workflow_engine.models import DataPacket, Detector
 from sentry.workflow_engine.processors import DetectorEvaluation
@@ -153,6 +156,10 @@ class SubscriptionProcessor:
             aggregation_value = self.get_crash_rate_alert_metrics_aggregation_value(
                 subscription_update
             )
+        elif comparison_delta is not None and self.uses_aggregate_history(comparison_delta):
+            aggregation_value = self.get_comparison_aggregation_value_from_history(
+                subscription_update, comparison_delta
+            )
         else:
             aggregation_value = get_comparison_aggregation_value(
                 subscription_update=subscription_update,
@@ -165,6 +172,43 @@ class SubscriptionProcessor:
 
         return aggregation_value
 
+    def uses_aggregate_history(self, comparison_delta: int) -> bool:
+        return options.get(
+            "incidents.subscription_processor.aggregate_history.enabled"
+        ) and comparison_delta <= options.get(
+            "incidents.subscription_processor.aggregate_history.max_comparison_delta"
+        )
+
+    def get_comparison_aggregation_value_from_history(
+        self, subscription_update: QuerySubscriptionUpdate, comparison_delta: int
+    ) -> float | None:
+        """
+        Answers a comparison alert from the aggregates of earlier updates of the subscription,
+        which cover the comparison period whenever `comparison_delta` is a multiple of the
+        subscription's resolution. Falls back to querying Snuba when that update is missing.
+        """
+        aggregation_value = get_aggregation_value_helper(subscription_update)
+        timestamp = subscription_update["timestamp"]
+        comparison_timestamp = timestamp - timedelta(seconds=comparison_delta)
+
+        comparison_aggregate = get_stored_aggregate(self.subscription, comparison_timestamp)
+        if comparison_aggregate is not None:
+            metrics.incr("incidents.alert_rules.aggregate_history", tags={"result": "hit"})
+            comparison_value = get_comparison_percentage(aggregation_value, comparison_aggregate)
+        else:
+            metrics.incr("incidents.alert_rules.aggregate_history", tags={"result": "miss"})
+            comparison_value = get_comparison_aggregation_value(
+                subscription_update=subscription_update,
+                snuba_query=self.subscription.snuba_query,
+                organization_id=self.subscription.project.organization.id,
+                project_ids=[self.subscription.project_id],
+                comparison_delta=comparison_delta,
+                alert_rule_id=None,
+            )
+
+        store_aggregate(self.subscription, timestamp, aggregation_value, comparison_delta)
+        return comparison_value
+
     def get_comparison_delta(self, detector: Detector) -> int | None:
         detector_cfg: MetricIssueDetectorConfig = detector.config
         return detector_cfg.get("comparison_delta")
@@ -295,6 +339,48 @@ def store_detector_last_update(detector: Detector, project_id: int, last_update:
     )
 
 
+def build_aggregate_history_key(subscription: QuerySubscription) -> str:
+    # Changing the query changes the key, so that the history of the old query is never
+    # compared against. The old history expires on its own.
+    snuba_query = subscription.snuba_query
+    query_hash = md5_text(
+        snuba_query.dataset,
+        snuba_query.query,
+        snuba_query.aggregate,
+        snuba_query.time_window,
+        snuba_query.environment_id,
+    ).hexdigest()
+    return f"subscription:{subscription.id}:aggregate_history:{query_hash}"
+
+
+def get_stored_aggregate(subscription: QuerySubscription, timestamp: datetime) -> float | None:
+    score = int(timestamp.timestamp())
+    members = get_redis_client().zrangebyscore(
+        build_aggregate_history_key(subscription), score, score
+    )
+    if not members:
+        return None
+    return float(members[0].split(":", 1)[1])
+
+
+def store_aggregate(
+    subscription: QuerySubscription, timestamp: datetime, value: float, comparison_delta: int
+) -> None:
+    """
+    Adds the aggregate of an update to the history of the subscription, keeping only as much
+    history as comparisons `comparison_delta` apart need.
+    """
+    key = build_aggregate_history_key(subscription)
+    score = int(timestamp.timestamp())
+    retention = comparison_delta + subscription.snuba_query.resolution
+
+    pipeline = get_redis_client().pipeline(transaction=False)
+    pipeline.zadd(key, {f"{score}:{value}": score})
+    pipeline.zremrangebyscore(key, "-inf", f"({score - retention}")
+    pipeline.expire(key, retention)
+    pipeline.execute()
+
+
 def get_redis_client() -> RetryingRedisCluster:
     cluster_key = settings.SENTRY_INCIDENT_RULES_REDIS_CLUSTER
     return redis.redis_clusters.get(cluster_key)  # type: ignore[return-value]
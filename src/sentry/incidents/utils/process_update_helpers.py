@@ -224,6 +224,15 @@ def get_comparison_aggregation_value(
             alert_rule_id,
         )
 
+    return get_comparison_percentage(aggregation_value, comparison_aggregate)
+
+
+def get_comparison_percentage(
+    aggregation_value: float, comparison_aggregate: float | None
+) -> float | None:
+    """
+    Expresses `aggregation_value` as a percentage of the aggregate over the comparison period.
+    """
     if not comparison_aggregate:
         metrics.incr("incidents.alert_rules.skipping_update_comparison_value_invalid")
         return None
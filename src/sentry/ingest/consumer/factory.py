@@ -16,6 +16,7 @@ from arroyo.types import Commit, FilteredPayload, Message, Partition
 
 from sentry.ingest.types import ConsumerType
 from sentry.processing.backpressure.arroyo import HealthChecker, create_backpressure_step
+from sentry.tsdb.redis import flush_write_behind_buffers
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
 
 from .attachment_event import decode_and_process_chunks, process_attachments_and_events
@@ -190,6 +191,7 @@ class IngestStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
         )
 
     def shutdown(self) -> None:
+        flush_write_behind_buffers()
         self._pool.close()
         if self._attachments_pool:
             self._attachments_pool.close()
@@ -255,4 +257,5 @@ class IngestTransactionsStrategyFactory(ProcessingStrategyFactory[KafkaPayload])
         )
 
     def shutdown(self) -> None:
+        flush_write_behind_buffers()
         self._pool.close()
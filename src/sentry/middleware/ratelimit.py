@@ -235,7 +235,13 @@ class RatelimitMiddleware:
                         )
                 rate_limit_key = getattr(request, "rate_limit_key", None)
                 rate_limit_uid = getattr(request, "rate_limit_uid", None)
-                if rate_limit_key is not None and rate_limit_uid is not None:
+                # Requests that were never added to the concurrent limiter
+                # don't need another round-trip to be removed from it.
+                concurrent_checked = (
+                    rate_limit_metadata is None
+                    or rate_limit_metadata.concurrent_requests is not None
+                )
+                if rate_limit_key is not None and rate_limit_uid is not None and concurrent_checked:
                     finish_request(rate_limit_key, rate_limit_uid)
             except Exception:
                 logging.exception("COULD NOT POPULATE RATE LIMIT HEADERS")
@@ -45,7 +45,7 @@ class Environment(Model):
     name = models.CharField(max_length=ENVIRONMENT_NAME_MAX_LENGTH)
     date_added = models.DateTimeField(default=timezone.now)
 
-    objects: ClassVar[BaseManager[Self]] = BaseManager(cache_fields=["pk"])
+    objects: ClassVar[BaseManager[Self]] = BaseManager(cache_fields=["pk"], cache_process_ttl=10)
 
     class Meta:
         app_label = "sentry"
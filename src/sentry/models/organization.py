@@ -210,7 +210,9 @@ class Organization(ReplicatedCellModel):
 
         bitfield_default = 1
 
-    objects: ClassVar[OrganizationManager] = OrganizationManager(cache_fields=("pk", "slug"))
+    objects: ClassVar[OrganizationManager] = OrganizationManager(
+        cache_fields=("pk", "slug"), cache_process_ttl=10
+    )
 
     # Not persisted. Getsentry fills this in in post-save hooks and we use it for synchronizing data across silos.
     customer_id: str | None = None
@@ -364,7 +364,7 @@ class Project(Model):
 
         bitfield_default = 10
 
-    objects: ClassVar[ProjectManager] = ProjectManager(cache_fields=["pk"])
+    objects: ClassVar[ProjectManager] = ProjectManager(cache_fields=["pk"], cache_process_ttl=10)
     platform = models.CharField(max_length=64, null=True)
 
     class Meta:
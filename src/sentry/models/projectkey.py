@@ -120,6 +120,7 @@ class ProjectKey(ReplicatedCellModel):
         # store projectkeys in memcached for longer than other models,
         # specifically to make the relay_projectconfig endpoint faster.
         cache_ttl=60 * 30,
+        cache_process_ttl=10,
     )
 
     data = LegacyTextJSONField(default=dict)
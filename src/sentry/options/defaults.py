@@ -308,6 +308,36 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Number of threads used to load issue stream serializer attributes. The
+# Snuba and Postgres loads are independent and run concurrently when > 1.
+register(
+    "api.group-stream.attr-loader-workers",
+    type=Int,
+    default=1,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Check the fixed window and concurrent API rate limits of a request with a
+# single Lua script instead of one round-trip per limiter.
+register(
+    "api.rate-limit.single-round-trip",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# When > 0, requests for keys without a concurrent limit that were last seen
+# below this fraction of their window limit are admitted locally without asking
+# Redis, until the key would reach that fraction. Such requests are counted in
+# Redis with the key's next round-trip. Only used with
+# "api.rate-limit.single-round-trip".
+register(
+    "api.rate-limit.local-precheck-ratio",
+    type=Float,
+    default=0.0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Beacon
 register("beacon.anonymous", type=Bool, flags=FLAG_REQUIRED)
 register(
@@ -1741,6 +1771,17 @@ for mabq in build_metric_abuse_quotas():
 
 # END ABUSE QUOTAS
 
+# How long (in seconds) `RedisQuota.get_quotas` memoises the quota definitions
+# of a project within a process. Local edits to project keys and project or
+# organization options invalidate the memo immediately; changes made by other
+# processes and global option changes take up to this long to apply. 0 disables.
+register(
+    "quotas.redis.config-cache-ttl",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Send event messages for specific project IDs to random partitions in Kafka
 # contents are a list of project IDs to message types to be randomly assigned
 # e.g. [{"project_id": 2, "message_type": "error"}, {"project_id": 3, "message_type": "transaction"}]
@@ -2493,6 +2534,28 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Keep resolved hybrid cloud cache values in process memory, keyed by cache version
+register(
+    "hybridcloud.caching.local-tier.enabled",
+    default=False,
+    type=Bool,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+# Number of worker threads each outbox drain task uses to drain shards concurrently
+register(
+    "hybridcloud.outbox.drain_workers",
+    default=1,
+    type=Int,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Maximum number of shards per outbox scope (by OutboxScope name) drained concurrently
+register(
+    "hybridcloud.outbox.drain_scope_concurrency",
+    default={},
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Webhook processing controls
 register(
     "hybridcloud.webhookpayload.worker_threads",
@@ -2534,6 +2597,13 @@ register(
     default=[],
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Side-effect free RPC methods (as `service.method`) whose responses are memoised
+# for the duration of a read-only API request.
+register(
+    "hybrid_cloud.rpc.memoized-service-methods",
+    default=[],
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 # == End hybrid cloud subsystem
 
 # Decides whether an incoming transaction triggers an update of the clustering rule applied to it.
@@ -2557,6 +2627,15 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Encodes event payloads once when saving them to nodestore and reuses the
+# encoded payload for the eventstream.
+register(
+    "nodestore.encode-payload-once",
+    default=False,
+    type=Bool,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # === Backpressure related runtime options ===
 
 # Enables monitoring of services for backpressure management.
@@ -2573,6 +2652,27 @@ register("backpressure.checking.interval", default=5, flags=FLAG_AUTOMATOR_MODIF
 # How long a status is persisted, which means that updates to health status can be paused for that long before consumers will assume things are unhealthy
 register("backpressure.status_ttl", default=60, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
+# Enables graded backpressure: the monitor publishes a pressure level per
+# consumer, and consumers throttle proportionally instead of only stopping.
+register("backpressure.graded.enabled", default=False, type=Bool, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# How far below its high watermark a service starts to be throttled. Pressure
+# rises linearly from 0 at `high_watermark - throttle_range` to 1 (stopped) at
+# the high watermark.
+register(
+    "backpressure.graded.throttle-range",
+    default=0.1,
+    type=Float,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# How much the pressure level has to change before a consumer applies it, and
+# how far it has to fall below 1 before a stopped consumer resumes.
+register(
+    "backpressure.graded.hysteresis",
+    default=0.1,
+    type=Float,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # The high-watermark levels per-service which will mark a service as unhealthy.
 # This should mirror the `SENTRY_PROCESSING_SERVICES` setting.
 register(
@@ -2761,6 +2861,21 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Store detector states packed rather than as hashes, and update them in larger batches.
+register(
+    "statistical_detectors.packed_states.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
+register(
+    "statistical_detectors.packed_states.batch_size",
+    type=Int,
+    default=1000,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 register(
     "options_automator_slack_webhook_enabled",
     default=True,
@@ -2814,6 +2929,20 @@ register(
     default=[],
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Answer comparison alerts from the aggregates of earlier subscription updates kept in Redis,
+# instead of a Snuba query per update. Only for comparison deltas up to the max, in seconds.
+register(
+    "incidents.subscription_processor.aggregate_history.enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+register(
+    "incidents.subscription_processor.aggregate_history.max_comparison_delta",
+    type=Int,
+    default=60 * 60 * 24,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # SDK Crash Detection
 #
@@ -3131,6 +3260,15 @@ register(
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Reuse the category and `in_app` results of stacktrace rules for stacktraces already matched
+# against the same rules in this process, rather than matching every frame again.
+register(
+    "grouping.enhancements.frame_results_cache",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 
 # SPAN BUFFER
 # Span buffer killswitch
@@ -3550,6 +3688,36 @@ register(
     default=10000,
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Maximum number of small projects of an organization whose delayed workflows are
+# processed by a single task, sharing their Snuba queries. 0 disables merging.
+register(
+    "workflow_engine.delayed_workflow.projects_per_task",
+    type=Int,
+    default=0,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Maximum number of concurrent Snuba queries of a multi-project delayed workflow task.
+register(
+    "workflow_engine.delayed_workflow.query_concurrency",
+    type=Int,
+    default=4,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Derive the windows of delayed workflow frequency conditions that differ only in their
+# interval or comparison interval from shared bucketed Snuba queries.
+register(
+    "workflow_engine.delayed_workflow.shared_window_queries",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
+# Evaluate DataConditionGroups from process-locally cached, compiled evaluation plans.
+register(
+    "workflow_engine.evaluation_plans_enabled",
+    type=Bool,
+    default=False,
+    flags=FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # Restrict uptime issue creation for specific host provider identifiers. Items
 # in this list map to the `host_provider_id` column in the UptimeSubscription
@@ -7,7 +7,67 @@ from arroyo.processing.strategies import MessageRejected, ProcessingStrategy, Ru
 from arroyo.types import FilteredPayload, Message
 
 from sentry import options
-from sentry.processing.backpressure.health import is_consumer_healthy
+from sentry.processing.backpressure.health import get_consumer_pressure, is_consumer_healthy
+from sentry.utils import metrics
+
+# How long the unthrottled throughput is measured before it is folded into
+# the baseline rate.
+BASELINE_WINDOW = 10.0
+
+
+class Throttle:
+    """
+    A token bucket admitting messages at a fraction of the rate the consumer
+    ran at while it was under no pressure.
+    """
+
+    def __init__(self) -> None:
+        #: Messages per second admitted without pressure, `None` until measured.
+        self.baseline_rate: float | None = None
+        self.window_start: float | None = None
+        self.window_count = 0
+        self.tokens = 0.0
+        self.updated_at = 0.0
+
+    def admit(self, pressure: float, now: float) -> bool:
+        if pressure <= 0.0:
+            self._observe(now)
+            return True
+
+        # Without a baseline there is nothing to be proportional to.
+        if self.baseline_rate is None:
+            return True
+
+        rate = self.baseline_rate * (1.0 - pressure)
+        # Allow bursts of up to a second worth of messages.
+        self.tokens = min(max(rate, 1.0), self.tokens + (now - self.updated_at) * rate)
+        self.updated_at = now
+        # Restart the measurement once the pressure is gone.
+        self.window_start = None
+
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+    def _observe(self, now: float) -> None:
+        self.tokens = 0.0
+        self.updated_at = now
+
+        if self.window_start is None:
+            self.window_start = now
+            self.window_count = 0
+        self.window_count += 1
+
+        elapsed = now - self.window_start
+        if elapsed >= BASELINE_WINDOW:
+            rate = self.window_count / elapsed
+            if self.baseline_rate is None:
+                self.baseline_rate = rate
+            else:
+                self.baseline_rate = (self.baseline_rate + rate) / 2
+            self.window_start = now
+            self.window_count = 0
 
 
 class HealthChecker:
@@ -16,18 +76,60 @@ class HealthChecker:
         self.last_check: float = 0
         # Queue is healthy by default
         self.is_queue_healthy = True
+        # Pressure level in graded mode, after hysteresis
+        self.pressure = 0.0
+        self.throttle = Throttle()
 
-    def is_healthy(self) -> bool:
+    def _check(self) -> None:
         now = time.time()
         # Check queue health if it's been more than the interval
-        if now - self.last_check >= options.get("backpressure.checking.interval"):
-            self.is_queue_healthy = is_consumer_healthy(self.consumer_name)
+        if now - self.last_check < options.get("backpressure.checking.interval"):
+            return
 
-            # We don't count the time it took to check as part of the interval
-            self.last_check = now
+        self.is_queue_healthy = is_consumer_healthy(self.consumer_name)
+        if options.get("backpressure.graded.enabled"):
+            if self.is_queue_healthy:
+                pressure = get_consumer_pressure(self.consumer_name)
+            else:
+                pressure = 1.0
+            self.pressure = self._apply_hysteresis(pressure)
+            metrics.gauge(
+                "backpressure.consumer.pressure",
+                self.pressure,
+                tags={"consumer": self.consumer_name},
+            )
+        else:
+            self.pressure = 0.0
 
+        # We don't count the time it took to check as part of the interval
+        self.last_check = now
+
+    def _apply_hysteresis(self, pressure: float) -> float:
+        hysteresis = options.get("backpressure.graded.hysteresis")
+        if self.pressure >= 1.0:
+            # A stopped consumer only resumes once the pressure clearly eased,
+            # instead of flapping around the high watermark.
+            return pressure if pressure <= 1.0 - hysteresis else 1.0
+        if pressure >= 1.0 or pressure <= 0.0 or abs(pressure - self.pressure) >= hysteresis:
+            return pressure
+        return self.pressure
+
+    def is_healthy(self) -> bool:
+        self._check()
+        if options.get("backpressure.graded.enabled"):
+            return self.pressure < 1.0
         return self.is_queue_healthy
 
+    def admit(self) -> bool:
+        """
+        Returns whether a message may be processed now. Unhealthy consumers
+        admit nothing, consumers under pressure admit a share of their
+        unthrottled rate proportional to the remaining headroom.
+        """
+        if not self.is_healthy():
+            return False
+        return self.throttle.admit(self.pressure, time.time())
+
 
 TPayload = TypeVar("TPayload")
 
@@ -38,13 +140,14 @@ def create_backpressure_step(
 ) -> ProcessingStrategy[FilteredPayload | TPayload]:
     """
     This creates a new arroyo `ProcessingStrategy` that will check the `HealthChecker`
-    and reject messages if the downstream step is not healthy.
+    and reject messages if the downstream step is not healthy, or throttle them
+    if it is under pressure.
     This strategy can be chained in front of the `next_step` that will do the actual
     processing.
     """
 
     def ensure_healthy_queue(message: Message[TPayload]) -> TPayload:
-        if not health_checker.is_healthy():
+        if not health_checker.admit():
             raise MessageRejected()
 
         return message.payload
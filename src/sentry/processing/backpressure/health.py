@@ -26,6 +26,10 @@ def _service_key(name: str) -> str:
     return _prefix_key(f"service_is_healthy:{name}")
 
 
+def _consumer_pressure_key(name: str) -> str:
+    return _prefix_key(f"consumer_pressure:{name}")
+
+
 service_monitoring_cluster = redis.redis_clusters.get(
     settings.SENTRY_SERVICE_MONITORING_REDIS_CLUSTER
 )
@@ -111,7 +115,28 @@ def is_consumer_healthy(consumer_name: str = "default") -> bool:
         return False
 
 
-def record_consumer_health(unhealthy_services: Mapping[str, UnhealthyReasons]) -> None:
+def get_consumer_pressure(consumer_name: str = "default") -> float:
+    """Returns the pressure level of the given consumer as published by the monitor.
+
+    The level is between `0.0` (no pressure) and `1.0` (stopped). A missing
+    level is treated as no pressure, `is_consumer_healthy` still decides
+    whether the consumer has to stop.
+    """
+    try:
+        pressure = service_monitoring_cluster.get(_consumer_pressure_key(consumer_name))
+    except Exception as e:
+        sentry_sdk.capture_exception(e)
+        return 0.0
+
+    if pressure is None:
+        return 0.0
+    return min(max(float(pressure), 0.0), 1.0)
+
+
+def record_consumer_health(
+    unhealthy_services: Mapping[str, UnhealthyReasons],
+    service_pressure: Mapping[str, float] | None = None,
+) -> None:
     with service_monitoring_cluster.pipeline() as pipeline:
         key_ttl = options.get("backpressure.status_ttl")
 
@@ -140,6 +165,15 @@ def record_consumer_health(unhealthy_services: Mapping[str, UnhealthyReasons]) -
                 _consumer_key(name), "false" if unhealthy_dependencies else "true", ex=key_ttl
             )
 
+            if service_pressure is not None:
+                pressure = 1.0 if unhealthy_dependencies else 0.0
+                for dependency in dependencies:
+                    pressure = max(pressure, service_pressure.get(dependency, 0.0))
+                pipeline.set(_consumer_pressure_key(name), str(pressure), ex=key_ttl)
+                metrics.gauge(
+                    "backpressure.monitor.consumer.pressure", pressure, tags={"consumer": name}
+                )
+
             if unhealthy_dependencies:
                 metrics.incr("backpressure.monitor.consumer.unhealthy", tags={"consumer": name})
                 metrics.event(
@@ -60,12 +60,36 @@ def assert_all_services_defined(services: dict[str, Service]) -> None:
             )
 
 
-def check_service_health(services: Mapping[str, Service]) -> MutableMapping[str, UnhealthyReasons]:
+def get_pressure_level(percentage: float, high_watermark: float) -> float:
+    """
+    Maps the memory usage of a service to a pressure level between `0.0` and
+    `1.0`. The level rises linearly within `backpressure.graded.throttle-range`
+    below the high watermark, and is `1.0` from the high watermark on.
+    """
+    if percentage >= high_watermark:
+        return 1.0
+
+    throttle_range = options.get("backpressure.graded.throttle-range")
+    if throttle_range <= 0:
+        return 0.0
+    return max(0.0, (percentage - (high_watermark - throttle_range)) / throttle_range)
+
+
+def check_service_health(
+    services: Mapping[str, Service],
+    service_pressure: MutableMapping[str, float] | None = None,
+) -> MutableMapping[str, UnhealthyReasons]:
+    """
+    Checks the memory usage of each service against its high watermark. If
+    `service_pressure` is given, it is filled with the pressure level of each
+    service, which is the highest level of any of its nodes.
+    """
     unhealthy_services: MutableMapping[str, UnhealthyReasons] = {}
 
     for name, service in services.items():
         high_watermark = options.get(f"backpressure.high_watermarks.{name}")
         reasons = []
+        pressure = 0.0
 
         logger.info("Checking service `%s` (configured high watermark: %s):", name, high_watermark)
         memory = None
@@ -73,6 +97,7 @@ def check_service_health(services: Mapping[str, Service]) -> MutableMapping[str,
             for memory in check_service_memory(service):
                 if memory.percentage >= high_watermark:
                     reasons.append(memory)
+                pressure = max(pressure, get_pressure_level(memory.percentage, high_watermark))
                 logger.info("Checking node: %s:%s", memory.host, memory.port)
                 logger.info(
                     "  name: %s, used: %s, available: %s, percentage: %s",
@@ -86,6 +111,7 @@ def check_service_health(services: Mapping[str, Service]) -> MutableMapping[str,
                 scope.set_tag("service", name)
                 sentry_sdk.capture_exception(e)
             unhealthy_services[name] = e
+            pressure = 1.0
             host = memory.host if memory else "unknown"
             port = memory.port if memory else "unknown"
             logger.exception(
@@ -97,7 +123,10 @@ def check_service_health(services: Mapping[str, Service]) -> MutableMapping[str,
         else:
             unhealthy_services[name] = reasons
 
-        logger.info("  => healthy: %s", not unhealthy_services[name])
+        if service_pressure is not None:
+            service_pressure[name] = pressure
+
+        logger.info("  => healthy: %s, pressure: %s", not unhealthy_services[name], pressure)
 
     return unhealthy_services
 
@@ -116,12 +145,16 @@ def start_service_monitoring() -> None:
             custom_sampling_context={"sample_rate": 1.0},
             transaction=True,
         ):
+            service_pressure: dict[str, float] | None = None
+            if options.get("backpressure.graded.enabled"):
+                service_pressure = {}
+
             # first, check each base service and record its health
-            unhealthy_services = check_service_health(services)
+            unhealthy_services = check_service_health(services, service_pressure)
 
             # then, check the derived services and record their health
             try:
-                record_consumer_health(unhealthy_services)
+                record_consumer_health(unhealthy_services, service_pressure)
             except Exception as e:
                 sentry_sdk.capture_exception(e)
 
@@ -12,6 +12,7 @@ from sentry import features, options
 from sentry.constants import DataCategory
 from sentry.sentry_metrics.use_case_id_registry import CARDINALITY_LIMIT_USE_CASES
 from sentry.utils.json import prune_empty_keys
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
 from sentry.utils.services import Service
 
 if TYPE_CHECKING:
@@ -327,6 +328,43 @@ class RateLimited(RateLimit):
         super().__init__(True, **kwargs)
 
 
+#: Memoised quota definitions, keyed by ``(organization_id, project_id,
+#: public_keys)``. Values are ``(expires_at, quotas)`` tuples. See
+#: ``quotas.redis.config-cache-ttl``.
+_quota_config_cache: ThreadSafeCache[
+    tuple[int, int, tuple[str, ...]], tuple[float, list[QuotaConfig]]
+] = ThreadSafeCache(LRUCache(10_000))
+
+
+def invalidate_quota_config_cache(
+    *,
+    organization_id: int | None = None,
+    project_id: int | None = None,
+    public_key: str | None = None,
+) -> None:
+    """
+    Drops memoised quota definitions for an organization, a project or a
+    single project key. Called whenever the project config is invalidated, as
+    the same option and key changes affect the quotas.
+    """
+    if not len(_quota_config_cache):
+        return
+
+    for cache_key in list(_quota_config_cache.keys()):
+        cached_organization_id, cached_project_id, cached_public_keys = cache_key
+        if (
+            cached_organization_id == organization_id
+            or cached_project_id == project_id
+            or public_key in cached_public_keys
+        ):
+            _quota_config_cache.pop(cache_key)
+
+
+def clear_quota_config_cache() -> None:
+    for cache_key in list(_quota_config_cache.keys()):
+        _quota_config_cache.pop(cache_key)
+
+
 def _limit_from_settings(x: Any) -> int | None:
     """
     limit=0 (or any falsy value) in database means "no limit". Convert that to
@@ -6,10 +6,19 @@ from time import time
 import rb
 from sentry_redis_tools.clients import RedisCluster
 
+from sentry import options
 from sentry.constants import DataCategory
 from sentry.models.project import Project
 from sentry.models.projectkey import ProjectKey
-from sentry.quotas.base import NotRateLimited, Quota, QuotaConfig, QuotaScope, RateLimited
+from sentry.quotas.base import (
+    NotRateLimited,
+    Quota,
+    QuotaConfig,
+    QuotaScope,
+    RateLimited,
+    _quota_config_cache,
+)
+from sentry.utils import metrics
 from sentry.utils.redis import (
     get_dynamic_cluster_from_options,
     is_instance_rb_cluster,
@@ -71,6 +80,33 @@ class RedisQuota(Quota):
         if key:
             key.project = project
 
+        if key and not keys:
+            keys = [key]
+        elif not keys:
+            keys = []
+        else:
+            keys = list(keys)
+
+        ttl = options.get("quotas.redis.config-cache-ttl")
+        if ttl <= 0:
+            return self._get_quotas(project, keys)
+
+        # Quota definitions only change with project and key options, so they
+        # can be shared across the many checks a process makes for a project.
+        # Invalidated through ``invalidate_quota_config_cache``.
+        cache_key = (project.organization_id, project.id, tuple(k.public_key for k in keys))
+        now = time()
+        cached = _quota_config_cache.get(cache_key)
+        if cached is not None and cached[0] > now:
+            metrics.incr("quotas.redis.config_cache", tags={"result": "hit"}, sample_rate=0.01)
+            return list(cached[1])
+
+        metrics.incr("quotas.redis.config_cache", tags={"result": "miss"}, sample_rate=0.01)
+        results = self._get_quotas(project, keys)
+        _quota_config_cache[cache_key] = (now + ttl, results)
+        return list(results)
+
+    def _get_quotas(self, project: Project, keys: list[ProjectKey]) -> list[QuotaConfig]:
         results = [*self.get_abuse_quotas(project.organization)]
 
         with start_span(
@@ -91,11 +127,6 @@ class RedisQuota(Quota):
                     )
                 )
 
-        if key and not keys:
-            keys = [key]
-        elif not keys:
-            keys = []
-
         for key in keys:
             with start_span(
                 op="redis.get_quotas.get_key_quota", name="redis.get_quotas.get_key_quota"
@@ -123,35 +154,48 @@ class RedisQuota(Quota):
         if timestamp is None:
             timestamp = time()
 
-        def get_usage_for_quota(
-            client: RedisCluster, quota: QuotaConfig
-        ) -> tuple[str | None, str | None]:
+        def get_keys_for_quota(quota: QuotaConfig) -> tuple[str, str] | None:
             if not quota.should_track:
-                return None, None
+                return None
 
             key = self.__get_redis_key(
                 quota, timestamp, organization_id % quota.window, organization_id
             )
-            refund_key = self.get_refunded_quota_key(key)
+            return key, self.get_refunded_quota_key(key)
 
-            return client.get(key), client.get(refund_key)
+        def get_value_for_result(result, refund_result) -> int:
+            return int(result or 0) - int(refund_result or 0)
 
-        def get_value_for_result(result, refund_result) -> int | None:
-            if result is None:
-                return None
-
-            return int(result.value or 0) - int(refund_result.value or 0)
+        quota_keys = [get_keys_for_quota(quota) for quota in quotas]
 
+        # All keys of an organization share a hash tag, so each backend can
+        # fetch the usage of every quota in a single round-trip.
+        results: list[tuple[bytes | None, bytes | None] | None]
         if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
-            results = [get_usage_for_quota(self.cluster, quota) for quota in quotas]
+            pipe = self.cluster.pipeline(transaction=False)
+            for keys in quota_keys:
+                if keys is not None:
+                    pipe.get(keys[0])
+                    pipe.get(keys[1])
+            values = iter(pipe.execute())
+            results = [
+                (next(values), next(values)) if keys is not None else None for keys in quota_keys
+            ]
         elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
             with self.cluster.fanout() as client:
                 target = client.target_key(str(organization_id))
-                results = [get_usage_for_quota(target, quota) for quota in quotas]
+                promises = [
+                    (target.get(keys[0]), target.get(keys[1])) if keys is not None else None
+                    for keys in quota_keys
+                ]
+            results = [
+                (promise[0].value, promise[1].value) if promise is not None else None
+                for promise in promises
+            ]
         else:
-            AssertionError("unreachable")
+            raise AssertionError("unreachable")
 
-        return [get_value_for_result(*r) for r in results]
+        return [get_value_for_result(*r) if r is not None else None for r in results]
 
     def get_refunded_quota_key(self, key: str) -> str:
         return f"r:{key}"
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from time import time
+
+from django.conf import settings
+
+from sentry import options
+from sentry.ratelimits.concurrent import DEFAULT_MAX_TTL_SECONDS, ConcurrentRateLimiter
+from sentry.ratelimits.redis import make_window_key
+from sentry.utils import metrics, redis
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
+
+logger = logging.getLogger(__name__)
+
+request_limit_info = redis.load_redis_script("ratelimits/api_request_limiter.lua")
+
+
+@dataclass
+class RequestLimitInfo:
+    #: Fixed window count including this request.
+    current: int
+    reset_time: int
+    window_limited: bool
+    #: Executing requests including this one, ``None`` if the concurrent limit
+    #: was not checked.
+    concurrent_requests: int | None
+    concurrent_limit_exceeded: bool
+
+
+@dataclass
+class _LocalAllowance:
+    """
+    A local allowance for a rate limit key. It is only created for keys that
+    were observed far below their window limit and without a concurrent limit,
+    and lets a process admit a few requests for such keys without asking Redis.
+    """
+
+    #: Requests that may still be admitted locally.
+    tokens: int
+    #: The fixed window count last seen in Redis plus local admissions since.
+    current: int
+    reset_time: int
+    #: Local admissions not counted in Redis yet.
+    unrecorded: int = 0
+
+
+def _time_bucket(request_time: float, window: int) -> int:
+    return int(request_time / window)
+
+
+class ApiRateLimiter:
+    """
+    Checks the fixed window and the concurrent limit of an API request in one
+    round-trip, instead of going through ``RedisRateLimiter`` and
+    ``ConcurrentRateLimiter`` separately.
+
+    Requests are added to the same sorted set as with ``ConcurrentRateLimiter``,
+    so they are finished through ``ConcurrentRateLimiter.finish_request``. The
+    fixed window counter uses the key of ``RedisRateLimiter``, so both count
+    towards the same window. On a Redis cluster the script's keys must live in
+    the same slot though, so there the window key is hash-tagged with the
+    concurrent key and its counts are not shared with ``RedisRateLimiter``.
+    """
+
+    default_window = 60
+
+    def __init__(self, max_ttl_seconds: int = DEFAULT_MAX_TTL_SECONDS) -> None:
+        cluster_key = settings.SENTRY_RATE_LIMIT_REDIS_CLUSTER
+        self.client = redis.redis_clusters.get(cluster_key)
+        self.is_redis_cluster = (
+            options.get("redis.clusters").get(cluster_key, {}).get("is_redis_cluster", False)
+        )
+        self.max_ttl_seconds = max_ttl_seconds
+        self.concurrent = ConcurrentRateLimiter(max_ttl_seconds)
+        self.local_allowances: ThreadSafeCache[str, _LocalAllowance] = ThreadSafeCache(
+            LRUCache(10_000)
+        )
+        self._local_lock = threading.Lock()
+
+    def window_key(self, key: str, window: int, request_time: float) -> str:
+        window_key = make_window_key(key, window, request_time)
+        if not self.is_redis_cluster:
+            return window_key
+        return f"{{{self.concurrent.namespaced_key(key)}}}:{window_key}"
+
+    def check_request(
+        self,
+        key: str,
+        limit: int,
+        window: int | None,
+        concurrent_limit: int | None,
+        request_uid: str,
+    ) -> RequestLimitInfo:
+        request_time = time()
+        if not window:
+            window = self.default_window
+        reset_time = (_time_bucket(request_time, window) + 1) * window
+
+        # Requests with a concurrent limit always go to Redis, as they have to
+        # be added to the set of executing requests.
+        local_ratio = options.get("api.rate-limit.local-precheck-ratio")
+        use_local = local_ratio > 0 and concurrent_limit is None
+        unrecorded = 0
+        if use_local:
+            info, unrecorded = self._check_local(key, request_time)
+            if info is not None:
+                metrics.incr("ratelimits.api.local_precheck.admitted", sample_rate=0.01)
+                return info
+
+        try:
+            current, window_limited, concurrent_requests, concurrent_allowed = request_limit_info(
+                [self.window_key(key, window, request_time), self.concurrent.namespaced_key(key)],
+                [
+                    limit,
+                    window - int(request_time % window),
+                    concurrent_limit if concurrent_limit is not None else -1,
+                    request_uid,
+                    request_time,
+                    self.max_ttl_seconds,
+                    # Local admissions are counted with the next round-trip.
+                    1 + unrecorded,
+                ],
+                self.client,
+            )
+        except Exception:
+            # We don't want rate limited endpoints to fail when ratelimits
+            # can't be updated. We do want to know when that happens.
+            logger.exception(
+                "Could not check request limits",
+                dict(key=key, limit=limit, request_uid=request_uid),
+            )
+            return RequestLimitInfo(
+                current=0,
+                reset_time=reset_time,
+                window_limited=False,
+                concurrent_requests=-1 if concurrent_limit is not None else None,
+                concurrent_limit_exceeded=False,
+            )
+
+        info = RequestLimitInfo(
+            current=int(current),
+            reset_time=reset_time,
+            window_limited=bool(window_limited),
+            concurrent_requests=int(concurrent_requests) if concurrent_requests >= 0 else None,
+            concurrent_limit_exceeded=not bool(concurrent_allowed),
+        )
+        if use_local:
+            self._observe(key, limit, local_ratio, info)
+        return info
+
+    def _check_local(self, key: str, request_time: float) -> tuple[RequestLimitInfo | None, int]:
+        """
+        Admits the request locally if the key has an allowance left. Otherwise
+        returns the local admissions that the round-trip to Redis has to count.
+        """
+        with self._local_lock:
+            allowance = self.local_allowances.get(key)
+            if allowance is None:
+                return None, 0
+
+            if request_time >= allowance.reset_time or allowance.tokens < 1:
+                # Either out of tokens or the window rolled over since Redis was
+                # last asked (in which case the unrecorded admissions belong to
+                # a window that is over).
+                self.local_allowances.pop(key)
+                if request_time >= allowance.reset_time:
+                    return None, 0
+                return None, allowance.unrecorded
+
+            allowance.tokens -= 1
+            allowance.current += 1
+            allowance.unrecorded += 1
+            return (
+                RequestLimitInfo(
+                    current=allowance.current,
+                    reset_time=allowance.reset_time,
+                    window_limited=False,
+                    concurrent_requests=None,
+                    concurrent_limit_exceeded=False,
+                ),
+                0,
+            )
+
+    def _observe(self, key: str, limit: int, ratio: float, info: RequestLimitInfo) -> None:
+        # Only keys far below their limit may skip Redis, and only for as many
+        # requests as keep them below that fraction of it. Everything else
+        # keeps going through the round-trip for exact accounting.
+        headroom = int(limit * ratio) - info.current
+        with self._local_lock:
+            if info.window_limited or headroom < 1:
+                self.local_allowances.pop(key)
+                return
+
+            self.local_allowances[key] = _LocalAllowance(
+                tokens=headroom,
+                current=info.current,
+                reset_time=info.reset_time,
+            )
+
+    def finish_request(self, key: str, request_uid: str) -> None:
+        self.concurrent.finish_request(key, request_uid)
@@ -28,6 +28,25 @@ def _bucket_start_time(bucket_number: int, window: int) -> int:
     return bucket_number * window
 
 
+def make_window_key(
+    key: str, window: int, request_time: float, project: Project | None = None
+) -> str:
+    """
+    Construct a rate limit key using the args given. Key will have a format of:
+    "rl:<key_hex>:[project?<project_id>:]<time_bucket>"
+    where the time bucket is calculated by integer dividing the current time by the window
+    """
+    key_hex = md5_text(key).hexdigest()
+    bucket = _time_bucket(request_time, window)
+
+    redis_key = f"rl:{key_hex}"
+    if project is not None:
+        redis_key += f":{project.id}"
+    redis_key += f":{bucket}"
+
+    return redis_key
+
+
 class RedisRateLimiter(RateLimiter):
     def __init__(self, **options: Any) -> None:
         cluster_key = settings.SENTRY_RATE_LIMIT_REDIS_CLUSTER
@@ -41,9 +60,7 @@ class RedisRateLimiter(RateLimiter):
         request_time: float | None = None,
     ) -> str:
         """
-        Construct a rate limit key using the args given. Key will have a format of:
-        "rl:<key_hex>:[project?<project_id>:]<time_bucket>"
-        where the time bucket is calculated by integer dividing the current time by the window
+        Construct a rate limit key using the args given, see `make_window_key`.
         """
 
         if window is None or window == 0:
@@ -52,15 +69,7 @@ class RedisRateLimiter(RateLimiter):
         if request_time is None:
             request_time = time()
 
-        key_hex = md5_text(key).hexdigest()
-        bucket = _time_bucket(request_time, window)
-
-        redis_key = f"rl:{key_hex}"
-        if project is not None:
-            redis_key += f":{project.id}"
-        redis_key += f":{bucket}"
-
-        return redis_key
+        return make_window_key(key, window, request_time, project=project)
 
     def validate(self) -> None:
         try:
@@ -8,8 +8,9 @@ from django.conf import settings
 from django.http.request import HttpRequest
 from rest_framework.response import Response
 
-from sentry import features
+from sentry import features, options
 from sentry.auth.services.auth import AuthenticatedToken
+from sentry.ratelimits.api_limiter import ApiRateLimiter
 from sentry.ratelimits.concurrent import ConcurrentRateLimiter
 from sentry.ratelimits.config import DEFAULT_RATE_LIMIT_CONFIG, RateLimitConfig
 from sentry.types.ratelimit import RateLimit, RateLimitCategory, RateLimitMeta, RateLimitType
@@ -47,6 +48,16 @@ def concurrent_limiter() -> ConcurrentRateLimiter:
     return _CONCURRENT_RATE_LIMITER
 
 
+_API_RATE_LIMITER: ApiRateLimiter | None = None
+
+
+def api_limiter() -> ApiRateLimiter:
+    global _API_RATE_LIMITER
+    if not _API_RATE_LIMITER:
+        _API_RATE_LIMITER = ApiRateLimiter()
+    return _API_RATE_LIMITER
+
+
 def get_rate_limit_key(
     view_func: EndpointFunction,
     request: HttpRequest,
@@ -183,10 +194,9 @@ def get_rate_limit_value(
 def above_rate_limit_check(
     key: str, rate_limit: RateLimit, request_uid: str, group: str
 ) -> RateLimitMeta:
-    # TODO: This is not as performant as it could be. The roundtrip betwwen the server and redis
-    # is doubled because the fixd window limit and concurrent limit are two separate things with different
-    # paths. Ideally there is just one lua script that does both and just says what kind of limit was hit
-    # (if any)
+    if options.get("api.rate-limit.single-round-trip"):
+        return _above_rate_limit_check_single_round_trip(key, rate_limit, request_uid, group)
+
     rate_limit_type = RateLimitType.NOT_LIMITED
     window_limited, current, reset_time = ratelimiter.is_limited_with_value(
         key, limit=rate_limit.limit, window=rate_limit.window
@@ -219,6 +229,38 @@ def above_rate_limit_check(
     )
 
 
+def _above_rate_limit_check_single_round_trip(
+    key: str, rate_limit: RateLimit, request_uid: str, group: str
+) -> RateLimitMeta:
+    # The fixed window and the concurrent limit are checked by one Lua script,
+    # which says what kind of limit was hit (if any).
+    info = api_limiter().check_request(
+        key,
+        limit=rate_limit.limit,
+        window=rate_limit.window,
+        concurrent_limit=rate_limit.concurrent_limit,
+        request_uid=request_uid,
+    )
+    if info.window_limited:
+        rate_limit_type = RateLimitType.FIXED_WINDOW
+    elif info.concurrent_limit_exceeded:
+        rate_limit_type = RateLimitType.CONCURRENT
+    else:
+        rate_limit_type = RateLimitType.NOT_LIMITED
+
+    return RateLimitMeta(
+        rate_limit_type=rate_limit_type,
+        current=info.current,
+        limit=rate_limit.limit,
+        window=rate_limit.window,
+        group=group,
+        reset_time=info.reset_time,
+        remaining=rate_limit.limit - info.current if not info.window_limited else 0,
+        concurrent_limit=rate_limit.concurrent_limit,
+        concurrent_requests=info.concurrent_requests,
+    )
+
+
 def finish_request(key: str, request_uid: str) -> None:
     concurrent_limiter().finish_request(key, request_uid)
 
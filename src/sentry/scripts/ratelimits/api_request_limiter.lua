@@ -0,0 +1,57 @@
+-- Evaluates the fixed window and the concurrent rate limit of an API request in
+-- a single round-trip. See api_limiter.lua for how the concurrent limit works,
+-- this script follows the same logic.
+--
+-- The fixed window limit is checked first. If it has been hit there is no reason
+-- to do the work of the concurrent limit as well, and the request is not added to
+-- the set of executing requests.
+--
+-- Both keys must hash to the same slot, on a Redis cluster the caller uses the
+-- concurrent key as the hash tag of the fixed window key.
+--
+-- Input:
+-- keys:
+--  window_key, concurrent_key
+-- args:
+--  limit, window_expiration, concurrent_limit (-1 for none), request_uid, current_time,
+--  max_tll_seconds, increment (this request plus requests admitted without asking Redis)
+--
+-- Output:
+-- current (the fixed window count including this request), window_limited (0/1),
+-- current_executions (-1 if the concurrent limit was not checked), concurrent_allowed (0/1)
+local window_key = KEYS[1]
+local concurrent_key = KEYS[2]
+
+local limit = tonumber(ARGV[1])
+local window_expiration = tonumber(ARGV[2])
+local concurrent_limit = tonumber(ARGV[3])
+local request_uid = ARGV[4]
+local cur_time = tonumber(ARGV[5])
+local max_tll_seconds = tonumber(ARGV[6])
+local increment = tonumber(ARGV[7])
+
+local current = redis.call("incrby", window_key, increment)
+redis.call("expire", window_key, window_expiration)
+
+if current > limit then
+  return { current, 1, -1, 1 }
+end
+
+if concurrent_limit < 0 then
+  return { current, 0, -1, 1 }
+end
+
+redis.call("zremrangebyscore", concurrent_key, "-inf", cur_time - max_tll_seconds)
+local current_executions = redis.call("zcard", concurrent_key)
+
+if current_executions >= concurrent_limit then
+  return { current, 0, current_executions, 0 }
+end
+
+-- Same leak protection as in api_limiter.lua.
+local key_ttl_seconds = 86400
+
+redis.call("zadd", concurrent_key, cur_time, request_uid)
+redis.call("expire", concurrent_key, key_ttl_seconds)
+
+return { current, 0, current_executions + 1, 1 }
@@ -66,6 +66,7 @@ from sentry.search.events import filter as event_filter
 from sentry.search.events.filter import to_list
 from sentry.search.events.types import SAMPLING_MODES, SnubaParams
 from sentry.search.exceptions import InvalidIssueSearchQuery
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
 from sentry.utils.tracing import get_current_span, set_span_tag, trace
 
 
@@ -87,6 +88,22 @@ class HiddenApiAttribute(InvalidSearchQuery):
     pass
 
 
+# Attribute resolution only depends on the column definitions and the column
+# name, not on the request's params, so resolved attributes are shared by all
+# resolvers in the process. Entries are keyed by the identity of the
+# definitions and hold a reference to them, so a new set of definitions never
+# picks up stale entries.
+_shared_resolved_attribute_cache: ThreadSafeCache[
+    tuple[int, str],
+    tuple[ColumnDefinitions, tuple[ResolvedAttribute, VirtualColumnDefinition | None]],
+] = ThreadSafeCache(LRUCache(10_000))
+
+
+def clear_shared_resolved_attribute_cache() -> None:
+    for key in list(_shared_resolved_attribute_cache.keys()):
+        _shared_resolved_attribute_cache.pop(key)
+
+
 @dataclass(frozen=True)
 class SearchResolver:
     """The only attributes are things we want to cache and params
@@ -1123,6 +1140,13 @@ class SearchResolver:
         if column in self._resolved_attribute_cache:
             return self._resolved_attribute_cache[column]
 
+        shared_cache_key = (id(self.definitions), column)
+        if public_alias_override is None:
+            shared_entry = _shared_resolved_attribute_cache.get(shared_cache_key)
+            if shared_entry is not None and shared_entry[0] is self.definitions:
+                self._resolved_attribute_cache[column] = shared_entry[1]
+                return shared_entry[1]
+
         alias = column
         if public_alias_override is not None:
             alias = public_alias_override
@@ -1195,7 +1219,12 @@ class SearchResolver:
             column_context = None
 
         if column_definition:
-            self._resolved_attribute_cache[column] = (column_definition, column_context)
+            resolved = (column_definition, column_context)
+            # Private columns depend on the fields ACL of the resolver's config and
+            # overridden aliases on the caller, so only share the plain resolutions.
+            if public_alias_override is None and not column_definition.private:
+                _shared_resolved_attribute_cache[shared_cache_key] = (self.definitions, resolved)
+            self._resolved_attribute_cache[column] = resolved
             return self._resolved_attribute_cache[column]
         else:
             raise InvalidSearchQuery(f"Could not parse {column}")
@@ -217,16 +217,20 @@ class NodeStorage(local, Service):
 
             return items
 
-    def _encode(self, data: dict[str | None, Mapping[str, Any]]) -> bytes:
+    def _encode(
+        self, data: dict[str | None, Mapping[str, Any]], encoded: bytes | None = None
+    ) -> bytes:
         """
         Encode data dict in a way where its keys can be deserialized
         independently. A `None` key must always be present which is served as
-        the "default" subkey (the regular event payload).
+        the "default" subkey (the regular event payload). If ``encoded`` is
+        given, it is used as the already encoded default subkey.
 
         >>> _encode({"unprocessed": {}, None: {"stacktrace": {}}})
         b'{"stacktrace": {}}\nunprocessed\n{}'
         """
-        lines = [json_dumps(data.pop(None)).encode("utf8")]
+        default = data.pop(None)
+        lines = [encoded if encoded is not None else json_dumps(default).encode("utf8")]
         for key, value in data.items():
             if key is not None:
                 lines.append(key.encode("ascii"))
@@ -255,10 +259,15 @@ class NodeStorage(local, Service):
 
     @trace
     def set_subkeys(
-        self, item_id: str, data: dict[str | None, Mapping[str, Any]], ttl: timedelta | None = None
+        self,
+        item_id: str,
+        data: dict[str | None, Mapping[str, Any]],
+        ttl: timedelta | None = None,
+        encoded: bytes | None = None,
     ) -> None:
         """
-        Set value for `item_id` and its subkeys.
+        Set value for `item_id` and its subkeys. ``encoded`` may hold the
+        default subkey already encoded as JSON, to skip encoding it again.
 
         >>> nodestore.set_subkeys('key1', {
         ...    None: {'foo': 'bar'},
@@ -271,7 +280,7 @@ class NodeStorage(local, Service):
         {'foo': 'bam'}
         """
         cache_item = data.get(None)
-        bytes_data = self._encode(data)
+        bytes_data = self._encode(data, encoded)
         self.set_bytes(item_id, bytes_data, ttl=ttl)
         # set cache only after encoding and write to nodestore has succeeded
         if options.get("nodestore.set-subkeys.enable-set-cache-item"):
@@ -22,6 +22,7 @@ class BigtableNodeStorage(NodeStorage):
         valid for reading + returning)
     :param compression: A boolean whether to enable zlib-compression, or the
         string "zstd" to use zstd.
+    :param read_concurrency: How many row sets `get_multi` reads in parallel.
 
     >>> from datetime import timedelta
     >>> BigtableNodeStorage(
@@ -43,6 +44,7 @@ class BigtableNodeStorage(NodeStorage):
         automatic_expiry: bool = False,
         default_ttl: timedelta | None = None,
         compression: bool | str = False,
+        read_concurrency: int = 1,
         **client_options: object,
     ):
         if compression is True:
@@ -59,6 +61,7 @@ class BigtableNodeStorage(NodeStorage):
             default_ttl=default_ttl,
             compression=_compression,
             client_options=client_options,
+            read_concurrency=read_concurrency,
         )
         self.automatic_expiry = automatic_expiry
         self.skip_deletes = automatic_expiry and "_SENTRY_CLEANUP" in os.environ
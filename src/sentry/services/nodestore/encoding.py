@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import uuid
+from collections.abc import Collection, Mapping
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+from sentry.utils import json
+
+# For the values orjson rejects or encodes differently from `sentry.utils.json`.
+_fallback_dumps = json.JSONEncoder(
+    separators=(",", ":"),
+    sort_keys=True,
+    ignore_nan=True,
+    default=json.better_default_encoder,
+).encode
+
+# Datetimes and dataclasses go through `better_default_encoder` like they do
+# with `sentry.utils.json`, instead of orjson's own encoding.
+_ORJSON_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+
+class _NeedsFallback(TypeError):
+    pass
+
+
+def _default(value: Any) -> Any:
+    # orjson can only encode decimals as strings, while `sentry.utils.json`
+    # encodes them as numbers.
+    if isinstance(value, Decimal):
+        raise _NeedsFallback
+    return json.better_default_encoder(value)
+
+
+def _dumps(value: Any) -> bytes:
+    # orjson encodes UUIDs with hyphens rather than as hex, and has no option
+    # to pass them through. Event payloads are decoded from JSON, so they can
+    # only hold UUIDs where they are set as top-level values.
+    if isinstance(value, uuid.UUID):
+        return _fallback_dumps(value).encode("utf-8")
+    try:
+        return orjson.dumps(value, default=_default, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        # e.g. decimals or integers above 64 bits
+        return _fallback_dumps(value).encode("utf-8")
+
+
+class EncodedPayload:
+    """
+    A JSON object whose top-level values are encoded exactly once.
+
+    Event payloads are written to nodestore in full and sent to the
+    eventstream without a few large keys. Keeping the encoded values around
+    lets both be assembled from the same bytes, instead of encoding the whole
+    payload for each of them.
+    """
+
+    __slots__ = ("fragments",)
+
+    def __init__(self, fragments: Mapping[str, bytes]) -> None:
+        #: Encoded ``"key":value`` pairs by key.
+        self.fragments = fragments
+
+    @classmethod
+    def encode(cls, data: Mapping[str, Any]) -> EncodedPayload:
+        return cls({key: b"%s:%s" % (_dumps(key), _dumps(value)) for key, value in data.items()})
+
+    def to_bytes(self, exclude: Collection[str] = ()) -> bytes:
+        return b"{%s}" % b",".join(
+            fragment for key, fragment in sorted(self.fragments.items()) if key not in exclude
+        )
+
+    def to_raw_json(self, exclude: Collection[str] = ()) -> json.RawJSON:
+        """Embeds the payload into a document encoded with ``sentry.utils.json``."""
+        return json.RawJSON(self.to_bytes(exclude).decode("utf-8"))
@@ -89,50 +89,93 @@ def _find_segment_span(spans: list[SpanEvent]) -> SpanEvent | None:
 
 
 class TreeEnricher:
-    """Enriches spans with information from their parent, child and sibling spans."""
+    """
+    Enriches spans with information from their parent, child and sibling spans.
+
+    The span tree is stored in parallel arrays indexed by the position of each
+    span in the segment, so that exclusive times and ancestor attributes are
+    computed for the whole segment up front. Spans are enriched in place.
+    """
 
     def __init__(self, spans: list[SpanEvent]) -> None:
+        self._spans = spans
         self._segment_span = _find_segment_span(spans)
 
         self._ttid_ts = _timestamp_by_op(spans, "ui.load.initial_display")
         self._ttfd_ts = _timestamp_by_op(spans, "ui.load.full_display")
 
-        self._span_intervals: dict[str, list[tuple[int, int]]] = {}
-        self._spans_by_id: dict[str, SpanEvent] = {}
-        for span in spans:
+        self._shared_attrs: dict[str, Any] = {}
+        self._is_mobile = False
+        self._mobile_start_type: str | None = None
+        if self._segment_span is not None:
+            # Assume that Relay has extracted the shared tags into `data` on the
+            # root span. Once `sentry_tags` is removed, the logic from
+            # `extract_shared_tags` should be moved here.
+            segment_attrs = self._segment_span.get("attributes") or {}
+            self._shared_attrs = {
+                k: v for k, v in segment_attrs.items() if k in SHARED_SENTRY_ATTRIBUTES
+            }
+            self._is_mobile = attribute_value(self._segment_span, "sentry.mobile") == "true"
+            self._mobile_start_type = _get_mobile_start_type(self._segment_span)
+
+        # Start and end timestamps in microseconds, and the index of the parent
+        # span (-1 if the parent is not part of the segment).
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        index_by_id: dict[str, int] = {}
+        children_by_id: dict[str, list[int]] = {}
+        for i, span in enumerate(spans):
+            start, end = _span_interval(span)
+            self._starts.append(start)
+            self._ends.append(end)
             if "span_id" in span:
-                self._spans_by_id[span["span_id"]] = span
+                index_by_id[span["span_id"]] = i
             if parent_span_id := span.get("parent_span_id"):
-                interval = _span_interval(span)
-                self._span_intervals.setdefault(parent_span_id, []).append(interval)
+                children_by_id.setdefault(parent_span_id, []).append(i)
 
-    def _attributes(self, span: SpanEvent) -> dict[str, Any]:
-        attributes: dict[str, Any] = {**(span.get("attributes") or {})}
+        self._parents: list[int] = []
+        for span in spans:
+            parent_span_id = span.get("parent_span_id")
+            self._parents.append(
+                index_by_id.get(parent_span_id, -1) if parent_span_id is not None else -1
+            )
+
+        self._exclusive_times = [
+            self._exclusive_time(i, children_by_id.get(span.get("span_id") or "", []))
+            for i, span in enumerate(spans)
+        ]
+
+        # Resolve agent names before any span is enriched, so that names added
+        # to one span are not inherited further down the tree.
+        self._ancestor_agent_names: dict[int, str] = {}
+        for i, span in enumerate(spans):
+            if is_gen_ai_span(span) and ATTRIBUTE_NAMES.GEN_AI_AGENT_NAME not in (
+                span.get("attributes") or {}
+            ):
+                if (agent_name := self._find_ancestor_agent_name(i)) is not None:
+                    self._ancestor_agent_names[i] = agent_name
+
+    def _enrich_span(self, index: int) -> SpanEvent:
+        span = self._spans[index]
+        if span.get("attributes") is None:
+            span["attributes"] = {}
+        attributes: dict[str, Any] = span["attributes"]
 
         def get_value(key: str) -> Any:
             attr: dict[str, Any] = attributes.get(key) or {}
             return attr.get("value")
 
         if self._segment_span is not None:
-            # Assume that Relay has extracted the shared tags into `data` on the
-            # root span. Once `sentry_tags` is removed, the logic from
-            # `extract_shared_tags` should be moved here.
-            segment_attrs = self._segment_span.get("attributes") or {}
-            shared_attrs = {k: v for k, v in segment_attrs.items() if k in SHARED_SENTRY_ATTRIBUTES}
-
-            is_mobile = attribute_value(self._segment_span, "sentry.mobile") == "true"
-            mobile_start_type = _get_mobile_start_type(self._segment_span)
-
-            if is_mobile:
+            if self._is_mobile:
                 # NOTE: Like in Relay's implementation, shared tags are added at the
                 # very end. This does not have access to the shared tag value. We
                 # keep behavior consistent, although this should be revisited.
                 if get_value("sentry.thread.name") == MOBILE_MAIN_THREAD_NAME:
                     attributes["sentry.main_thread"] = {"type": "string", "value": "true"}
-                if not get_value("sentry.app_start_type") and mobile_start_type:
+                if not get_value("sentry.app_start_type") and self._mobile_start_type:
                     attributes["sentry.app_start_type"] = {
                         "type": "string",
-                        "value": mobile_start_type,
+                        "value": self._mobile_start_type,
                     }
 
             if self._ttid_ts is not None and span["end_timestamp"] <= self._ttid_ts:
@@ -140,89 +183,72 @@ class TreeEnricher:
             if self._ttfd_ts is not None and span["end_timestamp"] <= self._ttfd_ts:
                 attributes["sentry.ttfd"] = {"type": "string", "value": "ttfd"}
 
-            for key, value in shared_attrs.items():
+            for key, value in self._shared_attrs.items():
                 if attributes.get(key) is None:
                     attributes[key] = value
 
-            if is_gen_ai_span(span) and ATTRIBUTE_NAMES.GEN_AI_AGENT_NAME not in attributes:
-                if (agent_name := self._find_ancestor_agent_name(span)) is not None:
-                    attributes[ATTRIBUTE_NAMES.GEN_AI_AGENT_NAME] = {
-                        "type": "string",
-                        "value": agent_name,
-                    }
+            if (agent_name := self._ancestor_agent_names.get(index)) is not None:
+                attributes[ATTRIBUTE_NAMES.GEN_AI_AGENT_NAME] = {
+                    "type": "string",
+                    "value": agent_name,
+                }
 
         attributes["sentry.exclusive_time_ms"] = {
             "type": "double",
-            "value": self._exclusive_time(span),
+            "value": self._exclusive_times[index],
         }
 
-        return attributes
+        return span
 
-    def _iter_ancestors(self, span: SpanEvent) -> Iterator[SpanEvent]:
+    def _iter_ancestors(self, index: int) -> Iterator[SpanEvent]:
         """
-        Iterates over the ancestors of a span in order towards the root using the "parent_span_id" attribute.
+        Iterates over the ancestors of a span in order towards the root using the parent indices.
         """
-        current: SpanEvent | None = span
-        parent_span_id: str | None = None
-
-        while current is not None:
-            parent_span_id = current.get("parent_span_id")
-            if parent_span_id is not None:
-                current = self._spans_by_id.get(parent_span_id)
-            else:
-                current = None
-            if current is not None:
-                yield current
-            else:
-                break
+        parent = self._parents[index]
+        while parent != -1:
+            yield self._spans[parent]
+            parent = self._parents[parent]
 
-    def _find_ancestor_agent_name(self, span: SpanEvent) -> str | None:
+    def _find_ancestor_agent_name(self, index: int) -> str | None:
         """
         Finds the nearest ancestor's agent name within MAX_AGENT_NAME_ANCESTOR_HOPS.
         Returns the first agent name found, or None if no ancestor has one.
         """
-        for ancestor in islice(self._iter_ancestors(span), MAX_AGENT_NAME_ANCESTOR_HOPS):
+        for ancestor in islice(self._iter_ancestors(index), MAX_AGENT_NAME_ANCESTOR_HOPS):
             if (
                 agent_name := attribute_value(ancestor, ATTRIBUTE_NAMES.GEN_AI_AGENT_NAME)
             ) is not None:
                 return agent_name
         return None
 
-    def _exclusive_time(self, span: SpanEvent) -> float:
+    def _exclusive_time(self, index: int, children: list[int]) -> float:
         """
-        Sets the exclusive time on all spans in the list.
+        Computes the exclusive time of a span from the intervals of its children.
 
         The exclusive time is the time spent in a span's own code. This is the sum
         of all time intervals where no child span was active.
         """
-
-        intervals = self._span_intervals.get(span["span_id"], [])
+        starts, ends = self._starts, self._ends
         # Sort by start ASC, end DESC to skip over nested intervals efficiently
-        intervals.sort(key=lambda x: (x[0], -x[1]))
+        children.sort(key=lambda child: (starts[child], -ends[child]))
 
         exclusive_time_us: int = 0  # microseconds to prevent rounding issues
-        start, end = _span_interval(span)
+        start, end = starts[index], ends[index]
 
         # Progressively add time gaps before the next span and then skip to its end.
-        for child_start, child_end in intervals:
+        for child in children:
+            child_start = starts[child]
             if child_start >= end:
                 break
             if child_start > start:
                 exclusive_time_us += child_start - start
-            start = max(start, child_end)
+            start = max(start, ends[child])
 
         # Add any remaining time not covered by children
         exclusive_time_us += max(end - start, 0)
 
         return exclusive_time_us / 1_000
 
-    def enrich_span(self, span: SpanEvent) -> SpanEvent:
-        attributes = self._attributes(span)
-        return {
-            **span,
-            "attributes": attributes,
-        }
-
     @classmethod
     def enrich_spans(cls, spans: list[SpanEvent]) -> tuple[int | None, list[SpanEvent]]:
         inst = cls(spans)
@@ -230,7 +256,7 @@ class TreeEnricher:
         segment_idx = None
 
         for i, span in enumerate(spans):
-            enriched = inst.enrich_span(span)
+            enriched = inst._enrich_span(i)
             if span is inst._segment_span:
                 segment_idx = i
             ret.append(enriched)
@@ -8,6 +8,7 @@ from sentry_conventions.attributes import ATTRIBUTE_NAMES
 from sentry.spans.consumers.process_segments.types import attribute_value
 from sentry.spans.grouping.utils import Hash, parse_fingerprint_var
 from sentry.utils import urls
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
 
 
 class Span(TypedDict):
@@ -32,9 +33,35 @@ class Span(TypedDict):
 # should return `None` to indicate that the strategy should not be used
 # and to try a different strategy. If the strategy does apply, it should
 # return a list of strings that will serve as the span fingerprint.
+# Strategies may only look at the span's op and description, as the
+# resulting span groups are memoised on those.
 CallableStrategy = Callable[[Span], Optional[Sequence[str]]]
 
 
+# Span groups are memoised per segment, and in a bounded process-wide LRU for
+# the most common descriptions across segments.
+_SpanGroupKey = tuple[tuple[CallableStrategy, ...], str | None, str, tuple[str, ...]]
+
+_SPAN_GROUP_CACHE_MAX_DESCRIPTION_LENGTH = 2048
+_span_group_cache: ThreadSafeCache[_SpanGroupKey, str] = ThreadSafeCache(LRUCache(10_000))
+
+
+def clear_span_group_cache() -> None:
+    for key in list(_span_group_cache.keys()):
+        _span_group_cache.pop(key)
+
+
+def _span_group_key(strategies: Sequence[CallableStrategy], span: Span) -> _SpanGroupKey | None:
+    fingerprint = span.get("fingerprint") or ()
+    if not all(isinstance(value, str) for value in fingerprint):
+        return None
+    op = span.get("op")
+    description = raw_description(span)
+    if (op is not None and not isinstance(op, str)) or not isinstance(description, str):
+        return None
+    return (tuple(strategies), op, description, tuple(fingerprint))
+
+
 @dataclass(frozen=True)
 class SpanGroupingStrategy:
     name: str
@@ -43,7 +70,8 @@ class SpanGroupingStrategy:
 
     def execute(self, event_data: Any) -> dict[str, str]:
         spans = event_data.get("spans", [])
-        span_groups = {span["span_id"]: self.get_embedded_span_group(span) for span in spans}
+        memo: dict[_SpanGroupKey, str] = {}
+        span_groups = {span["span_id"]: self.get_memoized_span_group(span, memo) for span in spans}
 
         # make sure to get the group id for the transaction root span
         span_id = event_data["contexts"]["trace"]["span_id"]
@@ -52,9 +80,12 @@ class SpanGroupingStrategy:
         return span_groups
 
     def execute_standalone(self, spans: list[Any]) -> dict[str, str]:
-        return {span["span_id"]: self.get_standalone_span_group(span) for span in spans}
+        memo: dict[_SpanGroupKey, str] = {}
+        return {span["span_id"]: self.get_standalone_span_group(span, memo) for span in spans}
 
-    def get_standalone_span_group(self, span: Span) -> str:
+    def get_standalone_span_group(
+        self, span: Span, memo: dict[_SpanGroupKey, str] | None = None
+    ) -> str:
         # Treat the segment span like get_transaction_span_group for backwards
         # compatibility with transaction events, but fall back to default
         # fingerprinting if the span doesn't have a transaction.
@@ -67,13 +98,34 @@ class SpanGroupingStrategy:
             result.update(transaction)
             return result.hexdigest()
         else:
-            return self.get_embedded_span_group(span)
+            return self.get_memoized_span_group(span, {} if memo is None else memo)
 
     def get_transaction_span_group(self, event_data: Any) -> str:
         result = Hash()
         result.update(event_data["transaction"])
         return result.hexdigest()
 
+    def get_memoized_span_group(self, span: Span, memo: dict[_SpanGroupKey, str]) -> str:
+        """Returns the same group as `get_embedded_span_group`, reusing the
+        group of any span with the same op, description and fingerprint seen
+        earlier in the segment (`memo`) or recently in this process."""
+        key = _span_group_key(self.strategies, span)
+        if key is None:
+            return self.get_embedded_span_group(span)
+
+        span_group = memo.get(key)
+        if span_group is not None:
+            return span_group
+
+        span_group = _span_group_cache.get(key)
+        if span_group is None:
+            span_group = self.get_embedded_span_group(span)
+            if len(key[2]) <= _SPAN_GROUP_CACHE_MAX_DESCRIPTION_LENGTH:
+                _span_group_cache[key] = span_group
+
+        memo[key] = span_group
+        return span_group
+
     def get_embedded_span_group(self, span: Span) -> str:
         fingerprints = span.get("fingerprint") or ["{{ default }}"]
 
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
@@ -132,6 +133,9 @@ def trim_csharp_function_name(function):
     return function.split(" (", 1)[0]
 
 
+# Native frames are trimmed both while normalizing stacktraces and while matching them against
+# stacktrace rules, and the same functions show up in event after event.
+@lru_cache(maxsize=20_000)
 def trim_native_function_name(function, platform, normalize_lambdas=True):
     if function in ("<redacted>", "<unknown>"):
         return function
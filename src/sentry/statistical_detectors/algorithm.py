@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import struct
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Mapping, MutableMapping
 from dataclasses import dataclass
@@ -15,6 +16,9 @@ from sentry.utils.math import MovingAverage
 
 logger = logging.getLogger("sentry.tasks.statistical_detectors.algorithm")
 
+# timestamp (0 if unset), count, moving_avg_short, moving_avg_long
+PACKED_STATE = struct.Struct("<qqdd")
+
 
 @dataclass(frozen=True)
 class MovingAverageDetectorState(DetectorState):
@@ -57,6 +61,20 @@ class MovingAverageDetectorState(DetectorState):
             moving_avg_long=moving_avg_long,
         )
 
+    def to_packed(self) -> bytes:
+        timestamp = 0 if self.timestamp is None else int(self.timestamp.timestamp())
+        return PACKED_STATE.pack(timestamp, self.count, self.moving_avg_short, self.moving_avg_long)
+
+    @classmethod
+    def from_packed(cls, data: bytes) -> MovingAverageDetectorState:
+        ts, count, moving_avg_short, moving_avg_long = PACKED_STATE.unpack(data)
+        return cls(
+            timestamp=datetime.fromtimestamp(ts, timezone.utc) if ts else None,
+            count=count,
+            moving_avg_short=moving_avg_short,
+            moving_avg_long=moving_avg_long,
+        )
+
     def should_auto_resolve(self, target: float, rel_threshold: float) -> bool:
         value = self.get_moving_avg()
 
@@ -95,7 +113,7 @@ class DetectorAlgorithm(ABC):
     @abstractmethod
     def update(
         self,
-        raw: Mapping[str | bytes, bytes | float | int | str],
+        raw: bytes | Mapping[str | bytes, bytes | float | int | str] | None,
         payload: DetectorPayload,
     ) -> tuple[TrendType, float, DetectorState | None]: ...
 
@@ -119,11 +137,14 @@ class MovingAverageRelativeChangeDetector(DetectorAlgorithm):
 
     def update(
         self,
-        raw_state: Mapping[str | bytes, bytes | float | int | str],
+        raw_state: bytes | Mapping[str | bytes, bytes | float | int | str] | None,
         payload: DetectorPayload,
     ) -> tuple[TrendType, float, DetectorState | None]:
         try:
-            old = MovingAverageDetectorState.from_redis_dict(raw_state)
+            if isinstance(raw_state, bytes):
+                old = MovingAverageDetectorState.from_packed(raw_state)
+            else:
+                old = MovingAverageDetectorState.from_redis_dict(raw_state)
         except Exception as e:
             old = MovingAverageDetectorState.empty()
 
@@ -34,6 +34,13 @@ class DetectorState(ABC):
     @abstractmethod
     def to_redis_dict(self) -> Mapping[str | bytes, bytes | float | int | str]: ...
 
+    @classmethod
+    @abstractmethod
+    def from_packed(cls, data: bytes) -> DetectorState: ...
+
+    @abstractmethod
+    def to_packed(self) -> bytes: ...
+
     @abstractmethod
     def should_auto_resolve(self, target: float, rel_threshold: float) -> bool: ...
 
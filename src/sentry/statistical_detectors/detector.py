@@ -4,7 +4,7 @@ import heapq
 import logging
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Generator, Iterable
+from collections.abc import Generator, Iterable, Mapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import ClassVar
@@ -81,6 +81,10 @@ class RegressionDetector(ABC):
     @abstractmethod
     def detector_store_factory(cls) -> DetectorStore: ...
 
+    @classmethod
+    @abstractmethod
+    def packed_detector_store_factory(cls) -> DetectorStore: ...
+
     @classmethod
     def all_payloads(
         cls,
@@ -115,24 +119,30 @@ class RegressionDetector(ABC):
         regressed_count = 0
         improved_count = 0
 
+        packed = options.get("statistical_detectors.packed_states.enabled")
         algorithm = cls.detector_algorithm_factory()
-        store = cls.detector_store_factory()
+        if packed:
+            store = cls.packed_detector_store_factory()
+            batch_size = options.get("statistical_detectors.packed_states.batch_size")
+        else:
+            store = cls.detector_store_factory()
 
         for raw_payloads in chunked(cls.all_payloads(projects, start), batch_size):
             total_count += len(raw_payloads)
 
-            raw_states = store.bulk_read_states(raw_payloads)
+            # If the number of events is too low, then we skip updating
+            # to minimize false positives
+            min_throughput = cls.min_throughput_threshold()
+            payloads = [payload for payload in raw_payloads if payload.count > min_throughput]
+            skipped_count += len(raw_payloads) - len(payloads)
+            if not payloads:
+                continue
 
-            payloads = []
-            states = []
+            raw_states = store.bulk_read_states(payloads)
 
-            for raw_state, payload in zip(raw_states, raw_payloads):
-                # If the number of events is too low, then we skip updating
-                # to minimize false positives
-                if payload.count <= cls.min_throughput_threshold():
-                    skipped_count += 1
-                    continue
+            states: list[bytes | Mapping[str | bytes, bytes | float | int | str] | None] = []
 
+            for raw_state, payload in zip(raw_states, payloads):
                 metrics.distribution(
                     "statistical_detectors.objects.throughput",
                     value=payload.count,
@@ -147,8 +157,12 @@ class RegressionDetector(ABC):
                 elif trend_type == TrendType.Improved:
                     improved_count += 1
 
-                payloads.append(payload)
-                states.append(None if new_state is None else new_state.to_redis_dict())
+                if new_state is None:
+                    states.append(None)
+                elif packed:
+                    states.append(new_state.to_packed())
+                else:
+                    states.append(new_state.to_redis_dict())
 
                 yield TrendBundle(
                     type=trend_type,
@@ -157,8 +171,7 @@ class RegressionDetector(ABC):
                     state=new_state,
                 )
 
-            if payloads and states:
-                store.bulk_write_states(payloads, states)
+            store.bulk_write_states(payloads, states)
 
         metrics.incr(
             "statistical_detectors.projects.active",
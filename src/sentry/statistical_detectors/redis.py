@@ -9,6 +9,7 @@ from sentry.models.statistical_detectors import RegressionType
 from sentry.statistical_detectors.base import DetectorPayload
 from sentry.statistical_detectors.store import DetectorStore
 from sentry.utils import redis
+from sentry.utils.iterators import chunked
 
 STATE_TTL = 24 * 60 * 60  # 1 day TTL
 
@@ -68,3 +69,75 @@ class RedisDetectorStore(DetectorStore):
     @staticmethod
     def get_redis_client() -> RedisCluster | StrictRedis:
         return redis.redis_clusters.get(settings.SENTRY_STATISTICAL_DETECTORS_REDIS_CLUSTER)
+
+
+class PackedRedisDetectorStore(DetectorStore):
+    """
+    Stores each state as a single packed string rather than a hash, and reads
+    and writes them in chunks of pipelined commands without transactions.
+
+    States only written by `RedisDetectorStore` so far are read from their
+    hashes, until they are written again.
+    """
+
+    def __init__(
+        self,
+        regression_type: RegressionType,
+        ttl=STATE_TTL,
+        chunk_size: int = 1000,
+    ):
+        self.regression_type = regression_type
+        self.ttl = ttl
+        self.chunk_size = chunk_size
+        self.hash_store = RedisDetectorStore(regression_type, ttl=ttl)
+        self._client: RedisCluster | StrictRedis | None = None
+
+    @property
+    def client(self) -> RedisCluster | StrictRedis:
+        if self._client is None:
+            self._client = redis.redis_clusters.get_binary(
+                settings.SENTRY_STATISTICAL_DETECTORS_REDIS_CLUSTER
+            )
+        return self._client
+
+    def bulk_read_states(
+        self, payloads: list[DetectorPayload]
+    ) -> list[bytes | Mapping[str | bytes, bytes | float | int | str] | None]:
+        states: list[bytes | Mapping[str | bytes, bytes | float | int | str] | None] = []
+
+        for chunk in chunked(payloads, self.chunk_size):
+            with self.client.pipeline(transaction=False) as pipeline:
+                for payload in chunk:
+                    pipeline.get(self.make_key(payload))
+                chunk_states = pipeline.execute()
+
+            missing = [i for i, state in enumerate(chunk_states) if state is None]
+            if missing:
+                hash_states = self.hash_store.bulk_read_states([chunk[i] for i in missing])
+                for i, state in zip(missing, hash_states):
+                    chunk_states[i] = state or None
+
+            states.extend(chunk_states)
+
+        return states
+
+    def bulk_write_states(
+        self,
+        payloads: list[DetectorPayload],
+        states: list[bytes | None],
+    ) -> None:
+        # the number of new states must match the number of payloads
+        assert len(states) == len(payloads)
+
+        for chunk in chunked(zip(payloads, states), self.chunk_size):
+            with self.client.pipeline(transaction=False) as pipeline:
+                for payload, state in chunk:
+                    if state is None:
+                        continue
+                    pipeline.set(self.make_key(payload), state, ex=self.ttl)
+                pipeline.execute()
+
+    def make_key(self, payload: DetectorPayload) -> str:
+        return (
+            f"sd:pk:{payload.project_id}:{self.regression_type.abbreviate()}:{payload.fingerprint}"
+        )
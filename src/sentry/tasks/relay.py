@@ -323,6 +323,7 @@ def schedule_invalidate_project_config(
     """
 
     from sentry.models.project import Project
+    from sentry.quotas.base import invalidate_quota_config_cache
 
     if (
         trigger
@@ -340,6 +341,11 @@ def schedule_invalidate_project_config(
         transaction_db = router.db_for_write(Project)
 
     def _do_schedule():
+        # Quota definitions are part of the project config and are memoised
+        # locally, so drop them together with the project config.
+        invalidate_quota_config_cache(
+            organization_id=organization_id, project_id=project_id, public_key=public_key
+        )
         _schedule_invalidate_project_config(
             trigger=trigger,
             trigger_details=trigger_details,
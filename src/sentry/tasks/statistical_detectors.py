@@ -39,7 +39,7 @@ from sentry.statistical_detectors.algorithm import (
 )
 from sentry.statistical_detectors.base import DetectorPayload
 from sentry.statistical_detectors.detector import RegressionDetector
-from sentry.statistical_detectors.redis import RedisDetectorStore
+from sentry.statistical_detectors.redis import PackedRedisDetectorStore, RedisDetectorStore
 from sentry.statistical_detectors.store import DetectorStore
 from sentry.tasks.base import instrumented_task
 from sentry.tasks.utils import compute_delay
@@ -170,6 +170,10 @@ class FunctionRegressionDetector(RegressionDetector):
     def detector_store_factory(cls) -> DetectorStore:
         return RedisDetectorStore(regression_type=RegressionType.FUNCTION)
 
+    @classmethod
+    def packed_detector_store_factory(cls) -> DetectorStore:
+        return PackedRedisDetectorStore(regression_type=RegressionType.FUNCTION)
+
     @classmethod
     def query_payloads(
         cls,
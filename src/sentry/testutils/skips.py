@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib.util
 import socket
 
 import pytest
@@ -56,3 +57,9 @@ requires_snuba = pytest.mark.usefixtures("_requires_snuba")
 requires_symbolicator = pytest.mark.usefixtures("_requires_symbolicator")
 requires_kafka = pytest.mark.usefixtures("_requires_kafka")
 requires_objectstore = pytest.mark.usefixtures("_requires_objectstore")
+
+# pytest-benchmark is not a dev dependency, so benchmarks only run where it has
+# been installed by hand (`pip install pytest-benchmark`) and are skipped otherwise.
+requires_pytest_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None, reason="requires pytest-benchmark"
+)
@@ -1,9 +1,16 @@
+import atexit
 import binascii
 import itertools
 import logging
+import multiprocessing.util
+import os
+import threading
+import time
 import uuid
+import weakref
 from collections import defaultdict, namedtuple
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 from hashlib import md5
 from typing import Any, ContextManager, Generic, TypeVar
@@ -21,6 +28,7 @@ from sentry.tsdb.base import (
     TSDBKey,
     TSDBModel,
 )
+from sentry.utils import metrics
 from sentry.utils.dates import to_datetime
 from sentry.utils.redis import check_cluster_versions, get_cluster_from_options, load_redis_script
 from sentry.utils.versioning import Version
@@ -119,6 +127,11 @@ class RedisTSDB(BaseTSDB):
     frequency table can be displayed as percentages of the whole data set.
     (Additional documentation and the bulk of the logic for implementing the
     frequency table API can be found in the ``cmsketch.lua`` script.)
+
+    Writes to clusters that are not marked as "durable" can optionally be
+    aggregated in process memory before being sent to Redis by passing
+    ``write_behind={"flush_interval": ..., "max_keys": ...}``. See
+    ``WriteBehindBuffer`` for details.
     """
 
     DEFAULT_SKETCH_PARAMETERS = SketchParameters(3, 128, 50)
@@ -129,8 +142,14 @@ class RedisTSDB(BaseTSDB):
         self.prefix = prefix
         self.vnodes = vnodes
         self.enable_frequency_sketches = options.pop("enable_frequency_sketches", False)
+        write_behind = options.pop("write_behind", None)
+        self.write_behind = WriteBehindBuffer(self, **write_behind) if write_behind else None
         super().__init__(**options)
 
+    def flush_write_behind(self) -> None:
+        if self.write_behind is not None:
+            self.write_behind.flush()
+
     def validate(self) -> None:
         logger.debug("Validating Redis version...")
         version = Version((2, 8, 18)) if self.enable_frequency_sketches else Version((2, 8, 9))
@@ -258,46 +277,59 @@ class RedisTSDB(BaseTSDB):
             default_timestamp = timezone.now()
 
         for (cluster, durable), environment_ids in self.get_cluster_groups({None, environment_id}):
-            manager = cluster.map()
-            if not durable:
-                manager = SuppressionWrapper(manager)
+            # (hash_key, hash_field) -> count
+            key_operations: dict[tuple[str, str | int], int] = defaultdict(int)
+            # (hash_key) -> "max expiration encountered"
+            key_expiries: dict[str, float] = defaultdict(float)
+
+            for rollup, max_values in self.rollups.items():
+                for item in items:
+                    if len(item) == 2:
+                        model, key = item
+                        options: IncrMultiOptions = {
+                            "timestamp": default_timestamp,
+                            "count": default_count,
+                        }
+                    else:
+                        model, key, options = item
+
+                    count = options.get("count", default_count)
+                    _timestamp = options.get("timestamp", default_timestamp)
+
+                    expiry = self.calculate_expiry(rollup, max_values, _timestamp)
+
+                    for _environment_id in environment_ids:
+                        hash_key, hash_field = self.make_counter_key(
+                            model, rollup, _timestamp, key, _environment_id
+                        )
 
-            with manager as client:
-                # (hash_key, hash_field) -> count
-                key_operations: dict[tuple[str, str | int], int] = defaultdict(int)
-                # (hash_key) -> "max expiration encountered"
-                key_expiries: dict[str, float] = defaultdict(float)
+                        if key_expiries[hash_key] < expiry:
+                            key_expiries[hash_key] = expiry
 
-                for rollup, max_values in self.rollups.items():
-                    for item in items:
-                        if len(item) == 2:
-                            model, key = item
-                            options: IncrMultiOptions = {
-                                "timestamp": default_timestamp,
-                                "count": default_count,
-                            }
-                        else:
-                            model, key, options = item
-
-                        count = options.get("count", default_count)
-                        _timestamp = options.get("timestamp", default_timestamp)
-
-                        expiry = self.calculate_expiry(rollup, max_values, _timestamp)
-
-                        for _environment_id in environment_ids:
-                            hash_key, hash_field = self.make_counter_key(
-                                model, rollup, _timestamp, key, _environment_id
-                            )
+                        key_operations[(hash_key, hash_field)] += count
 
-                            if key_expiries[hash_key] < expiry:
-                                key_expiries[hash_key] = expiry
+            if self.write_behind is not None and not durable:
+                self.write_behind.add_counters(cluster, key_operations, key_expiries)
+            else:
+                self.write_counters(cluster, durable, key_operations, key_expiries)
 
-                            key_operations[(hash_key, hash_field)] += count
+    def write_counters(
+        self,
+        cluster: rb.Cluster,
+        durable: bool,
+        key_operations: Mapping[tuple[str, str | int], int],
+        key_expiries: Mapping[str, float],
+    ) -> None:
+        key_expiries = dict(key_expiries)
+        manager = cluster.map()
+        if not durable:
+            manager = SuppressionWrapper(manager)
 
-                for (hash_key, hash_field), count in key_operations.items():
-                    client.hincrby(hash_key, hash_field, count)
-                    if key_expiries.get(hash_key):
-                        client.expireat(hash_key, key_expiries.pop(hash_key))
+        with manager as client:
+            for (hash_key, hash_field), count in key_operations.items():
+                client.hincrby(hash_key, hash_field, count)
+                if key_expiries.get(hash_key):
+                    client.expireat(hash_key, key_expiries.pop(hash_key))
 
     def get_range(
         self,
@@ -363,6 +395,9 @@ class RedisTSDB(BaseTSDB):
         timestamp: datetime | None = None,
         environment_ids: Iterable[int] | None = None,
     ) -> None:
+        # Pending writes must land before the affected keys are merged or deleted.
+        self.flush_write_behind()
+
         ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
 
         self.validate_arguments([model], ids)
@@ -417,6 +452,9 @@ class RedisTSDB(BaseTSDB):
         timestamp: datetime | None = None,
         environment_ids: Iterable[int | None] | None = None,
     ) -> None:
+        # Pending writes must land before the affected keys are merged or deleted.
+        self.flush_write_behind()
+
         ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
 
         self.validate_arguments(models, ids)
@@ -469,18 +507,39 @@ class RedisTSDB(BaseTSDB):
         ts = int(timestamp.timestamp())  # ``timestamp`` is not actually a timestamp :(
 
         for (cluster, durable), environment_ids in self.get_cluster_groups({None, environment_id}):
-            manager = cluster.fanout()
-            if not durable:
-                manager = SuppressionWrapper(manager)
+            # (routing key, key) -> values
+            key_values: dict[tuple[int, str], set[str]] = defaultdict(set)
+            # (key) -> expiration
+            key_expiries: dict[str, float] = {}
 
-            with manager as client:
-                for model, key, values in items:
-                    c = client.target_key(key)
-                    for rollup, max_values in self.rollups.items():
-                        for _environment_id in environment_ids:
-                            k = self.make_key(model, rollup, ts, key, _environment_id)
-                            c.pfadd(k, *values)
-                            c.expireat(k, self.calculate_expiry(rollup, max_values, timestamp))
+            for model, key, values in items:
+                for rollup, max_values in self.rollups.items():
+                    for _environment_id in environment_ids:
+                        k = self.make_key(model, rollup, ts, key, _environment_id)
+                        key_values[(key, k)].update(values)
+                        key_expiries[k] = self.calculate_expiry(rollup, max_values, timestamp)
+
+            if self.write_behind is not None and not durable:
+                self.write_behind.add_distinct_counts(cluster, key_values, key_expiries)
+            else:
+                self.write_distinct_counts(cluster, durable, key_values, key_expiries)
+
+    def write_distinct_counts(
+        self,
+        cluster: rb.Cluster,
+        durable: bool,
+        key_values: Mapping[tuple[int, str], Iterable[str]],
+        key_expiries: Mapping[str, float],
+    ) -> None:
+        manager = cluster.fanout()
+        if not durable:
+            manager = SuppressionWrapper(manager)
+
+        with manager as client:
+            for (routing_key, k), values in key_values.items():
+                c = client.target_key(routing_key)
+                c.pfadd(k, *values)
+                c.expireat(k, key_expiries[k])
 
     def get_distinct_counts_series(
         self,
@@ -568,6 +627,9 @@ class RedisTSDB(BaseTSDB):
         timestamp: datetime | None = None,
         environment_ids: Iterable[int] | None = None,
     ) -> None:
+        # Pending writes must land before the affected keys are merged or deleted.
+        self.flush_write_behind()
+
         ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
 
         self.validate_arguments([model], ids)
@@ -642,6 +704,9 @@ class RedisTSDB(BaseTSDB):
         timestamp: datetime | None = None,
         environment_ids: Iterable[int] | None = None,
     ) -> None:
+        # Pending writes must land before the affected keys are merged or deleted.
+        self.flush_write_behind()
+
         ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
 
         self.validate_arguments(models, ids)
@@ -698,7 +763,10 @@ class RedisTSDB(BaseTSDB):
         ts = int(timestamp.timestamp())  # ``timestamp`` is not actually a timestamp :(
 
         for (cluster, durable), environment_ids in self.get_cluster_groups({None, environment_id}):
-            commands: dict[str, list] = {}
+            # (routing key, sketch keys) -> member -> score
+            key_scores: dict[tuple[str, tuple[str, ...]], dict[str, int | float]] = {}
+            # (routing key, key) -> expiration
+            key_expiries: dict[tuple[str, str], float] = {}
 
             for model, request in requests:
                 for key, items in request.items():
@@ -719,22 +787,42 @@ class RedisTSDB(BaseTSDB):
                         for k in chunk:
                             expirations[k] = expiry
 
-                    arguments = ["INCR"] + list(self.DEFAULT_SKETCH_PARAMETERS)
-                    for member, score in items.items():
-                        arguments.extend((score, member))
-
                     # Since we're essentially merging dictionaries, we need to
-                    # append this to any value that already exists at the key.
-                    cmds = commands.setdefault(key, [])
-                    cmds.append((CountMinScript, keys, arguments))
+                    # add to any score that already exists for the member.
+                    scores = key_scores.setdefault((key, tuple(keys)), defaultdict(int))
+                    for member, score in items.items():
+                        scores[member] += score
                     for k, t in expirations.items():
-                        cmds.append(("EXPIREAT", k, t))
+                        key_expiries[(key, k)] = t
 
-            try:
-                cluster.execute_commands(commands)
-            except Exception:
-                if durable:
-                    raise
+            if self.write_behind is not None and not durable:
+                self.write_behind.add_frequencies(cluster, key_scores, key_expiries)
+            else:
+                self.write_frequencies(cluster, durable, key_scores, key_expiries)
+
+    def write_frequencies(
+        self,
+        cluster: rb.Cluster,
+        durable: bool,
+        key_scores: Mapping[tuple[str, tuple[str, ...]], Mapping[str, int | float]],
+        key_expiries: Mapping[tuple[str, str], float],
+    ) -> None:
+        commands: dict[str, list] = {}
+
+        for (routing_key, keys), items in key_scores.items():
+            arguments = ["INCR"] + list(self.DEFAULT_SKETCH_PARAMETERS)
+            for member, score in items.items():
+                arguments.extend((score, member))
+            commands.setdefault(routing_key, []).append((CountMinScript, list(keys), arguments))
+
+        for (routing_key, k), t in key_expiries.items():
+            commands.setdefault(routing_key, []).append(("EXPIREAT", k, t))
+
+        try:
+            cluster.execute_commands(commands)
+        except Exception:
+            if durable:
+                raise
 
     def get_frequency_series(
         self,
@@ -794,6 +882,9 @@ class RedisTSDB(BaseTSDB):
         timestamp: datetime | None = None,
         environment_ids: Iterable[int] | None = None,
     ) -> None:
+        # Pending writes must land before the affected keys are merged or deleted.
+        self.flush_write_behind()
+
         ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
 
         self.validate_arguments([model], ids)
@@ -876,6 +967,9 @@ class RedisTSDB(BaseTSDB):
         timestamp: datetime | None = None,
         environment_ids: Iterable[int] | None = None,
     ) -> None:
+        # Pending writes must land before the affected keys are merged or deleted.
+        self.flush_write_behind()
+
         ids = (set(environment_ids) if environment_ids is not None else set()).union([None])
 
         self.validate_arguments(models, ids)
@@ -898,3 +992,219 @@ class RedisTSDB(BaseTSDB):
                                         model, rollup, timestamp.timestamp(), key, environment_id
                                     ):
                                         c.delete(k)
+
+
+@dataclass
+class _PendingWrites:
+    counters: defaultdict[tuple[str, str | int], int] = field(
+        default_factory=lambda: defaultdict(int)
+    )
+    counter_expiries: dict[str, float] = field(default_factory=dict)
+    distinct_counts: defaultdict[tuple[int, str], set[str]] = field(
+        default_factory=lambda: defaultdict(set)
+    )
+    distinct_count_expiries: dict[str, float] = field(default_factory=dict)
+    frequencies: dict[tuple[str, tuple[str, ...]], defaultdict[str, int | float]] = field(
+        default_factory=dict
+    )
+    frequency_expiries: dict[tuple[str, str], float] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.counters) + len(self.distinct_counts) + len(self.frequencies)
+
+    def add_counters(
+        self,
+        key_operations: Mapping[tuple[str, str | int], int],
+        key_expiries: Mapping[str, float],
+    ) -> None:
+        for hash_key_field, count in key_operations.items():
+            self.counters[hash_key_field] += count
+        _merge_expiries(self.counter_expiries, key_expiries)
+
+    def add_distinct_counts(
+        self,
+        key_values: Mapping[tuple[int, str], Iterable[str]],
+        key_expiries: Mapping[str, float],
+    ) -> None:
+        for key, values in key_values.items():
+            self.distinct_counts[key].update(values)
+        _merge_expiries(self.distinct_count_expiries, key_expiries)
+
+    def add_frequencies(
+        self,
+        key_scores: Mapping[tuple[str, tuple[str, ...]], Mapping[str, int | float]],
+        key_expiries: Mapping[tuple[str, str], float],
+    ) -> None:
+        for sketch_keys, items in key_scores.items():
+            scores = self.frequencies.setdefault(sketch_keys, defaultdict(int))
+            for member, score in items.items():
+                scores[member] += score
+        _merge_expiries(self.frequency_expiries, key_expiries)
+
+    def merge(self, other: "_PendingWrites") -> None:
+        self.add_counters(other.counters, other.counter_expiries)
+        self.add_distinct_counts(other.distinct_counts, other.distinct_count_expiries)
+        self.add_frequencies(other.frequencies, other.frequency_expiries)
+
+
+def _merge_expiries[K](target: dict[K, float], expiries: Mapping[K, float]) -> None:
+    for key, expiry in expiries.items():
+        if target.get(key, 0) < expiry:
+            target[key] = expiry
+
+
+class WriteBehindBuffer:
+    """
+    Aggregates TSDB writes in process memory and sends them to Redis in bulk.
+
+    Counter increments for the same hash field are summed, distinct counter
+    values for the same key are unioned and frequency table scores for the same
+    member are summed, so a hot group or project results in a single write per
+    flush rather than one per event. Pending writes are flushed once
+    ``flush_interval`` seconds have passed since the last flush or ``max_keys``
+    distinct keys are pending, by a background thread if no further writes
+    arrive, and when the process exits (including forked multiprocessing
+    workers that exit cleanly). Writes that fail to flush are kept and retried
+    with the next flush.
+
+    Only writes to clusters that are not marked as "durable" are buffered:
+    errors writing to durable clusters must propagate to the caller, so those
+    are written through.
+
+    Reads do not observe pending writes, so counts may lag behind by up to
+    ``flush_interval`` seconds.
+    """
+
+    def __init__(self, tsdb: RedisTSDB, flush_interval: float = 1.0, max_keys: int = 10_000):
+        self.tsdb = tsdb
+        self.flush_interval = flush_interval
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._pending: dict[rb.Cluster, _PendingWrites] = {}
+        self._last_flush = time.monotonic()
+        self._pid: int | None = None
+        _write_behind_buffers.add(self)
+
+    def _get_pending(self, cluster: rb.Cluster) -> _PendingWrites:
+        # Writes buffered before a fork belong to the parent process, and the
+        # flusher thread does not survive the fork.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._pending = {}
+            threading.Thread(
+                target=self._run_flusher, name="tsdb-write-behind", daemon=True
+            ).start()
+            # `atexit` handlers do not run in forked multiprocessing workers,
+            # but their finalizers do.
+            multiprocessing.util.Finalize(self, self.flush, exitpriority=10)
+        return self._pending.setdefault(cluster, _PendingWrites())
+
+    def _run_flusher(self) -> None:
+        pid = os.getpid()
+        while self._pid == pid:
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("tsdb.write_behind.flush_failed")
+
+    def _maybe_flush(self) -> None:
+        with self._lock:
+            pending_keys = sum(len(pending) for pending in self._pending.values())
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due or pending_keys >= self.max_keys:
+            self.flush()
+
+    def add_counters(
+        self,
+        cluster: rb.Cluster,
+        key_operations: Mapping[tuple[str, str | int], int],
+        key_expiries: Mapping[str, float],
+    ) -> None:
+        with self._lock:
+            self._get_pending(cluster).add_counters(key_operations, key_expiries)
+        self._maybe_flush()
+
+    def add_distinct_counts(
+        self,
+        cluster: rb.Cluster,
+        key_values: Mapping[tuple[int, str], Iterable[str]],
+        key_expiries: Mapping[str, float],
+    ) -> None:
+        with self._lock:
+            self._get_pending(cluster).add_distinct_counts(key_values, key_expiries)
+        self._maybe_flush()
+
+    def add_frequencies(
+        self,
+        cluster: rb.Cluster,
+        key_scores: Mapping[tuple[str, tuple[str, ...]], Mapping[str, int | float]],
+        key_expiries: Mapping[tuple[str, str], float],
+    ) -> None:
+        with self._lock:
+            self._get_pending(cluster).add_frequencies(key_scores, key_expiries)
+        self._maybe_flush()
+
+    def flush(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+        failed: dict[rb.Cluster, _PendingWrites] = {}
+        for cluster, writes in pending.items():
+            metrics.distribution("tsdb.write_behind.flushed_keys", len(writes))
+            retry = _PendingWrites()
+            if writes.counters and not self._write(
+                self.tsdb.write_counters, cluster, writes.counters, writes.counter_expiries
+            ):
+                retry.add_counters(writes.counters, writes.counter_expiries)
+            if writes.distinct_counts and not self._write(
+                self.tsdb.write_distinct_counts,
+                cluster,
+                writes.distinct_counts,
+                writes.distinct_count_expiries,
+            ):
+                retry.add_distinct_counts(writes.distinct_counts, writes.distinct_count_expiries)
+            if writes.frequencies and not self._write(
+                self.tsdb.write_frequencies, cluster, writes.frequencies, writes.frequency_expiries
+            ):
+                retry.add_frequencies(writes.frequencies, writes.frequency_expiries)
+            if retry:
+                failed[cluster] = retry
+
+        if failed:
+            # Put back whatever was not written, merging it with any writes
+            # buffered in the meantime, to be retried with the next flush.
+            with self._lock:
+                for cluster, writes in failed.items():
+                    self._get_pending(cluster).merge(writes)
+
+    def _write(
+        self, write: Callable[..., None], cluster: rb.Cluster, values: Any, expiries: Any
+    ) -> bool:
+        try:
+            # Written as durable so that errors are raised here rather than
+            # suppressed, and the failed writes can be kept for a retry.
+            write(cluster, True, values, expiries)
+        except Exception:
+            logger.exception("tsdb.write_behind.flush_failed")
+            metrics.incr("tsdb.write_behind.flush_failed")
+            return False
+        return True
+
+
+_write_behind_buffers: weakref.WeakSet[WriteBehindBuffer] = weakref.WeakSet()
+
+
+def flush_write_behind_buffers() -> None:
+    """
+    Flush the writes pending in every ``WriteBehindBuffer`` of this process.
+
+    Called at interpreter exit, and should be called by long running processes
+    (such as consumers) when they shut down.
+    """
+    for buffer in list(_write_behind_buffers):
+        buffer.flush()
+
+
+atexit.register(flush_write_behind_buffers)
@@ -19,6 +19,7 @@ from django.utils.timezone import is_aware
 from simplejson import (  # type: ignore[attr-defined]  # noqa: S003
     JSONDecodeError,
     JSONEncoder,
+    RawJSON,
     _default_decoder,  # noqa: S003
 )
 
@@ -179,6 +180,7 @@ def prune_empty_keys(obj: Mapping[TKey, TValue | None] | None) -> dict[TKey, TVa
 __all__ = (
     "JSONDecodeError",
     "JSONEncoder",
+    "RawJSON",
     "dump",
     "dumps",
     "dumps_htmlsafe",
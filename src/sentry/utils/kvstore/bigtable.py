@@ -2,6 +2,7 @@ import enum
 import logging
 import struct
 from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import as_completed
 from datetime import timedelta
 from threading import Lock
 from typing import Any
@@ -9,13 +10,14 @@ from typing import Any
 from django.utils import timezone
 from google.api_core import exceptions, retry
 from google.cloud import bigtable
-from google.cloud.bigtable.row import PartialRowData
+from google.cloud.bigtable.row import DirectRow, PartialRowData
 from google.cloud.bigtable.row_data import DEFAULT_RETRY_READ_ROWS
 from google.cloud.bigtable.row_set import RowSet
 from google.cloud.bigtable.table import Table
 
 from sentry.utils import metrics
 from sentry.utils.codecs import Codec, ZlibCodec, ZstdCodec
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.kvstore.abstract import KVStorage
 from sentry.utils.tracing import start_span
 
@@ -56,6 +58,10 @@ class BigtableKVStorage(KVStorage[str, bytes]):
         COMPRESSED_ZLIB = 1 << 0
         COMPRESSED_ZSTD = 1 << 1
 
+    # The maximum number of rows written by a single ``mutate_rows`` request in
+    # ``set_many``.
+    mutate_rows_batch_size = 100
+
     compression_strategies: Mapping[str, tuple[Flags, Codec[bytes, bytes]]] = {
         "zlib": (Flags.COMPRESSED_ZLIB, ZlibCodec()),
         "zstd": (Flags.COMPRESSED_ZSTD, ZstdCodec()),
@@ -70,6 +76,7 @@ class BigtableKVStorage(KVStorage[str, bytes]):
         default_ttl: timedelta | None = None,
         compression: str | None = None,
         app_profile: str | None = None,
+        read_concurrency: int = 1,
     ) -> None:
         client_options = client_options if client_options is not None else {}
         if "admin" in client_options:
@@ -85,6 +92,8 @@ class BigtableKVStorage(KVStorage[str, bytes]):
         self.default_ttl = default_ttl
         self.compression = compression
         self.app_profile = app_profile
+        # The number of row sets ``get_many`` reads in parallel.
+        self.read_concurrency = read_concurrency
 
         self.__table: Table
         self.__table_lock = Lock()
@@ -133,6 +142,22 @@ class BigtableKVStorage(KVStorage[str, bytes]):
             logging.warning("get_many called with empty keys sequence")
             return
 
+        if self.read_concurrency <= 1 or len(keys) < 2:
+            yield from self._read_rows(keys)
+            return
+
+        # Split the keys into one row set per reader, and stream back the rows
+        # of each reader as soon as it has finished.
+        chunk_count = min(self.read_concurrency, len(keys))
+        chunks = [keys[i::chunk_count] for i in range(chunk_count)]
+        with ContextPropagatingThreadPoolExecutor(
+            thread_name_prefix=__name__, max_workers=chunk_count
+        ) as executor:
+            futures = [executor.submit(list, self._read_rows(chunk)) for chunk in chunks]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    def _read_rows(self, keys: Sequence[str]) -> Iterator[tuple[str, bytes]]:
         rows = RowSet()
         for key in keys:
             rows.add_row_key(key)
@@ -195,9 +220,42 @@ class BigtableKVStorage(KVStorage[str, bytes]):
             return self._set(key, value, ttl)
 
     def _set(self, key: str, value: bytes, ttl: timedelta | None = None) -> None:
+        row = self._build_row(self._get_table(), key, value, ttl)
+
+        status = row.commit()
+        if status.code != 0:
+            raise BigtableError(status.code, status.message)
+
+    def set_many(self, items: Sequence[tuple[str, bytes]], ttl: timedelta | None = None) -> None:
+        try:
+            return self._set_many(items, ttl)
+        except (exceptions.InternalServerError, exceptions.ServiceUnavailable):
+            # Delete cached client before retry, as in ``set``. Rewriting rows
+            # that were already written is harmless as every row is replaced.
+            with self.__table_lock:
+                del self.__table
+            return self._set_many(items, ttl)
+
+    def _set_many(self, items: Sequence[tuple[str, bytes]], ttl: timedelta | None = None) -> None:
+        table = self._get_table()
+
+        errors = []
+        for batch_start in range(0, len(items), self.mutate_rows_batch_size):
+            batch = items[batch_start : batch_start + self.mutate_rows_batch_size]
+            rows = [self._build_row(table, key, value, ttl) for key, value in batch]
+            for status in table.mutate_rows(rows):
+                if status.code != 0:
+                    errors.append(BigtableError(status.code, status.message))
+
+        if errors:
+            raise BigtableError(errors)
+
+    def _build_row(
+        self, table: Table, key: str, value: bytes, ttl: timedelta | None = None
+    ) -> DirectRow:
         # XXX: There is a type mismatch here -- ``direct_row`` expects
         # ``bytes`` but we are providing it with ``str``.
-        row = self._get_table().direct_row(key)
+        row = table.direct_row(key)
 
         # Call to delete is just a state mutation, and in this case is just
         # used to clear all columns so the entire row will be replaced.
@@ -261,10 +319,7 @@ class BigtableKVStorage(KVStorage[str, bytes]):
         assert len(value) <= self.max_size
 
         row.set_cell(self.column_family, self.data_column, value, timestamp=ts)
-
-        status = row.commit()
-        if status.code != 0:
-            raise BigtableError(status.code, status.message)
+        return row
 
     def delete(self, key: str) -> None:
         # XXX: There is a type mismatch here -- ``direct_row`` expects
@@ -0,0 +1,46 @@
+"""
+Process-local cache of compiled evaluation plans.
+
+Plans hold bound handlers, so they can't be stored in the shared cache and every
+process compiles its own. Each plan records the version of the group it was
+compiled from, so changes to the group or its conditions are picked up on the
+next lookup, in every process.
+"""
+
+from collections.abc import Sequence
+
+from sentry.utils.local_cache import LRUCache, ThreadSafeCache
+from sentry.workflow_engine.models.data_condition import DataCondition
+from sentry.workflow_engine.models.data_condition_group import DataConditionGroup
+from sentry.workflow_engine.processors.evaluation_plan import (
+    EvaluationPlan,
+    compile_evaluation_plan,
+    get_plan_version,
+)
+from sentry.workflow_engine.utils.metrics import metrics_incr
+
+CACHE_SIZE = 10_000
+METRIC_PREFIX = "workflow_engine.cache.evaluation_plan"
+
+_evaluation_plans: ThreadSafeCache[int, EvaluationPlan] = ThreadSafeCache(LRUCache(CACHE_SIZE))
+
+
+def get_evaluation_plan(
+    group_id: int,
+    logic_type: DataConditionGroup.Type,
+    conditions: Sequence[DataCondition],
+) -> EvaluationPlan:
+    version = get_plan_version(logic_type, conditions)
+    plan = _evaluation_plans.get(group_id)
+    if plan is not None and plan.version == version:
+        return plan
+
+    metrics_incr(f"{METRIC_PREFIX}.compiled")
+    plan = compile_evaluation_plan(logic_type, conditions, version)
+    _evaluation_plans[group_id] = plan
+    return plan
+
+
+def clear_evaluation_plans() -> None:
+    for group_id in list(_evaluation_plans.keys()):
+        _evaluation_plans.pop(group_id)
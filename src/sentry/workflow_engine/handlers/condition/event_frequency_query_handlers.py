@@ -1,8 +1,10 @@
 import contextlib
 import logging
+import math
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, ClassVar, Literal, Protocol, TypedDict
 
@@ -26,6 +28,7 @@ from sentry.rules.conditions.event_frequency import (
 from sentry.rules.match import MatchType
 from sentry.tagstore.base import TAG_KEY_RE
 from sentry.tsdb.base import SnubaCondition, TSDBKey, TSDBModel
+from sentry.utils.dates import to_datetime
 from sentry.utils.iterators import chunked
 from sentry.utils.registry import Registry
 from sentry.utils.snuba import options_override
@@ -39,6 +42,9 @@ _HANDLED_FALSE_VALUES = (False, 0, "false", "0", "no")
 QueryFilter = dict[str, Any]
 QueryResult = dict[int, int | float]
 
+# The most buckets a shared series fetch may span.
+MAX_SERIES_BUCKETS = 1000
+
 
 class GroupValues(TypedDict):
     id: int
@@ -47,6 +53,104 @@ class GroupValues(TypedDict):
     project__organization_id: int
 
 
+@dataclass(frozen=True)
+class QueryWindow:
+    start: datetime
+    end: datetime
+
+
+@dataclass(frozen=True)
+class SharedSeriesQuery:
+    """
+    A single bucketed time series fetch that the results of several windows
+    are derived from. The windows share a rollup, and each is the sum of its
+    buckets, which are the same buckets TSDB sums when querying the window on
+    its own.
+    """
+
+    rollup: int
+    # The bucket timestamps of each window.
+    window_buckets: dict[QueryWindow, list[int]]
+    # The groups queried for each window.
+    window_groups: dict[QueryWindow, list[GroupValues]]
+
+    @property
+    def start(self) -> datetime:
+        return to_datetime(min(buckets[0] for buckets in self.window_buckets.values()))
+
+    @property
+    def end(self) -> datetime:
+        return to_datetime(max(buckets[-1] for buckets in self.window_buckets.values()))
+
+    @property
+    def groups(self) -> list[GroupValues]:
+        groups: dict[int, GroupValues] = {}
+        for window_groups in self.window_groups.values():
+            groups.update((group["id"], group) for group in window_groups)
+        return list(groups.values())
+
+    @property
+    def groups_per_query(self) -> int:
+        # Every group can have a row per bucket.
+        num_buckets = int((self.end - self.start).total_seconds()) // self.rollup + 1
+        return max(1, SNUBA_LIMIT // num_buckets)
+
+    def is_cheaper(self) -> bool:
+        """
+        Whether the shared fetch needs fewer queries than querying every window
+        on its own.
+        """
+        separate_queries = sum(
+            math.ceil(len(groups) / SNUBA_LIMIT) for groups in self.window_groups.values()
+        )
+        shared_queries = math.ceil(len(self.groups) / self.groups_per_query)
+        return shared_queries < separate_queries
+
+
+def plan_shared_series_queries(
+    windows: Mapping[QueryWindow, list[GroupValues]],
+) -> tuple[list[SharedSeriesQuery], dict[QueryWindow, list[GroupValues]]]:
+    """
+    Group windows that TSDB queries at the same rollup, and that are close
+    enough to each other, into shared series fetches. Returns the shared fetches
+    that are worth making, and the windows left to query on their own.
+    """
+    backend = tsdb.backend
+    rollup_windows: dict[int, list[QueryWindow]] = defaultdict(list)
+    for window in sorted(windows, key=lambda window: (window.start, window.end)):
+        rollup_windows[backend.get_optimal_rollup(window.start, window.end)].append(window)
+
+    shared_queries: list[SharedSeriesQuery] = []
+    separate_windows: dict[QueryWindow, list[GroupValues]] = {}
+    for rollup, sorted_windows in rollup_windows.items():
+        clusters: list[list[QueryWindow]] = []
+        for window in sorted_windows:
+            if clusters:
+                cluster = clusters[-1]
+                end = max(window.end, *(w.end for w in cluster))
+                span = int((end - cluster[0].start).total_seconds())
+                if span // rollup + 1 <= MAX_SERIES_BUCKETS:
+                    cluster.append(window)
+                    continue
+            clusters.append([window])
+
+        for cluster in clusters:
+            query = SharedSeriesQuery(
+                rollup=rollup,
+                window_buckets={
+                    window: backend.get_optimal_rollup_series(window.start, window.end, rollup)[1]
+                    for window in cluster
+                },
+                window_groups={window: windows[window] for window in cluster},
+            )
+            if len(cluster) > 1 and query.is_cheaper():
+                shared_queries.append(query)
+            else:
+                separate_windows.update(query.window_groups)
+
+    return shared_queries, separate_windows
+
+
 class TSDBFunction(Protocol):
     def __call__(
         self,
@@ -77,6 +181,8 @@ class InvalidFilter(Exception):
 class BaseEventFrequencyQueryHandler(ABC):
     intervals: ClassVar[dict[str, tuple[str, timedelta]]] = STANDARD_INTERVALS
     label_template = ""
+    # Whether `batch_query` can be given the groups of several projects of an organization.
+    multi_project: ClassVar[bool] = True
 
     @classmethod
     def render_label(cls, condition_data: dict[str, Any], organization_id: int) -> str:
@@ -343,20 +449,56 @@ class BaseEventFrequencyQueryHandler(ABC):
         The second query would be querying for num of events from:
             -  5 min ago to 1 hr 5 min ago
         """
-        if comparison_interval:
-            current_time -= comparison_interval
-        start, end = self.get_query_window(end=current_time, duration=duration)
+        window = self.get_rate_window(duration, current_time, comparison_interval)
 
         with self.disable_consistent_snuba_mode(duration):
             result = self.batch_query(
                 groups=groups,
-                start=start,
-                end=end,
+                start=window.start,
+                end=window.end,
                 environment_id=environment_id,
                 filters=filters,
             )
         return result
 
+    def get_rate_window(
+        self,
+        duration: timedelta,
+        current_time: datetime,
+        comparison_interval: timedelta | None,
+    ) -> QueryWindow:
+        """
+        The window `get_rate_bulk` queries, see there.
+        """
+        if comparison_interval:
+            current_time -= comparison_interval
+        start, end = self.get_query_window(end=current_time, duration=duration)
+        return QueryWindow(start=start, end=end)
+
+    def get_rate_bulk_windows(
+        self,
+        windows: Mapping[QueryWindow, list[GroupValues]],
+        environment_id: int | None,
+        filters: list[QueryFilter] | None,
+    ) -> dict[QueryWindow, QueryResult]:
+        """
+        Make batch queries for several windows of the same condition query, each
+        with its own groups. The return value maps every window to the result of
+        its groups. Handlers whose results can be derived from a shared time
+        series override this to make fewer queries.
+        """
+        results: dict[QueryWindow, QueryResult] = {}
+        for window, groups in windows.items():
+            with self.disable_consistent_snuba_mode(window.end - window.start):
+                results[window] = self.batch_query(
+                    groups=groups,
+                    start=window.start,
+                    end=window.end,
+                    environment_id=environment_id,
+                    filters=filters,
+                )
+        return results
+
 
 slow_condition_query_handler_registry = Registry[type[BaseEventFrequencyQueryHandler]](
     enable_reverse_lookup=False
@@ -410,6 +552,74 @@ class EventFrequencyQueryHandler(BaseEventFrequencyQueryHandler):
 
         return batch_sums
 
+    def get_rate_bulk_windows(
+        self,
+        windows: Mapping[QueryWindow, list[GroupValues]],
+        environment_id: int | None,
+        filters: list[QueryFilter] | None,
+    ) -> dict[QueryWindow, QueryResult]:
+        shared_queries, separate_windows = plan_shared_series_queries(windows)
+
+        results = super().get_rate_bulk_windows(separate_windows, environment_id, filters)
+        for query in shared_queries:
+            min_duration = min(window.end - window.start for window in query.window_buckets)
+            with self.disable_consistent_snuba_mode(min_duration):
+                results.update(self.shared_series_query(query, environment_id, filters))
+        return results
+
+    def shared_series_query(
+        self,
+        query: SharedSeriesQuery,
+        environment_id: int | None,
+        filters: list[QueryFilter] | None,
+    ) -> dict[QueryWindow, QueryResult]:
+        results: dict[QueryWindow, QueryResult] = {window: {} for window in query.window_buckets}
+        groups = query.groups
+        category_group_ids = self.get_group_ids_by_category(groups)
+        organization_id = self.get_value_from_groups(groups, "project__organization_id")
+        project_ids = list({g["project_id"] for g in groups})
+
+        if not organization_id:
+            return results
+
+        window_group_ids = {
+            window: {group["id"] for group in window_groups}
+            for window, window_groups in query.window_groups.items()
+        }
+
+        for category, issue_ids in category_group_ids.items():
+            model = get_issue_tsdb_group_model(category)
+            series: dict[int, dict[int, int]] = {}
+            try:
+                conditions = self.get_extra_snuba_conditions(model, filters) if filters else []
+                for group_chunk in chunked(issue_ids, query.groups_per_query):
+                    result = tsdb.backend.get_range(
+                        model=model,
+                        keys=group_chunk,
+                        start=query.start,
+                        end=query.end,
+                        rollup=query.rollup,
+                        environment_ids=[environment_id] if environment_id is not None else None,
+                        conditions=conditions,
+                        use_cache=True,
+                        tenant_ids={"organization_id": organization_id},
+                        referrer_suffix="wf_batch_alert_event_frequency_series",
+                        project_ids=project_ids,
+                    )
+                    series.update((key, dict(points)) for key, points in result.items())
+            except InvalidFilter:
+                # Filter is not supported for this issue type
+                # no events meet the query criteria
+                pass
+
+            for window, buckets in query.window_buckets.items():
+                for issue_id in issue_ids:
+                    if issue_id in window_group_ids[window]:
+                        counts = series.get(issue_id, {})
+                        results[window][issue_id] = sum(counts.get(bucket, 0) for bucket in buckets)
+
+        return results
+
 
 @slow_condition_query_handler_registry.register(Condition.EVENT_UNIQUE_USER_FREQUENCY_COUNT)
 @slow_condition_query_handler_registry.register(Condition.EVENT_UNIQUE_USER_FREQUENCY_PERCENT)
@@ -473,6 +683,8 @@ class EventUniqueUserFrequencyQueryHandler(BaseEventFrequencyQueryHandler):
 class PercentSessionsQueryHandler(BaseEventFrequencyQueryHandler):
     intervals: ClassVar[dict[str, tuple[str, timedelta]]] = PERCENT_INTERVALS
     label_template = "The issue affects more than {value} percent of sessions in {interval}"
+    # Session counts are per project.
+    multi_project: ClassVar[bool] = False
 
     @classmethod
     def render_label(cls, condition_data: dict[str, Any], organization_id: int) -> str:
@@ -14,7 +14,12 @@ from sentry.workflow_engine.processors.evaluations import (
     DataConditionEvaluationException,
 )
 from sentry.workflow_engine.registry import condition_handler_registry
-from sentry.workflow_engine.types import ConditionError, DataConditionResult, DetectorPriorityLevel
+from sentry.workflow_engine.types import (
+    ConditionError,
+    DataConditionHandler,
+    DataConditionResult,
+    DetectorPriorityLevel,
+)
 from sentry.workflow_engine.utils import scopedstats
 
 logger = logging.getLogger(__name__)
@@ -204,6 +209,11 @@ class DataCondition(DefaultFieldsModel):
             )
             return ConditionError(msg="No registration exists for condition")
 
+        return self._evaluate_handler(handler, value)
+
+    def _evaluate_handler(
+        self, handler: type[DataConditionHandler[Any]], value: T
+    ) -> DataConditionResult | ConditionError:
         should_be_fast = not is_slow_condition(self)
         try:
             with metrics.timer(
@@ -228,8 +238,6 @@ class DataCondition(DefaultFieldsModel):
         return result
 
     def evaluate_value(self, value: T) -> DataConditionEvaluation:
-        error: ConditionError | None = None
-
         try:
             condition_type = Condition(self.type)
 
@@ -245,6 +253,12 @@ class DataCondition(DefaultFieldsModel):
         if isinstance(result, bool):
             result = self.get_condition_result() if result else None
 
+        return self._build_evaluation(result, value)
+
+    def _build_evaluation(
+        self, result: DataConditionResult | ConditionError, value: T
+    ) -> DataConditionEvaluation:
+        error: ConditionError | None = None
         if isinstance(result, ConditionError):
             error = result
             result = None
@@ -1,11 +1,14 @@
 import logging
 from typing import TypeVar
 
+from sentry import options
 from sentry.utils.function_cache import cache_func_for_models
 from sentry.utils.tracing import trace
+from sentry.workflow_engine.caches.evaluation_plan import get_evaluation_plan
 from sentry.workflow_engine.models import DataCondition, DataConditionGroup
 from sentry.workflow_engine.models.data_condition import is_slow_condition
 from sentry.workflow_engine.processors.data_condition import split_conditions_by_speed
+from sentry.workflow_engine.processors.evaluation_plan import EvaluationPlan
 from sentry.workflow_engine.processors.evaluations import (
     DataConditionEvaluation,
     DataConditionGroupEvaluation,
@@ -152,6 +155,73 @@ def evaluate_data_conditions(
     return evaluate_condition_group_results(condition_evaluations, logic_type)
 
 
+@scopedstats.timer()
+def evaluate_plan(plan: EvaluationPlan, value: T) -> DataConditionGroupEvaluation:
+    """
+    Evaluate the fast conditions of a compiled plan against `value`, with the
+    same result as `evaluate_data_conditions`.
+    """
+    logic_type = plan.logic_type
+    condition_evaluations: list[tuple[int, DataConditionEvaluation]] = []
+
+    if not plan.conditions:
+        # if there are no conditions on the group, always return True.
+        return DataConditionGroupEvaluation(
+            result=True,
+            triggered=True,
+            data={
+                "condition_evaluations": [],
+                "logic_type": logic_type,
+            },
+        )
+
+    for compiled in plan.conditions:
+        evaluation = compiled.evaluate_value(value)
+
+        if evaluation.triggered:
+            match logic_type:
+                case DataConditionGroup.Type.ANY_SHORT_CIRCUIT:
+                    return DataConditionGroupEvaluation(
+                        result=True,
+                        triggered=True,
+                        error=evaluation.error,
+                        data={
+                            "condition_evaluations": [evaluation],
+                            "logic_type": logic_type,
+                        },
+                    )
+                case DataConditionGroup.Type.NONE:
+                    return DataConditionGroupEvaluation(
+                        result=False,
+                        triggered=False,
+                        error=evaluation.error,
+                        data={
+                            "condition_evaluations": [],
+                            "logic_type": logic_type,
+                        },
+                    )
+        elif logic_type == DataConditionGroup.Type.ALL and not evaluation.is_tainted():
+            # A clean failure decides an ALL group regardless of the errors of
+            # the other conditions, so the rest of them don't need to run.
+            return DataConditionGroupEvaluation(
+                result=False,
+                triggered=False,
+                data={
+                    "condition_evaluations": [],
+                    "logic_type": logic_type,
+                },
+            )
+
+        condition_evaluations.append((compiled.position, evaluation))
+
+    if plan.reordered:
+        condition_evaluations.sort(key=lambda item: item[0])
+
+    return evaluate_condition_group_results(
+        [evaluation for _, evaluation in condition_evaluations], logic_type
+    )
+
+
 def _resolve_group_conditions(group: DataConditionGroup) -> list[DataCondition]:
     if (
         hasattr(group, "_prefetched_objects_cache")
@@ -205,6 +275,10 @@ def process_data_condition_group(
         if data_conditions_for_group is None
         else data_conditions_for_group
     )
+
+    if options.get("workflow_engine.evaluation_plans_enabled"):
+        return _process_data_condition_group_plan(group.id, logic_type, all_conditions, value)
+
     conditions = split_conditions_by_speed(all_conditions)
 
     if not conditions.fast and conditions.slow:
@@ -227,3 +301,30 @@ def process_data_condition_group(
         return group_evaluation, []
 
     return group_evaluation, conditions.slow
+
+
+def _process_data_condition_group_plan(
+    group_id: int,
+    logic_type: DataConditionGroup.Type,
+    all_conditions: list[DataCondition],
+    value: T,
+) -> DataConditionGroupResult:
+    plan = get_evaluation_plan(group_id, logic_type, all_conditions)
+
+    if not plan.conditions and plan.slow_conditions:
+        # See `process_data_condition_group`.
+        return DataConditionGroupEvaluation(
+            result=False,
+            triggered=False,
+            data={
+                "condition_evaluations": [],
+                "logic_type": logic_type,
+            },
+        ), plan.slow_conditions
+
+    group_evaluation = evaluate_plan(plan, value)
+
+    if _is_conclusive_evaluation(group_evaluation):
+        return group_evaluation, []
+
+    return group_evaluation, plan.slow_conditions
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Iterable, Iterator, Mapping, Sequence
-from dataclasses import dataclass, field
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from functools import cached_property
 from typing import Any
@@ -13,7 +13,7 @@ from pydantic import BaseModel, validator
 from taskbroker_client.retry import retry_task
 from taskbroker_client.state import current_task
 
-from sentry import features, nodestore
+from sentry import features, nodestore, options
 from sentry.issues.issue_occurrence import IssueOccurrence
 from sentry.models.group import Group
 from sentry.models.organization import Organization
@@ -22,6 +22,7 @@ from sentry.rules.conditions.event_frequency import COMPARISON_INTERVALS
 from sentry.services.eventstore.models import Event, GroupEvent
 from sentry.tasks.post_process import should_retry_fetch
 from sentry.utils import metrics
+from sentry.utils.concurrent import ContextPropagatingThreadPoolExecutor
 from sentry.utils.iterators import chunked
 from sentry.utils.registry import NoRegistrationExistsError
 from sentry.utils.retries import ConditionalRetryPolicy, exponential_delay
@@ -36,6 +37,7 @@ from sentry.workflow_engine.handlers.condition.event_frequency_query_handlers im
     GroupValues,
     QueryFilter,
     QueryResult,
+    QueryWindow,
     slow_condition_query_handler_registry,
 )
 from sentry.workflow_engine.models import DataCondition, DataConditionGroup, Workflow
@@ -452,49 +454,317 @@ def get_condition_group_results(
         )
     )
 
-    last_try = False
-    if task := current_task():
-        last_try = not task.retries_remaining
+    last_try = _is_last_try()
+
+    if options.get("workflow_engine.delayed_workflow.shared_window_queries"):
+        families: dict[Hashable, list[_FamilyMember[UniqueConditionQuery]]] = defaultdict(list)
+        for unique_condition, time_and_groups in queries_to_groups.items():
+            families[_family_key(unique_condition)].append(
+                _FamilyMember(
+                    key=unique_condition,
+                    query=unique_condition,
+                    group_ids=time_and_groups.group_ids,
+                    time=time_and_groups.timestamp or current_time,
+                )
+            )
+        for family in families.values():
+            condition_group_results.update(_query_condition_family(family, all_groups, last_try))
+        return condition_group_results
 
     for unique_condition, time_and_groups in queries_to_groups.items():
-        handler = unique_condition.handler()
         group_ids = time_and_groups.group_ids
         groups_to_query = [group for group in all_groups if group["id"] in group_ids]
-        time = time_and_groups.timestamp or current_time
+        result = _query_condition(
+            unique_condition,
+            groups_to_query,
+            group_ids,
+            time_and_groups.timestamp or current_time,
+            last_try,
+        )
+        if result is not None:
+            condition_group_results[unique_condition] = result
+
+    return condition_group_results
+
+
+def _is_last_try() -> bool:
+    if task := current_task():
+        return not task.retries_remaining
+    return False
 
-        _, duration = handler.intervals[unique_condition.interval]
 
-        comparison_interval: timedelta | None = None
-        if unique_condition.comparison_interval is not None:
-            comparison_interval = COMPARISON_INTERVALS_VALUES.get(
-                unique_condition.comparison_interval
+def _query_condition(
+    unique_condition: UniqueConditionQuery,
+    groups_to_query: list[GroupValues],
+    group_ids: set[GroupId],
+    time: datetime,
+    last_try: bool,
+) -> QueryResult | None:
+    """
+    Run the Snuba query of a single unique condition. Returns None if the
+    query was rate limited on the last attempt of the task.
+    """
+    handler = unique_condition.handler()
+    duration, comparison_interval = _get_durations(handler, unique_condition)
+
+    try:
+        result = handler.get_rate_bulk(
+            duration=duration,
+            groups=groups_to_query,
+            environment_id=unique_condition.environment_id,
+            current_time=time,
+            comparison_interval=comparison_interval,
+            filters=unique_condition.filters,
+        )
+    except RateLimitExceeded as e:
+        # If we're on our final attempt and encounter a rate limit error, we log it and continue.
+        # The condition will evaluate as false, which may be wrong, but this is better for users
+        # than allowing the whole task to fail.
+        if last_try:
+            logger.info("delayed_workflow.snuba_rate_limit_exceeded", extra={"error": e})
+            return None
+        raise
+
+    absent_group_ids = group_ids - set(result.keys())
+    if absent_group_ids:
+        logger.warning(
+            "workflow_engine.delayed_workflow.absent_group_ids",
+            extra={"group_ids": absent_group_ids, "unique_condition": unique_condition},
+        )
+    return result
+
+
+def _get_durations(
+    handler: BaseEventFrequencyQueryHandler, unique_condition: UniqueConditionQuery
+) -> tuple[timedelta, timedelta | None]:
+    _, duration = handler.intervals[unique_condition.interval]
+
+    comparison_interval: timedelta | None = None
+    if unique_condition.comparison_interval is not None:
+        comparison_interval = COMPARISON_INTERVALS_VALUES.get(unique_condition.comparison_interval)
+
+    return duration, comparison_interval
+
+
+def _family_key(unique_condition: UniqueConditionQuery) -> Hashable:
+    """
+    Unique condition queries with the same key only differ in the windows they
+    query, and are planned together.
+    """
+    return (
+        unique_condition.handler,
+        unique_condition.environment_id,
+        unique_condition.frozen_filters,
+    )
+
+
+@dataclass(frozen=True)
+class _FamilyMember[K]:
+    key: K
+    query: UniqueConditionQuery
+    group_ids: set[GroupId]
+    time: datetime
+
+
+def _query_condition_family[K](
+    family: Sequence[_FamilyMember[K]],
+    all_groups: Sequence[GroupValues],
+    last_try: bool,
+) -> dict[K, QueryResult]:
+    """
+    Run the Snuba queries of a family of unique conditions together, letting
+    the handler derive their windows from shared fetches. Like
+    `_query_condition`, rate limits on the last attempt leave the results out.
+    """
+    first = family[0].query
+    handler = first.handler()
+
+    windows: dict[QueryWindow, list[GroupValues]] = {}
+    member_windows: list[tuple[_FamilyMember[K], QueryWindow]] = []
+    for member in family:
+        duration, comparison_interval = _get_durations(handler, member.query)
+        window = handler.get_rate_window(duration, member.time, comparison_interval)
+        window_group_ids = member.group_ids | {group["id"] for group in windows.get(window, [])}
+        windows[window] = [group for group in all_groups if group["id"] in window_group_ids]
+        member_windows.append((member, window))
+
+    try:
+        window_results = handler.get_rate_bulk_windows(
+            windows, environment_id=first.environment_id, filters=first.filters
+        )
+    except RateLimitExceeded as e:
+        if last_try:
+            logger.info("delayed_workflow.snuba_rate_limit_exceeded", extra={"error": e})
+            return {}
+        raise
+
+    results: dict[K, QueryResult] = {}
+    for member, window in member_windows:
+        result = {
+            group_id: value
+            for group_id, value in window_results[window].items()
+            if group_id in member.group_ids
+        }
+        absent_group_ids = member.group_ids - set(result.keys())
+        if absent_group_ids:
+            logger.warning(
+                "workflow_engine.delayed_workflow.absent_group_ids",
+                extra={"group_ids": absent_group_ids, "unique_condition": member.query},
             )
+        results[member.key] = result
+    return results
 
-        try:
-            result = handler.get_rate_bulk(
-                duration=duration,
-                groups=groups_to_query,
-                environment_id=unique_condition.environment_id,
-                current_time=time,
-                comparison_interval=comparison_interval,
-                filters=unique_condition.filters,
+
+@dataclass(frozen=True)
+class MergedConditionQuery:
+    """
+    A unique condition query shared by the projects of a multi-project batch.
+    Snuba queries are attributed to a single organization, so queries are only
+    merged within one, and handlers that query per project are never merged
+    across projects.
+    """
+
+    query: UniqueConditionQuery
+    organization_id: int
+    project_id: int | None = None
+
+    @classmethod
+    def for_project(cls, query: UniqueConditionQuery, project: Project) -> MergedConditionQuery:
+        return cls(
+            query=query,
+            organization_id=project.organization_id,
+            project_id=None if query.handler.multi_project else project.id,
+        )
+
+
+@dataclass(frozen=True)
+class QueryMergeStats:
+    projects: int
+    # The number of queries the projects would have made on their own.
+    project_queries: int
+    merged_queries: int
+
+    def record(self) -> None:
+        metrics.distribution("workflow_engine.delayed_workflow.merge.projects", self.projects)
+        metrics.distribution(
+            "workflow_engine.delayed_workflow.merge.project_queries", self.project_queries
+        )
+        metrics.distribution(
+            "workflow_engine.delayed_workflow.merge.merged_queries", self.merged_queries
+        )
+        logger.info("delayed_workflow.query_merge_stats", extra=asdict(self))
+
+
+@dataclass(frozen=True)
+class _ProjectBatch:
+    """
+    The state of a project between preparing its condition queries and
+    evaluating their results.
+    """
+
+    project: Project
+    event_data: EventRedisData
+    workflows_to_envs: Mapping[WorkflowId, int | None]
+    data_condition_groups: list[DataConditionGroup]
+    dcg_to_slow_conditions: dict[DataConditionGroupId, list[DataCondition]]
+    condition_groups: dict[UniqueConditionQuery, GroupQueryParams]
+    verbose: bool
+
+
+def merge_condition_query_groups(
+    batches: Sequence[_ProjectBatch],
+) -> dict[MergedConditionQuery, GroupQueryParams]:
+    """
+    Merge the identical condition queries of several projects, so each is only
+    made once for all of their groups.
+    """
+    merged: dict[MergedConditionQuery, GroupQueryParams] = defaultdict(GroupQueryParams)
+    for batch in batches:
+        for query, params in batch.condition_groups.items():
+            merged[MergedConditionQuery.for_project(query, batch.project)].update(
+                group_ids=params.group_ids, timestamp=params.timestamp
             )
-            absent_group_ids = group_ids - set(result.keys())
-            if absent_group_ids:
-                logger.warning(
-                    "workflow_engine.delayed_workflow.absent_group_ids",
-                    extra={"group_ids": absent_group_ids, "unique_condition": unique_condition},
-                )
-            condition_group_results[unique_condition] = result
-        except RateLimitExceeded as e:
-            # If we're on our final attempt and encounter a rate limit error, we log it and continue.
-            # The condition will evaluate as false, which may be wrong, but this is better for users
-            # than allowing the whole task to fail.
-            if last_try:
-                logger.info("delayed_workflow.snuba_rate_limit_exceeded", extra={"error": e})
-            else:
-                raise
+    return merged
+
+
+@metrics.wraps(
+    "workflow_engine.delayed_workflow.get_merged_condition_group_results",
+    sample_rate=1.0,
+)
+@trace
+def get_merged_condition_group_results(
+    queries_to_groups: dict[MergedConditionQuery, GroupQueryParams],
+    max_workers: int,
+) -> dict[MergedConditionQuery, QueryResult]:
+    """
+    Like `get_condition_group_results`, but runs up to `max_workers` queries
+    concurrently.
+    """
+    if not queries_to_groups:
+        return {}
+
+    current_time = timezone.now()
+    last_try = _is_last_try()
 
+    all_group_ids: set[GroupId] = set()
+    for time_and_groups in queries_to_groups.values():
+        all_group_ids.update(time_and_groups.group_ids)
+
+    all_groups: list[GroupValues] = list(
+        Group.objects.filter(id__in=all_group_ids).values(
+            "id", "type", "project_id", "project__organization_id"
+        )
+    )
+
+    # Without shared window queries, every family has a single member.
+    shared_windows = options.get("workflow_engine.delayed_workflow.shared_window_queries")
+    families: dict[Hashable, list[_FamilyMember[MergedConditionQuery]]] = defaultdict(list)
+    for merged_query, time_and_groups in queries_to_groups.items():
+        family_key = (
+            (merged_query.organization_id, merged_query.project_id, _family_key(merged_query.query))
+            if shared_windows
+            else merged_query
+        )
+        families[family_key].append(
+            _FamilyMember(
+                key=merged_query,
+                query=merged_query.query,
+                group_ids=time_and_groups.group_ids,
+                time=time_and_groups.timestamp or current_time,
+            )
+        )
+
+    with ContextPropagatingThreadPoolExecutor(
+        max_workers=max(1, min(max_workers, len(families)))
+    ) as executor:
+        futures = [
+            executor.submit(_query_condition_family, family, all_groups, last_try)
+            for family in families.values()
+        ]
+
+    condition_group_results: dict[MergedConditionQuery, QueryResult] = {}
+    for future in futures:
+        # Re-raises the first failure, we don't proceed with partial data.
+        condition_group_results.update(future.result())
+    return condition_group_results
+
+
+def _fan_back_results(
+    batch: _ProjectBatch,
+    merged_results: dict[MergedConditionQuery, QueryResult],
+) -> dict[UniqueConditionQuery, QueryResult]:
+    """
+    Returns the results of the merged queries for the groups of one project.
+    """
+    condition_group_results: dict[UniqueConditionQuery, QueryResult] = {}
+    for query, params in batch.condition_groups.items():
+        result = merged_results.get(MergedConditionQuery.for_project(query, batch.project))
+        if result is not None:
+            condition_group_results[query] = {
+                group_id: value
+                for group_id, value in result.items()
+                if group_id in params.group_ids
+            }
     return condition_group_results
 
 
@@ -912,12 +1182,16 @@ def _summarize_by_first[T1, T2: int | str](it: Iterable[tuple[T1, T2]]) -> dict[
     return {key: sorted(values) for key, values in result.items()}
 
 
-def _process_workflows_for_project(project: Project, event_data: EventRedisData) -> None:
-    """Process workflows for a project - evaluate conditions and fire actions."""
+def _prepare_project_batch(project: Project, event_data: EventRedisData) -> _ProjectBatch | None:
+    """
+    Fetch the workflows and conditions of a project and collect the condition
+    queries needed to evaluate them. Returns None if there is nothing to query.
+    """
     with start_span(op="delayed_workflow.prepare_data", name="delayed_workflow.prepare_data"):
-        if features.has(
+        verbose = features.has(
             "organizations:workflow-engine-process-workflows-logs", project.organization
-        ):
+        )
+        if verbose:
             log_context.set_verbose(True)
 
         original_count = len(event_data.events)
@@ -933,7 +1207,7 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
             )
 
         if not event_data.events:
-            return
+            return None
 
         data_condition_groups = fetch_data_condition_groups(list(event_data.dcg_ids))
         dcg_to_slow_conditions = get_slow_conditions_for_groups(list(event_data.dcg_ids))
@@ -963,7 +1237,7 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
         data_condition_groups, event_data, workflows_to_envs, dcg_to_slow_conditions
     )
     if not condition_groups:
-        return
+        return None
     logger.debug(
         "delayed_workflow.condition_query_groups",
         extra={
@@ -972,12 +1246,23 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
         },
     )
 
-    try:
-        condition_group_results = get_condition_group_results(condition_groups)
-    except SnubaError:
-        # We expect occasional errors, so we report as info and retry.
-        sentry_sdk.capture_exception(level="info")
-        retry_task()
+    return _ProjectBatch(
+        project=project,
+        event_data=event_data,
+        workflows_to_envs=workflows_to_envs,
+        data_condition_groups=data_condition_groups,
+        dcg_to_slow_conditions=dcg_to_slow_conditions,
+        condition_groups=condition_groups,
+        verbose=verbose,
+    )
+
+
+def _fire_project_batch(
+    batch: _ProjectBatch,
+    condition_group_results: dict[UniqueConditionQuery, QueryResult],
+) -> None:
+    """Evaluate the conditions of a project with the query results and fire actions."""
+    project = batch.project
 
     logger.debug(
         "delayed_workflow.condition_group_results",
@@ -988,11 +1273,11 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
 
     # Evaluate DCGs
     evaluation = get_groups_to_fire(
-        data_condition_groups,
-        workflows_to_envs,
-        event_data,
+        batch.data_condition_groups,
+        batch.workflows_to_envs,
+        batch.event_data,
         condition_group_results,
-        dcg_to_slow_conditions,
+        batch.dcg_to_slow_conditions,
     )
     metrics.incr(
         "workflow_engine.delayed_workflow.workflow_if_conditions_evaluated",
@@ -1017,7 +1302,7 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
     )
 
     group_to_groupevent = get_group_to_groupevent(
-        event_data,
+        batch.event_data,
         evaluation.groups_to_fire,
         project,
     )
@@ -1034,6 +1319,22 @@ def _process_workflows_for_project(project: Project, event_data: EventRedisData)
         )
 
 
+def _process_workflows_for_project(project: Project, event_data: EventRedisData) -> None:
+    """Process workflows for a project - evaluate conditions and fire actions."""
+    batch = _prepare_project_batch(project, event_data)
+    if batch is None:
+        return
+
+    try:
+        condition_group_results = get_condition_group_results(batch.condition_groups)
+    except SnubaError:
+        # We expect occasional errors, so we report as info and retry.
+        sentry_sdk.capture_exception(level="info")
+        retry_task()
+
+    _fire_project_batch(batch, condition_group_results)
+
+
 @trace
 def process_delayed_workflows(
     batch_client: DelayedWorkflowClient, project_id: int, batch_key: str | None = None
@@ -1062,3 +1363,62 @@ def process_delayed_workflows(
     # redis data and can delete it. If we fail, it'll raise and we'll either
     # read it again on retry or let it ttl out.
     cleanup_redis_buffer(project_client, event_keys, batch_key)
+
+
+@trace
+def process_delayed_workflows_for_projects(
+    batch_client: DelayedWorkflowClient, project_ids: list[int]
+) -> QueryMergeStats:
+    """
+    Like `process_delayed_workflows`, for the unbatched buffers of several
+    projects at once. The condition queries the projects have in common are
+    made once for all of them.
+    """
+    batches: list[tuple[_ProjectBatch, ProjectDelayedWorkflowClient, set[EventKey]]] = []
+
+    for project_id in project_ids:
+        with log_context.new_context(project_id=project_id):
+            project_client = batch_client.for_project(project_id)
+            redis_data = project_client.get_hash_data(None)
+            event_data = EventRedisData.from_redis_data(redis_data, continue_on_error=True)
+            event_keys = set(event_data.events.keys())
+
+            metrics.incr(
+                "workflow_engine.delayed_workflow",
+                amount=len(event_data.events),
+            )
+
+            project = fetch_project(project_id)
+            batch = _prepare_project_batch(project, event_data) if project else None
+            if batch is None:
+                # Nothing to query, we're done with this project.
+                cleanup_redis_buffer(project_client, event_keys, None)
+                continue
+            batches.append((batch, project_client, event_keys))
+
+    merged_queries = merge_condition_query_groups([batch for batch, _, _ in batches])
+    stats = QueryMergeStats(
+        projects=len(batches),
+        project_queries=sum(len(batch.condition_groups) for batch, _, _ in batches),
+        merged_queries=len(merged_queries),
+    )
+    stats.record()
+
+    try:
+        merged_results = get_merged_condition_group_results(
+            merged_queries,
+            max_workers=options.get("workflow_engine.delayed_workflow.query_concurrency"),
+        )
+    except SnubaError:
+        # We expect occasional errors, so we report as info and retry.
+        sentry_sdk.capture_exception(level="info")
+        retry_task()
+
+    for batch, project_client, event_keys in batches:
+        with log_context.new_context(verbose=batch.verbose, project_id=batch.project.id):
+            _fire_project_batch(batch, _fan_back_results(batch, merged_results))
+        # Clean up right away, so a retry caused by a later project doesn't
+        # fire the actions of this one again.
+        cleanup_redis_buffer(project_client, event_keys, None)
+
+    return stats
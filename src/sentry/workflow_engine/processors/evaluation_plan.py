@@ -0,0 +1,173 @@
+"""
+Compiled evaluation plans for DataConditionGroups.
+
+`DataCondition.evaluate_value` parses the condition type, looks up the handler
+and converts the condition result every time it evaluates a value. A plan does
+all of that once per version of a group, and orders the conditions of groups
+that are decided by their first failing condition so that the cheap ones run
+first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import partial
+from typing import Any
+
+from sentry.utils import registry
+from sentry.workflow_engine.models.data_condition import (
+    CONDITION_OPS,
+    Condition,
+    DataCondition,
+    is_slow_condition,
+)
+from sentry.workflow_engine.models.data_condition_group import DataConditionGroup
+from sentry.workflow_engine.processors.evaluations import (
+    DataConditionEvaluation,
+    DataConditionEvaluationException,
+)
+from sentry.workflow_engine.registry import condition_handler_registry
+from sentry.workflow_engine.types import ConditionError, DataConditionResult
+
+# Fast conditions whose handlers may query the database or cache.
+EXPENSIVE_CONDITIONS = frozenset(
+    [
+        Condition.ASSIGNED_TO,
+        Condition.LATEST_ADOPTED_RELEASE,
+        Condition.LATEST_RELEASE,
+    ]
+)
+
+
+class ConditionCost(IntEnum):
+    OPERATOR = 0
+    HANDLER = 1
+    EXPENSIVE_HANDLER = 2
+
+
+@dataclass(frozen=True)
+class CompiledCondition:
+    condition: DataCondition
+    #: The position of the condition in the group, as fetched.
+    position: int
+    cost: ConditionCost
+    evaluate_result: Callable[[Any], DataConditionResult | ConditionError]
+    condition_result: DataConditionResult | ConditionError
+
+    def evaluate_value(self, value: Any) -> DataConditionEvaluation:
+        """
+        Same as `DataCondition.evaluate_value`, with everything that does not
+        depend on `value` done ahead of time.
+        """
+        try:
+            result = self.evaluate_result(value)
+        except ValueError as ve:
+            raise DataConditionEvaluationException("Unable to evaluate condition") from ve
+
+        if isinstance(result, bool):
+            result = self.condition_result if result else None
+
+        return self.condition._build_evaluation(result, value)
+
+
+@dataclass(frozen=True)
+class EvaluationPlan:
+    version: Hashable
+    logic_type: DataConditionGroup.Type
+    #: The fast conditions of the group, in evaluation order.
+    conditions: tuple[CompiledCondition, ...]
+    #: The slow conditions of the group, which are evaluated later.
+    slow_conditions: list[DataCondition]
+    #: Whether `conditions` are not in their original order.
+    reordered: bool
+
+
+def get_plan_version(
+    logic_type: DataConditionGroup.Type, conditions: Sequence[DataCondition]
+) -> Hashable:
+    """
+    Identifies the state of a group a plan was compiled from. Any save of the
+    group's conditions bumps their `date_updated`.
+    """
+    return (logic_type, tuple((condition.id, condition.date_updated) for condition in conditions))
+
+
+def _compile_operator(
+    condition: DataCondition, condition_type: Condition
+) -> Callable[[Any], DataConditionResult | ConditionError]:
+    op = CONDITION_OPS[condition_type]
+    comparison = condition.comparison
+
+    def evaluate_result(value: Any) -> DataConditionResult | ConditionError:
+        try:
+            return op(value, comparison)
+        except TypeError:
+            # Let the condition report the invalid comparison.
+            return condition._evaluate_operator(condition_type, value)
+
+    return evaluate_result
+
+
+def compile_condition(condition: DataCondition, position: int) -> CompiledCondition:
+    condition_type = Condition(condition.type)
+
+    evaluate_result: Callable[[Any], DataConditionResult | ConditionError]
+    if condition_type in CONDITION_OPS:
+        cost = ConditionCost.OPERATOR
+        evaluate_result = _compile_operator(condition, condition_type)
+    else:
+        if condition_type in EXPENSIVE_CONDITIONS:
+            cost = ConditionCost.EXPENSIVE_HANDLER
+        else:
+            cost = ConditionCost.HANDLER
+
+        try:
+            handler = condition_handler_registry.get(condition_type)
+        except registry.NoRegistrationExistsError:
+            # Let the condition report the missing registration.
+            evaluate_result = partial(condition._evaluate_condition, condition_type)
+        else:
+            evaluate_result = partial(condition._evaluate_handler, handler)
+
+    return CompiledCondition(
+        condition=condition,
+        position=position,
+        cost=cost,
+        evaluate_result=evaluate_result,
+        condition_result=condition.get_condition_result(),
+    )
+
+
+def compile_evaluation_plan(
+    logic_type: DataConditionGroup.Type,
+    conditions: Sequence[DataCondition],
+    version: Hashable,
+) -> EvaluationPlan:
+    fast_conditions: list[CompiledCondition] = []
+    slow_conditions: list[DataCondition] = []
+
+    for condition in conditions:
+        if is_slow_condition(condition):
+            slow_conditions.append(condition)
+        else:
+            fast_conditions.append(compile_condition(condition, len(fast_conditions)))
+
+    reordered = False
+    if logic_type == DataConditionGroup.Type.ALL:
+        # Any untainted failure decides an ALL group, so it doesn't matter
+        # which condition fails first. The other logic types report the first
+        # triggered condition, so their order is kept.
+        fast_conditions.sort(key=lambda compiled: compiled.cost)
+        reordered = any(
+            compiled.position != position for position, compiled in enumerate(fast_conditions)
+        )
+
+    return EvaluationPlan(
+        version=version,
+        logic_type=logic_type,
+        conditions=tuple(fast_conditions),
+        slow_conditions=slow_conditions,
+        reordered=reordered,
+    )
@@ -2,12 +2,14 @@ import hashlib
 import logging
 import math
 import uuid
+from collections import defaultdict
 from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from itertools import islice
 
 from sentry import options
+from sentry.models.project import Project
 from sentry.utils import metrics
 from sentry.utils.iterators import chunked
 from sentry.workflow_engine.buffer.batch_client import (
@@ -15,7 +17,10 @@ from sentry.workflow_engine.buffer.batch_client import (
     DelayedWorkflowClient,
     ProjectDelayedWorkflowClient,
 )
-from sentry.workflow_engine.tasks.delayed_workflows import process_delayed_workflows
+from sentry.workflow_engine.tasks.delayed_workflows import (
+    process_delayed_workflows,
+    process_delayed_workflows_for_projects,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +32,18 @@ def bucket_num_groups(num_groups: int) -> str:
     return "1"
 
 
-def process_in_batches(client: ProjectDelayedWorkflowClient) -> None:
+def get_event_count(client: ProjectDelayedWorkflowClient) -> int:
+    event_count = client.get_hash_length()
+    metrics.incr(
+        "workflow_engine.schedule.num_groups", tags={"num_groups": bucket_num_groups(event_count)}
+    )
+    metrics.distribution("workflow_engine.schedule.event_count", event_count)
+    return event_count
+
+
+def process_in_batches(
+    client: ProjectDelayedWorkflowClient, event_count: int | None = None
+) -> None:
     """
     This will check the number of alertgroup_to_event_data items in the Redis buffer for a project.
 
@@ -44,11 +60,8 @@ def process_in_batches(client: ProjectDelayedWorkflowClient) -> None:
         "delayed_processing.batch_size"
     )  # TODO: Use workflow engine-specific option.
 
-    event_count = client.get_hash_length()
-    metrics.incr(
-        "workflow_engine.schedule.num_groups", tags={"num_groups": bucket_num_groups(event_count)}
-    )
-    metrics.distribution("workflow_engine.schedule.event_count", event_count)
+    if event_count is None:
+        event_count = get_event_count(client)
 
     if event_count < batch_size:
         return process_delayed_workflows.apply_async(
@@ -83,6 +96,77 @@ def process_in_batches(client: ProjectDelayedWorkflowClient) -> None:
             )
 
 
+def process_projects(buffer_client: DelayedWorkflowClient, project_ids: list[int]) -> None:
+    """
+    Schedule the processing of the buffered workflows of the given projects.
+
+    Projects with few enough events to be processed in a single batch are
+    grouped by organization, and each group is processed by one task which
+    merges the Snuba queries the projects have in common. Larger projects are
+    processed in batches on their own.
+    """
+    projects_per_task = options.get("workflow_engine.delayed_workflow.projects_per_task")
+    if projects_per_task <= 1:
+        for project_id in project_ids:
+            process_in_batches(buffer_client.for_project(project_id))
+        return
+
+    batch_size = options.get("delayed_processing.batch_size")
+    event_counts: dict[int, int] = {}
+    for project_id in project_ids:
+        client = buffer_client.for_project(project_id)
+        event_count = get_event_count(client)
+        if event_count < batch_size:
+            event_counts[project_id] = event_count
+        else:
+            process_in_batches(client, event_count)
+
+    project_to_org = dict(
+        Project.objects.filter(id__in=event_counts.keys()).values_list("id", "organization_id")
+    )
+    task_project_ids: list[list[int]] = []
+    org_to_project_ids: dict[int, list[int]] = defaultdict(list)
+    for project_id in sorted(event_counts):
+        organization_id = project_to_org.get(project_id)
+        if organization_id is None:
+            # Deleted projects are processed on their own, which cleans up their buffer.
+            task_project_ids.append([project_id])
+        else:
+            org_to_project_ids[organization_id].append(project_id)
+
+    for org_project_ids in org_to_project_ids.values():
+        # Keep the events of a task within a single batch.
+        chunk: list[int] = []
+        chunk_events = 0
+        for project_id in org_project_ids:
+            if chunk and (
+                len(chunk) >= projects_per_task
+                or chunk_events + event_counts[project_id] > batch_size
+            ):
+                task_project_ids.append(chunk)
+                chunk, chunk_events = [], 0
+            chunk.append(project_id)
+            chunk_events += event_counts[project_id]
+        if chunk:
+            task_project_ids.append(chunk)
+
+    for chunk in task_project_ids:
+        if len(chunk) == 1:
+            process_delayed_workflows.apply_async(
+                kwargs={"project_id": chunk[0]},
+                headers={"sentry-propagate-traces": False},
+            )
+        else:
+            process_delayed_workflows_for_projects.apply_async(
+                kwargs={"project_ids": chunk},
+                headers={"sentry-propagate-traces": False},
+            )
+    metrics.distribution(
+        "workflow_engine.schedule.merged_project_tasks",
+        sum(1 for chunk in task_project_ids if len(chunk) > 1),
+    )
+
+
 class ProjectChooser:
     """
     ProjectChooser assists in determining which projects to process based on the cohort updates.
@@ -238,8 +322,7 @@ def process_buffered_workflows(buffer_client: DelayedWorkflowClient) -> None:
                 extra={"project_ids": sorted(project_ids_to_process)},
             )
 
-            for project_id in project_ids_to_process:
-                process_in_batches(buffer_client.for_project(project_id))
+            process_projects(buffer_client, project_ids_to_process)
 
             mark_projects_processed(
                 buffer_client, project_ids_to_process, all_project_ids_and_timestamps
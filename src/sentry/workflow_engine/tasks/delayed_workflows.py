@@ -41,3 +41,34 @@ def process_delayed_workflows(
 
     with quiet_retriable_timeouts(), quiet_redis_noise():
         _process_delayed_workflows(batch_client, project_id, batch_key)
+
+
+@instrumented_task(
+    name="sentry.workflow_engine.tasks.delayed_workflows_for_projects",
+    namespace=workflow_engine_tasks,
+    processing_deadline_duration=120,
+    retry=Retry(
+        times=5,
+        delay=5,
+        on=(Exception,),
+    ),
+    silo_mode=SiloMode.CELL,
+)
+@log_context.root()
+def process_delayed_workflows_for_projects(
+    project_ids: list[int], *args: Any, **kwargs: Any
+) -> None:
+    """
+    Process the buffered workflows of several projects of an organization, sharing
+    the Snuba queries they have in common.
+    """
+    from sentry.workflow_engine.buffer.batch_client import DelayedWorkflowClient
+    from sentry.workflow_engine.processors.delayed_workflow import (
+        process_delayed_workflows_for_projects as _process_delayed_workflows_for_projects,
+    )
+
+    log_context.add_extras(project_ids=project_ids)
+    batch_client = DelayedWorkflowClient()
+
+    with quiet_retriable_timeouts(), quiet_redis_noise():
+        _process_delayed_workflows_for_projects(batch_client, project_ids)
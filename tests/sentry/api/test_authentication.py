@@ -40,7 +40,12 @@ from sentry.testutils.auth import generate_service_request_signature
 from sentry.testutils.cases import TestCase
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.requests import drf_request_from_request
-from sentry.testutils.silo import assume_test_silo_mode, control_silo_test, no_silo_test
+from sentry.testutils.silo import (
+    assume_test_silo_mode,
+    cell_silo_test,
+    control_silo_test,
+    no_silo_test,
+)
 from sentry.types.token import AuthTokenType
 from sentry.utils import jwt
 from sentry.utils.security.orgauthtoken_token import hash_token
@@ -388,6 +393,75 @@ class TestTokenAuthentication(TestCase):
         mock_metric.assert_called_once_with("token_auth")
 
 
+@cell_silo_test
+class TestTokenAuthenticationReplica(TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.auth = UserAuthTokenAuthentication()
+        with assume_test_silo_mode(SiloMode.CONTROL):
+            self.api_token = ApiToken.objects.create(
+                token_type=AuthTokenType.USER,
+                user=self.user,
+            )
+        self.token = self.api_token.plaintext_token
+
+    def _authenticate(self) -> tuple[object, object]:
+        request = _drf_request()
+        request.META["HTTP_AUTHORIZATION"] = f"Bearer {self.token}"
+        result = self.auth.authenticate(request)
+        assert result is not None
+        return result
+
+    def test_replica_lookup_is_cached(self) -> None:
+        _, auth = self._authenticate()
+        assert isinstance(auth, ApiTokenReplica)
+        assert auth.apitoken_id == self.api_token.id
+
+        with self.assertNumQueries(0):
+            cached = self.auth._find_or_update_token_by_hash(self.token)
+        assert cached == auth
+
+    def test_replica_delete_invalidates_cache(self) -> None:
+        self._authenticate()
+
+        ApiTokenReplica.objects.filter(apitoken_id=self.api_token.id).delete()
+
+        with pytest.raises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_replica_update_invalidates_cache_on_commit(self) -> None:
+        self._authenticate()
+        replica = ApiTokenReplica.objects.get(apitoken_id=self.api_token.id)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            replica.update(expires_at=datetime.now(UTC) - timedelta(days=1))
+
+        with self.assertNumQueries(0):
+            self.auth._find_or_update_token_by_hash(self.token)
+
+        # Drops whatever a concurrent request cached before the update committed
+        for callback in callbacks:
+            callback()
+
+        with self.assertNumQueries(1):
+            cached = self.auth._find_or_update_token_by_hash(self.token)
+        assert cached.is_expired()
+        with pytest.raises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_stale_replica_cache_entry_is_not_trusted(self) -> None:
+        _, auth = self._authenticate()
+        assert isinstance(auth, ApiTokenReplica)
+        stale = ApiTokenReplica(id=auth.id, hashed_token="stale", user_id=auth.user_id)
+
+        with mock.patch.object(ApiTokenReplica.objects, "get_from_cache", return_value=stale):
+            found = self.auth._find_or_update_token_by_hash(self.token)
+
+        assert found == auth
+        assert found.hashed_token == auth.hashed_token
+
+
 @control_silo_test
 class TestOrgScopedAppTokenAuthentication(TestCase):
     def setUp(self) -> None:
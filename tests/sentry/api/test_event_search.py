@@ -15,6 +15,7 @@ from sentry.api.event_search import (
     SearchFilter,
     SearchKey,
     SearchValue,
+    _parse_search_tree,
     _RecursiveList,
     add_leading_wildcard,
     add_trailing_wildcard,
@@ -319,6 +320,29 @@ class ParseSearchQueryBackendTest(SimpleTestCase):
             ),
         ]
 
+    def test_parse_tree_cached_across_configs(self) -> None:
+        query = "someValue:123 OR other:456"
+        _parse_search_tree.cache_clear()
+
+        assert parse_search_query(query) == [
+            SearchFilter(key=SearchKey(name="someValue"), operator="=", value=SearchValue("123")),
+            "OR",
+            SearchFilter(key=SearchKey(name="other"), operator="=", value=SearchValue("456")),
+        ]
+
+        # The cached tree is visited again with the new config.
+        config = SearchConfig(key_mappings={"target_value": ["someValue"]})
+        assert parse_search_query(query, config=config)[0] == SearchFilter(
+            key=SearchKey(name="target_value"), operator="=", value=SearchValue("123")
+        )
+        bool_disabled = SearchConfig.create_from(default_config, allow_boolean=False)
+        with pytest.raises(InvalidSearchQuery):
+            parse_search_query(query, config=bool_disabled)
+
+        cache_info = _parse_search_tree.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 2
+
     def test_bare_duration_treated_as_tag(self) -> None:
         """Bare `duration:>3s` is not a duration key — it should parse as a text
         filter so that column resolution sends it to `tags[duration]` instead of
@@ -0,0 +1,39 @@
+from types import ModuleType
+
+import pytest
+
+from sentry.api.event_search import _parse_search_tree, parse_search_query
+from sentry.testutils.skips import requires_pytest_benchmark
+
+QUERIES = [
+    "event.type:transaction transaction:/api/0/organizations/*/events/ "
+    "!transaction.op:[http.server,queue.task] http.method:GET "
+    "(user.email:*@example.com OR user.id:[1,2,3,4]) "
+    "measurements.lcp:>2.5s transaction.duration:>300ms "
+    'release:"frontend@1.2.3" has:profile.id environment:production',
+    "is:unresolved is:for_review assigned_or_suggested:[me, my_teams, none] "
+    "!issue.category:feedback level:[error,fatal] firstSeen:-24h "
+    "timesSeen:>10 lastSeen:-1h error.handled:false "
+    'message:"Connection reset by peer" os.name:[Linux,Windows] browser.name:Chrome*',
+    "span.op:db span.description:*SELECT*FROM*users* span.duration:>100ms "
+    "(span.action:SELECT OR span.action:UPDATE) !span.status:ok "
+    "project.id:[1,2,3] "
+    "sdk.name:sentry.python* device.class:[high,medium] user.geo.country_code:US",
+]
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+def test_benchmark_parse_search_query(cached: bool, benchmark: ModuleType) -> None:
+    def setup() -> tuple[tuple[()], dict[str, object]]:
+        if not cached:
+            _parse_search_tree.cache_clear()
+        return (), {}
+
+    def run() -> None:
+        for query in QUERIES:
+            parse_search_query(query)
+
+    # Warm the cache for the cached run; the uncached run clears it every round.
+    run()
+    benchmark.pedantic(run, setup=setup, rounds=200)
@@ -1,3 +1,5 @@
+import tempfile
+from hashlib import sha1
 from typing import Any, Iterable, cast
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
@@ -7,15 +9,18 @@ from django.http import StreamingHttpResponse
 from django.urls import reverse
 
 from sentry.data_export.base import ExportQueryType
-from sentry.data_export.models import ExportedData
+from sentry.data_export.models import ExportedData, ExportedDataBlob
 from sentry.data_export.tasks import (
     assemble_download,
     merge_export_blobs,
     recoverable_retry_countdown,
+    store_export_chunk_as_blob,
 )
 from sentry.data_export.writers import OutputMode
 from sentry.exceptions import InvalidSearchQuery
 from sentry.models.files.file import File
+from sentry.models.files.fileblob import FileBlob
+from sentry.models.files.fileblobindex import FileBlobIndex
 from sentry.search.events.constants import TIMEOUT_ERROR_MESSAGE
 from sentry.testutils.cases import (
     OurLogTestCase,
@@ -1804,3 +1809,56 @@ class AssembleDownloadExploreTest(
 class MergeExportBlobsTest(TestCase, SnubaTestCase):
     def test_task_persistent_name(self) -> None:
         assert merge_export_blobs.name == "sentry.data_export.tasks.merge_blobs"
+
+    def store_blobs(self, contents: bytes) -> ExportedData:
+        user = self.create_user()
+        org = self.create_organization()
+        project = self.create_project(organization=org)
+        de = ExportedData.objects.create(
+            user_id=user.id,
+            organization=org,
+            query_type=ExportQueryType.DISCOVER,
+            query_info={"project": [project.id], "field": ["title"], "query": ""},
+        )
+        with tempfile.TemporaryFile() as tf:
+            tf.write(contents)
+            tf.seek(0)
+            assert store_export_chunk_as_blob(de, 0, tf, blob_size=64) == len(contents)
+        return de
+
+    def get_blobs(self, de: ExportedData) -> list[FileBlob]:
+        return list(
+            FileBlob.objects.filter(
+                id__in=ExportedDataBlob.objects.filter(data_export=de).values("blob_id")
+            )
+        )
+
+    @patch("sentry.data_export.models.ExportedData.email_success")
+    def test_merges_blobs(self, emailer: MagicMock) -> None:
+        contents = b"title\n" + b"".join(b"row-%d\n" % i for i in range(100))
+        de = self.store_blobs(contents)
+        blobs = self.get_blobs(de)
+        assert len(blobs) > 1
+
+        merge_export_blobs(de.id)
+
+        de = ExportedData.objects.get(id=de.id)
+        file = de._get_file()
+        assert isinstance(file, File)
+        assert file.size == len(contents)
+        assert file.checksum == sha1(contents).hexdigest()
+        assert FileBlobIndex.objects.filter(file=file).count() == len(blobs)
+        with file.getfile() as f:
+            assert f.read() == contents
+        assert emailer.called
+
+    @patch("sentry.data_export.models.ExportedData.email_failure")
+    def test_rejects_blob_checksum_mismatch(self, emailer: MagicMock) -> None:
+        de = self.store_blobs(b"title\n" + b"".join(b"row-%d\n" % i for i in range(100)))
+        blob = self.get_blobs(de)[0]
+        blob.update(checksum=sha1(b"something else").hexdigest())
+
+        merge_export_blobs(de.id)
+
+        assert ExportedData.objects.get(id=de.id).file_id is None
+        assert emailer.called
@@ -0,0 +1,44 @@
+import io
+
+from sentry.data_export.writers import FileWriter, OutputMode
+
+ROWS = [
+    {"id": 1, "title": "héllo, world", "message": 'quoted "value"'},
+    {"id": 2, "title": "multi\nline", "message": None},
+]
+
+
+def _write_rows(output_mode: OutputMode, batched: bool) -> bytes:
+    buffer = io.BytesIO()
+    writer = FileWriter(
+        buffer=buffer,
+        output_mode=output_mode,
+        csv_headers=["id", "title"],
+        escapechar="\\",
+        extrasaction="ignore",
+    )
+    writer.writeheader()
+    if batched:
+        writer.writerows(ROWS)
+    else:
+        for row in ROWS:
+            writer.writerow(row)
+    return buffer.getvalue()
+
+
+def test_writerows_csv_matches_writerow() -> None:
+    output = _write_rows(OutputMode.CSV, batched=True)
+    assert output == _write_rows(OutputMode.CSV, batched=False)
+    assert output.decode("utf-8").startswith('id,title\r\n1,"héllo, world"\r\n')
+
+
+def test_writerows_jsonl_matches_writerow() -> None:
+    output = _write_rows(OutputMode.JSONL, batched=True)
+    assert output == _write_rows(OutputMode.JSONL, batched=False)
+    assert output.count(b"\n") == len(ROWS)
+
+
+def test_writerows_empty() -> None:
+    buffer = io.BytesIO()
+    FileWriter(buffer=buffer, output_mode=OutputMode.CSV).writerows([])
+    assert buffer.getvalue() == b""
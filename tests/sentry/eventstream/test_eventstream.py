@@ -452,6 +452,22 @@ class SnubaEventStreamTest(TestCase, SnubaTestCase, OccurrenceTestMixin):
         assert "occurrence_id" not in dict(headers)
         assert body
 
+    @override_options({"nodestore.encode-payload-once": True})
+    @patch("sentry.eventstream.backend.insert", autospec=True)
+    def test_reuses_encoded_payload(self, mock_eventstream_insert: MagicMock) -> None:
+        event = self.__build_event(timezone.now())
+        assert event.data.encoded is not None
+
+        insert_args, insert_kwargs = list(mock_eventstream_insert.call_args)
+        self.kafka_eventstream.insert(*insert_args, **insert_kwargs)
+
+        produce_args, produce_kwargs = list(self.producer_mock.produce.call_args)
+        _, _, payload1, _ = json.loads(produce_kwargs["payload"].value)
+        assert payload1["data"] == json.loads(json.dumps(event.get_raw_data(for_stream=True)))
+
+        event.data["extra"] = {"foo": "bar"}
+        assert event.data.encoded is None
+
     @patch("sentry.eventstream.backend.insert", autospec=True)
     def test_transaction(self, mock_eventstream_insert: MagicMock) -> None:
         event = self.__build_transaction_event()
@@ -23,6 +23,7 @@ from sentry.grouping.enhancer import (
 from sentry.grouping.enhancer.exceptions import InvalidEnhancerConfig
 from sentry.grouping.enhancer.parser import parse_enhancements
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import InstaSnapshotter
 
 
@@ -158,6 +159,44 @@ def test_app_no_matches(frame: dict[str, Any]) -> None:
     assert frame.get("in_app") is True
 
 
+@override_options({"grouping.enhancements.frame_results_cache": True})
+def test_frame_results_cache() -> None:
+    enhancements = EnhancementsConfig.from_rules_text(
+        """
+        function:roll_over category=trick
+        function:play_dead -app
+    """
+    )
+
+    def make_frames() -> list[dict[str, Any]]:
+        return [{"function": "roll_over"}, {"function": "play_dead", "in_app": True}]
+
+    with mock.patch.object(
+        enhancements,
+        "classifier_rust_enhancements",
+        wraps=enhancements.classifier_rust_enhancements,
+    ) as rust_enhancements_spy:
+        apply_modifications_spy = rust_enhancements_spy.apply_modifications_to_frames
+
+        first_frames = make_frames()
+        enhancements.apply_category_and_updated_in_app_to_frames(first_frames, "native", {})
+        second_frames = make_frames()
+        enhancements.apply_category_and_updated_in_app_to_frames(second_frames, "native", {})
+
+        # the second stacktrace is identical, so it's not matched against the rules again
+        assert apply_modifications_spy.call_count == 1
+        assert second_frames == first_frames
+        assert second_frames[0]["data"]["category"] == "trick"
+        assert second_frames[1]["in_app"] is False
+
+        # a different exception may match different rules
+        third_frames = make_frames()
+        enhancements.apply_category_and_updated_in_app_to_frames(
+            third_frames, "native", {"type": "ValueError"}
+        )
+        assert apply_modifications_spy.call_count == 2
+
+
 @pytest.mark.parametrize(
     "test_input,expected",
     [
@@ -17,7 +17,7 @@ from sentry.hybridcloud.models.outbox import (
     outbox_context,
 )
 from sentry.hybridcloud.outbox.category import OutboxCategory, OutboxScope
-from sentry.hybridcloud.tasks.deliver_from_outbox import enqueue_outbox_jobs
+from sentry.hybridcloud.tasks.deliver_from_outbox import enqueue_outbox_jobs, process_outbox_batch
 from sentry.models.organization import Organization
 from sentry.models.organizationmember import OrganizationMember
 from sentry.models.projectkey import ProjectKey
@@ -164,6 +164,71 @@ class OutboxDrainTest(TransactionTestCase):
 
             assert mock_send.call_count == 1
 
+    @patch("sentry.hybridcloud.models.outbox.process_cell_outbox.send")
+    def test_process_outbox_batch_concurrently(self, mock_send: Mock) -> None:
+        with outbox_context(flush=False):
+            for org_id in range(1, 6):
+                for _ in range(org_id):
+                    Organization(id=org_id).outbox_for_update().save()
+
+        with self.options(
+            {
+                "hybridcloud.outbox.drain_workers": 3,
+                "hybridcloud.outbox.drain_scope_concurrency": {"ORGANIZATION_SCOPE": 2},
+            }
+        ):
+            processed = process_outbox_batch(
+                outbox_identifier_hi=CellOutbox.objects.latest("id").id + 1,
+                outbox_identifier_low=0,
+                outbox_model=CellOutbox,
+            )
+
+        assert processed == 5
+        assert mock_send.call_count == 5
+        assert not CellOutbox.objects.exists()
+
+    def test_process_outbox_batch_concurrently_defers_capped_scopes(self) -> None:
+        org_scope = OutboxScope.ORGANIZATION_SCOPE.value
+        user_scope = OutboxScope.USER_SCOPE.value
+        shards = [
+            {"shard_scope": org_scope, "shard_identifier": 1, "depth": 5},
+            {"shard_scope": org_scope, "shard_identifier": 2, "depth": 4},
+            {"shard_scope": user_scope, "shard_identifier": 3, "depth": 1},
+        ]
+        user_shard_drained = threading.Event()
+        drained: list[tuple[int, int]] = []
+
+        def drain_next_from_shard(outbox_model: Any, shard_attributes: dict[str, int]) -> bool:
+            # The first organization shard only finishes once the user shard, which is
+            # queued behind the second organization shard, has been drained.
+            if shard_attributes["shard_identifier"] == 1:
+                assert user_shard_drained.wait(timeout=5)
+            if shard_attributes["shard_scope"] == user_scope:
+                user_shard_drained.set()
+            drained.append((shard_attributes["shard_scope"], shard_attributes["shard_identifier"]))
+            return True
+
+        with (
+            self.options(
+                {
+                    "hybridcloud.outbox.drain_workers": 2,
+                    "hybridcloud.outbox.drain_scope_concurrency": {"ORGANIZATION_SCOPE": 1},
+                }
+            ),
+            patch.object(CellOutbox, "find_scheduled_shards", return_value=shards),
+            patch(
+                "sentry.hybridcloud.tasks.deliver_from_outbox._drain_next_from_shard",
+                side_effect=drain_next_from_shard,
+            ),
+        ):
+            processed = process_outbox_batch(
+                outbox_identifier_hi=1, outbox_identifier_low=0, outbox_model=CellOutbox
+            )
+
+        assert processed == 3
+        assert sorted(drained) == [(org_scope, 1), (org_scope, 2), (user_scope, 3)]
+        assert drained.index((user_scope, 3)) < drained.index((org_scope, 1))
+
     def test_drain_shard_not_flush_all__upper_bound(self) -> None:
         outbox1 = Organization(id=1).outbox_for_update()
         outbox2 = Organization(id=1).outbox_for_update()
@@ -656,5 +721,24 @@ class OutboxAggregationTest(TestCase):
         assert ControlOutbox.objects.count() == 0
         assert ControlOutbox.get_shard_depths_descending() == []
 
+    def test_find_scheduled_shards_with_depth(self) -> None:
+        shard_depths = {
+            row["shard_identifier"]: row["depth"]
+            for row in ControlOutbox.find_scheduled_shards(with_depth=True)
+        }
+        assert shard_depths == {1: 4, 2: 7, 3: 1}
+
+        # Depths only count the messages within the requested id range
+        ids = sorted(ControlOutbox.objects.filter(shard_identifier=2).values_list("id", flat=True))
+        rows = ControlOutbox.find_scheduled_shards(low=ids[0], hi=ids[3], with_depth=True)
+        assert rows == [
+            dict(
+                shard_identifier=2,
+                cell_name="us",
+                shard_scope=OutboxScope.AUDIT_LOG_SCOPE.value,
+                depth=3,
+            )
+        ]
+
     def test_total_count(self) -> None:
         assert ControlOutbox.get_total_outbox_count() == 7 + 4 + 1
@@ -10,7 +10,11 @@ from sentry.hybridcloud.rpc.caching import (
     cell_caching_service,
     control_caching_service,
 )
-from sentry.hybridcloud.rpc.caching.impl import CacheBackend, _consume_generator
+from sentry.hybridcloud.rpc.caching.impl import (
+    CacheBackend,
+    _consume_generator,
+    clear_local_cache,
+)
 from sentry.organizations.services.organization.model import (
     RpcOrganizationMember,
     RpcOrganizationSummary,
@@ -18,6 +22,7 @@ from sentry.organizations.services.organization.model import (
 from sentry.organizations.services.organization.service import organization_service
 from sentry.silo.base import SiloMode
 from sentry.testutils.factories import Factories
+from sentry.testutils.helpers import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.testutils.silo import assume_test_silo_mode, control_silo_test, no_silo_test
 from sentry.types.cell import get_local_cell
@@ -330,3 +335,31 @@ def test_caching_list() -> None:
 
     cached_members = get_org_members(org.id)
     assert len(cached_members) == 0, "with members updated none are owners"
+
+
+@django_db_all(transaction=True)
+@no_silo_test
+def test_local_cache_tier() -> None:
+    cache.clear()
+    clear_local_cache()
+
+    key = "my-local-key"
+    with override_options({"hybridcloud.caching.local-tier.enabled": True}):
+        version = _consume_generator(CacheBackend.get_cache([key], SiloMode.CELL))[key]
+        assert isinstance(version, int)
+        assert _consume_generator(CacheBackend.set_cache(key, "a", version))
+
+        # Served from process memory even when the shared cache loses the value
+        cache.clear()
+        assert _consume_generator(CacheBackend.get_cache([key], SiloMode.CELL)) == {key: "a"}
+
+        # Bumping the version invalidates the local entry
+        new_version = _consume_generator(CacheBackend.delete_cache(key, SiloMode.CELL))
+        assert _consume_generator(CacheBackend.get_cache([key], SiloMode.CELL)) == {
+            key: new_version
+        }
+
+        assert _consume_generator(CacheBackend.set_cache(key, "b", new_version))
+        assert _consume_generator(CacheBackend.get_cache([key], SiloMode.CELL)) == {key: "b"}
+
+    clear_local_cache()
@@ -17,6 +17,7 @@ from sentry.hybridcloud.rpc.service import (
     _RemoteSiloCall,
     dispatch_remote_call,
     dispatch_to_local_service,
+    rpc_memoization_scope,
 )
 from sentry.models.organizationmapping import OrganizationMapping
 from sentry.organizations.services.organization import (
@@ -200,6 +201,41 @@ class DispatchRemoteCallTest(TestCase):
         result = org_service_delgn.get_org_by_slug(slug="this_is_not_a_valid_slug")
         assert result is None
 
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.CELL)
+    @override_options(
+        {"hybrid_cloud.rpc.memoized-service-methods": ["organization.get_organization_by_id"]}
+    )
+    def test_memoized_rpc_method(self) -> None:
+        org = self.create_organization()
+        response_value = RpcUserOrganizationContext(organization=serialize_rpc_organization(org))
+        self._set_up_mock_response("organization/get_organization_by_id", response_value.dict())
+
+        with rpc_memoization_scope():
+            first = dispatch_remote_call(
+                None, "organization", "get_organization_by_id", {"id": org.id}
+            )
+            second = dispatch_remote_call(
+                None, "organization", "get_organization_by_id", {"id": org.id}
+            )
+        assert first == second == response_value
+        assert first is not second
+        assert len(responses.calls) == 1
+
+        # Outside of a scope every call goes to the remote silo.
+        dispatch_remote_call(None, "organization", "get_organization_by_id", {"id": org.id})
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    @override_settings(SILO_MODE=SiloMode.CELL)
+    def test_memoization_requires_opt_in(self) -> None:
+        self._set_up_mock_response("organization/get_organization_by_id", None)
+
+        with rpc_memoization_scope():
+            for _ in range(2):
+                dispatch_remote_call(None, "organization", "get_organization_by_id", {"id": 0})
+        assert len(responses.calls) == 2
+
     @override_options(
         {"hybrid_cloud.rpc.disabled-service-methods": ["organization.get_organization_by_id"]}
     )
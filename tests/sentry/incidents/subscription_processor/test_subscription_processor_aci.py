@@ -11,7 +11,7 @@ from django.utils import timezone
 from urllib3.response import HTTPResponse
 
 from sentry.constants import ObjectStatus
-from sentry.incidents.subscription_processor import SubscriptionProcessor
+from sentry.incidents.subscription_processor import SubscriptionProcessor, get_stored_aggregate
 from sentry.incidents.utils.types import QuerySubscriptionUpdate
 from sentry.seer.anomaly_detection.types import (
     AnomalyDetectionSeasonality,
@@ -27,6 +27,7 @@ from sentry.snuba.models import QuerySubscription, SnubaQuery
 from sentry.testutils.cases import BaseMetricsTestCase
 from sentry.testutils.factories import DEFAULT_EVENT_DATA
 from sentry.testutils.helpers.features import with_feature
+from sentry.testutils.helpers.options import override_options
 from sentry.workflow_engine.models.data_condition import Condition, DataCondition
 from sentry.workflow_engine.models.detector import Detector
 from sentry.workflow_engine.types import DetectorPriorityLevel
@@ -243,6 +244,28 @@ class ProcessUpdateComparisonAlertTest(ProcessUpdateBaseClass):
         self.send_update(6, timedelta(minutes=-5))
         assert self.get_detector_state(detector) == DetectorPriorityLevel.OK
 
+    @override_options({"incidents.subscription_processor.aggregate_history.enabled": True})
+    def test_comparison_alert_from_aggregate_history(self) -> None:
+        detector = self.comparison_detector_above
+        comparison_delta = timedelta(seconds=detector.config["comparison_delta"])
+        # The update covering the comparison period of the next one
+        self.send_update(4, timedelta(minutes=-10) - comparison_delta)
+        assert self.get_detector_state(detector) == DetectorPriorityLevel.OK
+
+        with patch(
+            "sentry.incidents.subscription_processor.get_comparison_aggregation_value"
+        ) as mock_comparison_query:
+            self.send_update(7, timedelta(minutes=-10))
+        # Should trigger: 7/4 == 175% > 150%, without querying the comparison period
+        assert self.get_detector_state(detector) == DetectorPriorityLevel.HIGH
+        mock_comparison_query.assert_not_called()
+
+        # Changing the query discards the history
+        comparison_timestamp = (timezone.now() - timedelta(minutes=10)).replace(microsecond=0)
+        assert get_stored_aggregate(self.sub, comparison_timestamp) == 7
+        self.sub.snuba_query.update(query="level:error")
+        assert get_stored_aggregate(self.sub, comparison_timestamp) is None
+
     @patch("sentry.incidents.utils.process_update_helpers.metrics")
     def test_comparison_alert_below(self, helper_metrics):
         detector = self.comparison_detector_below
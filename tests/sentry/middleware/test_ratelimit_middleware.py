@@ -16,6 +16,7 @@ from sentry.ratelimits.config import RateLimitConfig, get_default_rate_limits_fo
 from sentry.ratelimits.utils import get_rate_limit_config, get_rate_limit_value
 from sentry.testutils.cases import APITestCase, BaseTestCase, TestCase
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.silo import all_silo_test, assume_test_silo_mode_of
 from sentry.types.ratelimit import RateLimit, RateLimitCategory
 from sentry.users.models.user import User
@@ -555,6 +556,10 @@ class TestRatelimitHeader(APITestCase):
             assert int(response["X-Sentry-Rate-Limit-Limit"]) == 2
             assert int(response["X-Sentry-Rate-Limit-Reset"]) == expected_reset_time
 
+    @override_options({"api.rate-limit.single-round-trip": True})
+    def test_header_counts_single_round_trip(self) -> None:
+        self.test_header_counts()
+
     @patch("sentry.middleware.ratelimit.get_rate_limit_key")
     def test_omit_header(self, can_be_ratelimited_patch: MagicMock) -> None:
         """
@@ -606,6 +611,26 @@ class TestConcurrentRateLimiter(APITestCase):
             )
             assert int(response["X-Sentry-Rate-Limit-ConcurrentLimit"]) == CONCURRENT_RATE_LIMIT
 
+    @override_options({"api.rate-limit.single-round-trip": True})
+    def test_request_finishes_single_round_trip(self) -> None:
+        self.test_request_finishes()
+
+    @patch("sentry.middleware.ratelimit.finish_request")
+    def test_request_not_finished_when_window_limited(self, finish_request: MagicMock) -> None:
+        with patch.object(
+            ConcurrentRateLimitedEndpoint,
+            "rate_limits",
+            RateLimitConfig(
+                group="foo",
+                limit_overrides={"GET": {RateLimitCategory.IP: RateLimit(1, 100, 1)}},
+            ),
+        ):
+            self.get_success_response()
+            self.get_error_response(status_code=429)
+
+        # The second request was never added to the concurrent limiter.
+        assert finish_request.call_count == 1
+
     def test_concurrent_request_rate_limiting(self) -> None:
         """test the concurrent rate limiter end to-end"""
         with ContextPropagatingThreadPoolExecutor(max_workers=4) as executor:
@@ -635,3 +660,7 @@ class TestConcurrentRateLimiter(APITestCase):
                 int(response["X-Sentry-Rate-Limit-ConcurrentRemaining"])
                 == CONCURRENT_RATE_LIMIT - 1
             )
+
+    @override_options({"api.rate-limit.single-round-trip": True})
+    def test_concurrent_request_rate_limiting_single_round_trip(self) -> None:
+        self.test_concurrent_request_rate_limiting()
@@ -1,6 +1,16 @@
-from sentry.db.models.manager.base import flush_manager_local_cache
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+
+from sentry.db.models.manager.base import flush_manager_local_cache, make_key
+from sentry.db.models.manager.process_cache import (
+    flush_manager_process_cache,
+    handle_invalidation_message,
+)
 from sentry.models.organization import Organization
 from sentry.testutils.cases import TestCase
+from sentry.utils import json
 from sentry.utils.cache import cache
 
 
@@ -43,3 +53,71 @@ class GetFromCacheTest(TestCase):
         assert Organization.objects.get_from_cache(slug=org.slug) == org
         assert Organization.objects.get_from_cache(pk=org.id) == org
         assert Organization.objects.get_from_cache(id=org.id) == org
+
+
+@override_settings(SENTRY_MODEL_PROCESS_CACHE_ENABLED=True)
+class GetFromProcessCacheTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+        flush_manager_local_cache()
+        flush_manager_process_cache()
+
+    def tearDown(self) -> None:
+        flush_manager_process_cache()
+        super().tearDown()
+
+    def test_skips_django_cache(self) -> None:
+        org = self.create_organization()
+        assert Organization.objects.get_from_cache(slug=org.slug) == org
+
+        with mock.patch.object(cache, "get", side_effect=AssertionError), self.assertNumQueries(0):
+            by_slug = Organization.objects.get_from_cache(slug=org.slug)
+            by_pk = Organization.objects.get_from_cache(pk=org.id)
+            [many] = Organization.objects.get_many_from_cache([org.id])
+
+        assert by_slug == by_pk == many == org
+        assert by_slug.name == org.name
+        # Every lookup gets its own instance.
+        assert by_slug is not by_pk
+
+    def test_save_invalidates(self) -> None:
+        org = self.create_organization(slug="old-slug")
+        assert Organization.objects.get_from_cache(slug="old-slug") == org
+
+        org.slug = "new-slug"
+        org.save()
+
+        assert Organization.objects.get_from_cache(pk=org.id).slug == "new-slug"
+        assert Organization.objects.get_from_cache(slug="new-slug") == org
+        with pytest.raises(Organization.DoesNotExist):
+            Organization.objects.get_from_cache(slug="old-slug")
+
+    def test_entries_expire(self) -> None:
+        org = self.create_organization()
+        with mock.patch("sentry.db.models.manager.base.time.monotonic", return_value=1000):
+            Organization.objects.get_from_cache(pk=org.id)
+
+        with mock.patch(
+            "sentry.db.models.manager.base.time.monotonic",
+            return_value=1000 + Organization.objects.cache_process_ttl,
+        ):
+            with mock.patch.object(cache, "get", wraps=cache.get) as cache_get:
+                assert Organization.objects.get_from_cache(pk=org.id) == org
+            assert cache_get.called
+
+    def test_invalidation_message(self) -> None:
+        org = self.create_organization()
+        Organization.objects.get_from_cache(pk=org.id)
+        Organization.objects.filter(id=org.id).update(name="renamed")
+        assert Organization.objects.get_from_cache(pk=org.id).name != "renamed"
+
+        # Updates that bypass the signals, as well as changes in other
+        # processes, arrive through the invalidation channel.
+        Organization.objects.uncache_object(org.id)
+        assert Organization.objects.get_from_cache(pk=org.id).name == "renamed"
+
+        Organization.objects.filter(id=org.id).update(name="renamed again")
+        cache.clear()
+        pk_cache_key = make_key(Organization, "modelcache", {"id": org.id})
+        handle_invalidation_message(json.dumps(["sentry.Organization", [pk_cache_key]]))
+        assert Organization.objects.get_from_cache(pk=org.id).name == "renamed again"
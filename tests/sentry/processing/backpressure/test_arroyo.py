@@ -0,0 +1,85 @@
+from unittest.mock import patch
+
+from sentry.processing.backpressure.arroyo import BASELINE_WINDOW, HealthChecker, Throttle
+from sentry.testutils.helpers.options import override_options
+
+
+def test_throttle_without_pressure() -> None:
+    throttle = Throttle()
+    assert all(throttle.admit(0.0, i / 100) for i in range(100))
+    # no baseline yet, so pressure cannot be applied proportionally
+    assert throttle.admit(0.5, 1.0)
+
+
+def test_throttle_proportional_to_headroom() -> None:
+    throttle = Throttle()
+    # 100 messages per second without pressure
+    for i in range(int(BASELINE_WINDOW * 100) + 1):
+        assert throttle.admit(0.0, i / 100)
+    assert throttle.baseline_rate is not None
+    assert 99 <= throttle.baseline_rate <= 101
+
+    start = BASELINE_WINDOW + 1
+    admitted = sum(throttle.admit(0.75, start + i / 1000) for i in range(10_000))
+    # a quarter of the baseline over ten seconds, plus at most one burst
+    assert 240 <= admitted <= 280
+
+    assert not throttle.admit(1.0, start + 10)
+    assert throttle.admit(0.0, start + 10)
+
+
+@override_options(
+    {
+        "backpressure.checking.enabled": True,
+        "backpressure.checking.interval": 0,
+        "backpressure.monitoring.enabled": True,
+        "backpressure.graded.enabled": True,
+        "backpressure.graded.hysteresis": 0.1,
+    }
+)
+def test_health_checker_hysteresis() -> None:
+    checker = HealthChecker("ingest")
+
+    def check(pressure: float, healthy: bool = True) -> tuple[float, bool]:
+        with (
+            patch(
+                "sentry.processing.backpressure.arroyo.is_consumer_healthy", return_value=healthy
+            ),
+            patch(
+                "sentry.processing.backpressure.arroyo.get_consumer_pressure",
+                return_value=pressure,
+            ),
+        ):
+            is_healthy = checker.is_healthy()
+        return checker.pressure, is_healthy
+
+    assert check(0.5) == (0.5, True)
+    # small changes are ignored
+    assert check(0.55) == (0.5, True)
+    assert check(0.65) == (0.65, True)
+
+    # unhealthy consumers stop right away
+    assert check(0.7, healthy=False) == (1.0, False)
+
+    # and only resume once the pressure clearly eased
+    assert check(0.95) == (1.0, False)
+    assert check(0.85) == (0.85, True)
+
+    assert check(0.0) == (0.0, True)
+
+
+@override_options(
+    {
+        "backpressure.checking.enabled": True,
+        "backpressure.checking.interval": 0,
+        "backpressure.monitoring.enabled": True,
+        "backpressure.graded.enabled": False,
+    }
+)
+def test_health_checker_binary() -> None:
+    checker = HealthChecker("ingest")
+    with patch("sentry.processing.backpressure.arroyo.is_consumer_healthy", return_value=False):
+        assert not checker.admit()
+    with patch("sentry.processing.backpressure.arroyo.is_consumer_healthy", return_value=True):
+        assert checker.admit()
+    assert checker.pressure == 0.0
@@ -5,6 +5,7 @@ from django.test.utils import override_settings
 
 from sentry.processing.backpressure.health import (
     UnhealthyReasons,
+    get_consumer_pressure,
     is_consumer_healthy,
     record_consumer_health,
 )
@@ -12,6 +13,7 @@ from sentry.processing.backpressure.monitor import (
     Redis,
     assert_all_services_defined,
     check_service_health,
+    get_pressure_level,
     load_service_definitions,
 )
 from sentry.testutils.helpers.options import override_options
@@ -91,3 +93,56 @@ def test_record_consumer_health() -> None:
                 "post-process-locks": [],
             }
         )
+
+
+@override_options({"backpressure.graded.throttle-range": 0.2})
+def test_pressure_level() -> None:
+    assert get_pressure_level(0.5, 0.8) == 0.0
+    assert get_pressure_level(0.6, 0.8) == 0.0
+    assert get_pressure_level(0.7, 0.8) == pytest.approx(0.5)
+    assert get_pressure_level(0.8, 0.8) == 1.0
+    assert get_pressure_level(0.95, 0.8) == 1.0
+
+    with override_options({"backpressure.graded.throttle-range": 0.0}):
+        assert get_pressure_level(0.79, 0.8) == 0.0
+
+
+def test_check_redis_pressure() -> None:
+    _, cluster, _ = redis.get_dynamic_cluster_from_options(
+        setting="tess", config={"cluster": "default"}
+    )
+    services = {"redis": Redis(cluster)}
+
+    service_pressure: dict[str, float] = {}
+    with override_options({"backpressure.high_watermarks.redis": 0.0}):
+        check_service_health(services, service_pressure)
+    assert service_pressure == {"redis": 1.0}
+
+    with override_options({"backpressure.high_watermarks.redis": 1.0}):
+        check_service_health(services, service_pressure)
+    assert service_pressure["redis"] < 1.0
+
+
+@override_options(
+    {
+        "backpressure.checking.enabled": True,
+        "backpressure.monitoring.enabled": True,
+        "backpressure.status_ttl": 60,
+    }
+)
+def test_record_consumer_pressure() -> None:
+    unhealthy_services: MutableMapping[str, UnhealthyReasons] = {
+        "attachments-store": [],
+        "processing-store": [],
+        "processing-store-transactions": [],
+        "processing-locks": [],
+        "post-process-locks": [],
+    }
+    record_consumer_health(unhealthy_services, {"processing-store": 0.25, "attachments-store": 0.5})
+    assert get_consumer_pressure("ingest") == 0.5
+    assert get_consumer_pressure("ingest-transactions") == 0.0
+
+    unhealthy_services["processing-store-transactions"] = Exception("Couldn't check")
+    record_consumer_health(unhealthy_services, {})
+    assert get_consumer_pressure("ingest") == 0.0
+    assert get_consumer_pressure("ingest-transactions") == 1.0
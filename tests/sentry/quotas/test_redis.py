@@ -6,10 +6,17 @@ from unittest import mock
 import pytest
 
 from sentry.constants import DataCategory
-from sentry.quotas.base import QuotaConfig, QuotaScope, build_metric_abuse_quotas
+from sentry.quotas.base import (
+    QuotaConfig,
+    QuotaScope,
+    build_metric_abuse_quotas,
+    clear_quota_config_cache,
+    invalidate_quota_config_cache,
+)
 from sentry.quotas.redis import RedisQuota, is_rate_limited
 from sentry.sentry_metrics.use_case_id_registry import CARDINALITY_LIMIT_USE_CASES, UseCaseID
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.utils.redis import clusters
 
 
@@ -252,6 +259,29 @@ class RedisQuotaTest(TestCase):
         assert quotas[0].limit == 15
         assert quotas[0].window == 60
 
+    @override_options({"quotas.redis.config-cache-ttl": 60})
+    def test_get_quotas_cached(self) -> None:
+        clear_quota_config_cache()
+        self.get_monitor_quota.return_value = (15, 60)
+        key = self.create_project_key(project=self.project)
+
+        quotas = self.quota.get_quotas(self.project, key=key)
+        assert self.quota.get_quotas(self.project, key=key) == quotas
+        assert self.get_monitor_quota.call_count == 1
+
+        # A different set of keys is memoised separately.
+        self.quota.get_quotas(self.project)
+        assert self.get_monitor_quota.call_count == 2
+
+        invalidate_quota_config_cache(public_key=key.public_key)
+        self.quota.get_quotas(self.project, key=key)
+        assert self.get_monitor_quota.call_count == 3
+
+        invalidate_quota_config_cache(organization_id=self.organization.id)
+        self.quota.get_quotas(self.project, key=key)
+        self.quota.get_quotas(self.project)
+        assert self.get_monitor_quota.call_count == 5
+
     @mock.patch("sentry.quotas.redis.is_rate_limited")
     @mock.patch.object(RedisQuota, "get_quotas", return_value=[])
     def test_bails_immediately_without_any_quota(
@@ -0,0 +1,122 @@
+import uuid
+from time import time
+from typing import Any
+from unittest import TestCase, mock
+
+from sentry.ratelimits.api_limiter import ApiRateLimiter
+from sentry.ratelimits.redis import RedisRateLimiter
+from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
+
+
+class ApiRateLimiterTest(TestCase):
+    def setUp(self) -> None:
+        self.limiter = ApiRateLimiter()
+        self.key = f"ip:default:TestEndpoint:GET:{uuid.uuid4().hex}"
+
+    def test_window_limit(self) -> None:
+        with freeze_time("2000-01-01"):
+            for i in range(1, 3):
+                info = self.limiter.check_request(self.key, 2, 100, None, f"request_id{i}")
+                assert info.current == i
+                assert not info.window_limited
+                assert info.concurrent_requests is None
+                assert info.reset_time == 946684900
+
+            info = self.limiter.check_request(self.key, 2, 100, None, "request_id3")
+            assert info.current == 3
+            assert info.window_limited
+
+    def test_concurrent_limit(self) -> None:
+        with freeze_time("2000-01-01"):
+            for i in range(1, 3):
+                info = self.limiter.check_request(self.key, 10, 100, 2, f"request_id{i}")
+                assert info.concurrent_requests == i
+                assert not info.concurrent_limit_exceeded
+
+            info = self.limiter.check_request(self.key, 10, 100, 2, "request_id3")
+            assert info.concurrent_requests == 2
+            assert info.concurrent_limit_exceeded
+            assert not info.window_limited
+
+            # Requests share the set of the concurrent limiter and are finished
+            # through it.
+            assert self.limiter.concurrent.get_concurrent_requests(self.key) == 2
+            self.limiter.finish_request(self.key, "request_id1")
+            info = self.limiter.check_request(self.key, 10, 100, 2, "request_id4")
+            assert info.concurrent_requests == 2
+            assert not info.concurrent_limit_exceeded
+
+    def test_window_limited_request_is_not_executing(self) -> None:
+        with freeze_time("2000-01-01"):
+            self.limiter.check_request(self.key, 1, 100, 5, "request_id1")
+            info = self.limiter.check_request(self.key, 1, 100, 5, "request_id2")
+            assert info.window_limited
+            assert info.concurrent_requests is None
+            assert self.limiter.concurrent.get_concurrent_requests(self.key) == 1
+
+    def test_window_shared_with_redis_rate_limiter(self) -> None:
+        with freeze_time("2000-01-01"):
+            RedisRateLimiter().is_limited(self.key, limit=2, window=100)
+            info = self.limiter.check_request(self.key, 2, 100, None, "request_id1")
+            assert info.current == 2
+            assert not info.window_limited
+
+            info = self.limiter.check_request(self.key, 2, 100, None, "request_id2")
+            assert info.window_limited
+
+    def test_fails_open(self) -> None:
+        class FakeClient:
+            def __getattr__(self, name: str) -> Any:
+                def fail(*args: Any, **kwargs: Any) -> Any:
+                    raise Exception("OH NO")
+
+                return fail
+
+        with mock.patch.object(self.limiter, "client", FakeClient()):
+            info = self.limiter.check_request(self.key, 1, 100, 5, "some_uid")
+            assert not info.window_limited
+            assert not info.concurrent_limit_exceeded
+            assert info.concurrent_requests == -1
+
+    @override_options({"api.rate-limit.local-precheck-ratio": 0.5})
+    def test_local_precheck(self) -> None:
+        with freeze_time("2000-01-01"):
+            # The first request goes to Redis and leaves 10 * 0.5 - 1 local tokens.
+            info = self.limiter.check_request(self.key, 10, 100, None, "request_id0")
+            assert info.current == 1
+
+            with mock.patch("sentry.ratelimits.api_limiter.request_limit_info") as script:
+                for i in range(2, 6):
+                    info = self.limiter.check_request(self.key, 10, 100, None, f"request_id{i}")
+                    assert info.current == i
+                    assert not info.window_limited
+            assert not script.called
+
+            # Out of local tokens, so the request goes to Redis again and
+            # counts the local admissions there as well.
+            info = self.limiter.check_request(self.key, 10, 100, None, "request_id6")
+            assert info.current == 6
+            assert int(self.limiter.client.get(self.limiter.window_key(self.key, 100, time()))) == 6
+
+    @override_options({"api.rate-limit.local-precheck-ratio": 0.5})
+    def test_local_precheck_skipped_with_concurrent_limit(self) -> None:
+        with freeze_time("2000-01-01"):
+            self.limiter.check_request(self.key, 10, 100, 5, "request_id0")
+            assert self.limiter.local_allowances.get(self.key) is None
+
+            info = self.limiter.check_request(self.key, 10, 100, 5, "request_id1")
+            assert info.current == 2
+            assert info.concurrent_requests == 2
+
+    @override_options({"api.rate-limit.local-precheck-ratio": 0.5})
+    def test_local_precheck_skipped_close_to_limit(self) -> None:
+        with freeze_time("2000-01-01"):
+            for i in range(5):
+                self.limiter.check_request(self.key, 4, 100, None, f"request_id{i}")
+
+            assert self.limiter.local_allowances.get(self.key) is None
+            # Every request is counted, including the one admitted locally.
+            info = self.limiter.check_request(self.key, 4, 100, None, "request_id5")
+            assert info.current == 6
+            assert info.window_limited
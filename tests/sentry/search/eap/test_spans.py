@@ -42,7 +42,7 @@ from sentry.exceptions import InvalidSearchQuery
 from sentry.search.eap import utils as eap_utils
 from sentry.search.eap.columns import ResolvedAttribute
 from sentry.search.eap.occurrences.definitions import OCCURRENCE_DEFINITIONS
-from sentry.search.eap.resolver import SearchResolver
+from sentry.search.eap.resolver import SearchResolver, clear_shared_resolved_attribute_cache
 from sentry.search.eap.spans.attributes import (
     SPAN_ATTRIBUTE_DEFINITIONS,
     SPAN_INTERNAL_TO_SECONDARY_ALIASES_MAPPING,
@@ -906,6 +906,44 @@ class SearchResolverColumnTest(TestCase):
             value_map={str(self.project.id): self.project.slug},
         )
 
+    def test_resolved_attributes_shared_across_resolvers(self) -> None:
+        clear_shared_resolved_attribute_cache()
+        resolved_column, _ = self.resolver.resolve_attribute("span.op")
+
+        other_resolver = SearchResolver(
+            params=SnubaParams(projects=[self.create_project()]),
+            config=SearchResolverConfig(),
+            definitions=SPAN_DEFINITIONS,
+        )
+        with mock.patch.object(
+            SearchResolver, "_find_column_by_internal_name", return_value=None
+        ) as find_column_by_internal_name:
+            other_resolver.resolve_attribute("tags[foo]")
+            assert other_resolver.resolve_attribute("span.op")[0] is resolved_column
+        # The tag had not been resolved before, so only it went through resolution.
+        assert find_column_by_internal_name.call_count == 1
+
+        # Overridden aliases are specific to the caller and are not shared.
+        overridden, _ = other_resolver.resolve_attribute(
+            "span.description", public_alias_override="desc"
+        )
+        assert overridden.public_alias == "desc"
+        assert self.resolver.resolve_attribute("span.description")[0].public_alias == (
+            "span.description"
+        )
+
+        # Other datasets do not see span resolutions.
+        metrics_resolver = SearchResolver(
+            params=SnubaParams(projects=[self.project]),
+            config=SearchResolverConfig(),
+            definitions=TRACE_METRICS_DEFINITIONS,
+        )
+        with mock.patch.object(
+            SearchResolver, "_find_column_by_internal_name", return_value=None
+        ) as find_column_by_internal_name:
+            metrics_resolver.resolve_attribute("tags[foo]")
+        assert find_column_by_internal_name.call_count == 1
+
     def test_simple_tag(self) -> None:
         resolved_column, virtual_context = self.resolver.resolve_column("tags[foo]")
         assert resolved_column.proto_definition == AttributeKey(
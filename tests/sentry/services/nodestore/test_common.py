@@ -11,6 +11,7 @@ import pytest
 
 from sentry.services.nodestore.base import NodeStorage
 from sentry.services.nodestore.django.backend import DjangoNodeStorage
+from sentry.services.nodestore.encoding import EncodedPayload
 from sentry.testutils.helpers import override_options
 from tests.sentry.services.nodestore.bigtable.test_backend import (
     MockedBigtableNodeStorage,
@@ -127,3 +128,17 @@ def test_set_subkeys(ns: NodeStorage) -> None:
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options(
+    {"nodestore.set-subkeys.enable-set-cache-item": False, "nodestore.cache-ttl": 300}
+)
+def test_set_subkeys_encoded(ns: NodeStorage) -> None:
+    data = {"foo": "a", "bar": [1, 2]}
+    ns.set_subkeys(
+        "node_1",
+        {None: data, "other": {"foo": "b"}},
+        encoded=EncodedPayload.encode(data).to_bytes(),
+    )
+    assert ns.get("node_1") == data
+    assert ns.get("node_1", subkey="other") == {"foo": "b"}
@@ -0,0 +1,111 @@
+import uuid
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from sentry.services.eventstore.models import EVENTSTREAM_PRUNED_KEYS
+from sentry.services.nodestore.base import json_dumps
+from sentry.services.nodestore.encoding import EncodedPayload
+from sentry.testutils.skips import requires_pytest_benchmark
+from sentry.utils import json
+
+
+def large_event(frame_count: int) -> dict[str, Any]:
+    frames = [
+        {
+            "function": f"handler_{i}",
+            "module": "app.handlers",
+            "filename": "app/handlers.py",
+            "lineno": i,
+            "in_app": i % 2 == 0,
+            "vars": {"request": "<Request>", "i": i},
+        }
+        for i in range(frame_count)
+    ]
+    return {
+        "event_id": "a" * 32,
+        "platform": "python",
+        "message": "ünïcode message",
+        "tags": [["level", "error"], ["server_name", "web-1"]],
+        "exception": {"values": [{"type": "ValueError", "stacktrace": {"frames": frames}}]},
+        "debug_meta": {"images": [{"code_file": f"/lib/{i}.so"} for i in range(frame_count)]},
+        "_meta": {"message": {"": {"len": 1234}}},
+    }
+
+
+def test_round_trip() -> None:
+    data = large_event(10)
+    encoded = EncodedPayload.encode(data)
+
+    assert json.loads(encoded.to_bytes()) == data
+    assert encoded.to_bytes() == EncodedPayload.encode(dict(reversed(data.items()))).to_bytes()
+
+
+def test_exclude() -> None:
+    data = large_event(10)
+    pruned = {k: v for k, v in data.items() if k not in EVENTSTREAM_PRUNED_KEYS}
+
+    assert json.loads(EncodedPayload.encode(data).to_bytes(exclude=EVENTSTREAM_PRUNED_KEYS)) == (
+        pruned
+    )
+    assert EncodedPayload({}).to_bytes() == b"{}"
+
+
+def test_values_orjson_rejects() -> None:
+    data = {"big": 2**70, "list": [2**64, -(2**70)]}
+
+    assert json.loads(EncodedPayload.encode(data).to_bytes()) == json.loads(json_dumps(data))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+        date(2024, 1, 2),
+        uuid.UUID("4b7d5a1e-8f3a-4c41-9b1e-2f2a6c9d0e11"),
+        Decimal("1.50"),
+        {"b", "a"},
+        [{"amount": Decimal("2.5"), "at": datetime(2024, 1, 2, tzinfo=UTC)}],
+    ],
+    ids=["datetime", "date", "uuid", "decimal", "set", "nested"],
+)
+def test_matches_json_dumps(value: Any) -> None:
+    data = {"value": value, "other": 1}
+
+    assert json.loads(EncodedPayload.encode(data).to_bytes()) == json.loads(json.dumps(data))
+
+
+def test_to_raw_json() -> None:
+    data = large_event(3)
+    document = json.dumps(
+        {"data": EncodedPayload.encode(data).to_raw_json(exclude=EVENTSTREAM_PRUNED_KEYS)}
+    )
+
+    assert json.loads(document) == json.loads(
+        json.dumps({"data": {k: v for k, v in data.items() if k not in EVENTSTREAM_PRUNED_KEYS}})
+    )
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("encode_once", [False, True], ids=["twice", "once"])
+def test_benchmark_nodestore_and_eventstream_encoding(
+    encode_once: bool, benchmark: ModuleType
+) -> None:
+    data = large_event(5000)
+
+    def encode_twice() -> None:
+        json_dumps(data)
+        stream_data = dict(data)
+        for key in EVENTSTREAM_PRUNED_KEYS:
+            stream_data.pop(key, None)
+        json.dumps({"data": stream_data})
+
+    def encode_once_and_splice() -> None:
+        encoded = EncodedPayload.encode(data)
+        encoded.to_bytes()
+        json.dumps({"data": encoded.to_raw_json(exclude=EVENTSTREAM_PRUNED_KEYS)})
+
+    benchmark.pedantic(encode_once_and_splice if encode_once else encode_twice, rounds=20)
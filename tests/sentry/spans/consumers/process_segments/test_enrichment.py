@@ -1,5 +1,6 @@
 from typing import cast
 
+import pytest
 from sentry_conventions.attributes import ATTRIBUTE_NAMES
 from sentry_kafka_schemas.schema_types.ingest_spans_v1 import SpanEvent
 
@@ -926,3 +927,30 @@ def test_enrich_gen_ai_agent_name_from_deep_ancestor() -> None:
     compatible_spans = [make_compatible(span) for span in enriched_spans]
 
     assert attribute_value(compatible_spans[-1], "gen_ai.agent.name") == "DeepAgent"
+
+
+def test_enrich_large_segment_in_place() -> None:
+    """Every span in a deep chain only has the time not covered by its child
+    as exclusive time, and spans are enriched in place."""
+    depth = 2000
+    spans = [
+        build_mock_span(
+            project_id=1,
+            is_segment=i == 0,
+            span_id=f"{i:016x}",
+            parent_span_id=f"{i - 1:016x}" if i > 0 else None,
+            start_timestamp=1609455600.0 + i * 0.001,
+            end_timestamp=1609455700.0 - i * 0.001,
+        )
+        for i in range(depth)
+    ]
+
+    segment_idx, enriched_spans = TreeEnricher.enrich_spans(spans)
+
+    assert segment_idx == 0
+    assert all(enriched is span for enriched, span in zip(enriched_spans, spans))
+    for span in enriched_spans[:-1]:
+        assert attribute_value(span, "sentry.exclusive_time_ms") == pytest.approx(2.0, abs=0.01)
+    assert attribute_value(enriched_spans[-1], "sentry.exclusive_time_ms") == pytest.approx(
+        (100.0 - 2 * (depth - 1) * 0.001) * 1000, abs=0.01
+    )
@@ -0,0 +1,55 @@
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from sentry.spans.grouping.strategy.base import clear_span_group_cache
+from sentry.spans.grouping.strategy.config import CONFIGURATIONS, DEFAULT_CONFIG_ID
+from sentry.testutils.issue_detection.span_builder import SpanBuilder
+from sentry.testutils.skips import requires_pytest_benchmark
+
+DESCRIPTIONS = [
+    ("db", "SELECT * FROM users WHERE id = 42 AND org_id IN (1, 2, 3, 4, 5)"),
+    ("db", "UPDATE sessions SET last_seen = '2024-01-01 00:00:00' WHERE id = 7"),
+    ("db", "SAVEPOINT sp_1"),
+    ("http.client", "GET https://api.example.com/v1/projects/123/issues/?cursor=abc"),
+    ("http.client", "POST https://hooks.example.com/notify?token=secret"),
+    ("redis", "GET cache:project:123:settings"),
+    ("ui.render", "CheckoutPage"),
+]
+
+
+def large_segment(span_count: int) -> dict[str, Any]:
+    spans = []
+    for i in range(span_count):
+        op, description = DESCRIPTIONS[i % len(DESCRIPTIONS)]
+        spans.append(
+            SpanBuilder()
+            .with_span_id(f"{i:016x}")
+            .with_op(op)
+            .with_description(description)
+            .build()
+        )
+    return {
+        "transaction": "transaction name",
+        "contexts": {"trace": {"span_id": "f" * 16}},
+        "spans": spans,
+    }
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("memoised", [False, True], ids=["unmemoised", "memoised"])
+def test_benchmark_span_grouping(memoised: bool, benchmark: ModuleType) -> None:
+    strategy = CONFIGURATIONS[DEFAULT_CONFIG_ID].strategy
+    event = large_segment(5000)
+
+    def run_unmemoised(event: dict[str, Any]) -> dict[str, str]:
+        return {span["span_id"]: strategy.get_embedded_span_group(span) for span in event["spans"]}
+
+    def setup() -> tuple[tuple[dict[str, Any]], dict[str, Any]]:
+        # Start every round cold so only the per-segment memo is measured.
+        clear_span_group_cache()
+        return (event,), {}
+
+    run = strategy.execute if memoised else run_unmemoised
+    benchmark.pedantic(run, setup=setup, rounds=20)
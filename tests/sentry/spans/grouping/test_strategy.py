@@ -621,3 +621,41 @@ def test_standalone_spans_compat() -> None:
 
     cfg = CONFIGURATIONS[DEFAULT_CONFIG_ID]
     assert cfg.execute_strategy(event) == cfg.execute_strategy_standalone(standalone_spans)
+
+
+def test_span_groups_memoised_by_op_and_description() -> None:
+    calls = []
+
+    def recording_strategy(span: Span) -> list[str] | None:
+        calls.append(span["span_id"])
+        return None
+
+    strategy = SpanGroupingStrategy(name="memo-strategy", strategies=[recording_strategy])
+    spans = [
+        SpanBuilder().with_span_id("b" * 16).with_op("db").with_description("SELECT 1").build(),
+        SpanBuilder().with_span_id("c" * 16).with_op("db").with_description("SELECT 1").build(),
+        SpanBuilder().with_span_id("d" * 16).with_op("http").with_description("SELECT 1").build(),
+        SpanBuilder()
+        .with_span_id("e" * 16)
+        .with_op("db")
+        .with_description("SELECT 1")
+        .with_fingerprint(["custom"])
+        .build(),
+    ]
+    event = {
+        "transaction": "transaction name",
+        "contexts": {"trace": {"span_id": "a" * 16}},
+        "spans": spans,
+    }
+
+    results = strategy.execute(event)
+    assert results["b" * 16] == results["c" * 16] == hash_values(["SELECT 1"])
+    assert results["d" * 16] == hash_values(["SELECT 1"])
+    assert results["e" * 16] == hash_values(["custom"])
+    assert calls == ["b" * 16, "d" * 16]
+
+    # Later segments reuse the process-wide cache.
+    assert strategy.execute_standalone(spans) == {
+        span_id: group for span_id, group in results.items() if span_id != "a" * 16
+    }
+    assert calls == ["b" * 16, "d" * 16]
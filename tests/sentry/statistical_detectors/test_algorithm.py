@@ -324,3 +324,64 @@ def test_moving_average_relative_change_detector(
 
     assert all_regressed == [payloads[i] for i in regressed_indices]
     assert all_improved == [payloads[i] for i in improved_indices]
+
+
+@pytest.mark.parametrize(
+    "state",
+    [
+        pytest.param(
+            MovingAverageDetectorState(
+                timestamp=datetime(2023, 8, 31, 11, 28, 52, tzinfo=timezone.utc),
+                count=10,
+                moving_avg_short=10.5,
+                moving_avg_long=9.25,
+            ),
+            id="with timestamp",
+        ),
+        pytest.param(MovingAverageDetectorState.empty(), id="without timestamp"),
+    ],
+)
+def test_moving_average_detector_state_packed(state) -> None:
+    assert MovingAverageDetectorState.from_packed(state.to_packed()) == state
+
+
+def test_moving_average_relative_change_detector_packed_states() -> None:
+    now = datetime(2023, 8, 31, 11, 28, 52, tzinfo=timezone.utc)
+
+    detector = MovingAverageRelativeChangeDetector(
+        "transaction",
+        "endpoint",
+        min_data_points=6,
+        moving_avg_short_factory=lambda: ExponentialMovingAverage(2 / 21),
+        moving_avg_long_factory=lambda: ExponentialMovingAverage(2 / 41),
+        threshold=0.1,
+    )
+
+    # stepwise increases, shifted for each object
+    values = [1 for _ in range(10)] + [2 for _ in range(10)]
+    raw_states: list[Mapping[str | bytes, bytes | float | int | str]] = [{} for _ in values]
+    packed_states: list[bytes | None] = [None for _ in values]
+
+    for step in range(len(values)):
+        payloads = [
+            DetectorPayload(
+                project_id=1,
+                group=i,
+                fingerprint=str(i),
+                count=step + 1,
+                value=values[(i + step) % len(values)],
+                timestamp=now + timedelta(hours=step + 1),
+            )
+            for i in range(len(values))
+        ]
+
+        updates = [
+            detector.update(raw_state, payload) for raw_state, payload in zip(raw_states, payloads)
+        ]
+        assert [
+            detector.update(packed_state, payload)
+            for packed_state, payload in zip(packed_states, payloads)
+        ] == updates
+
+        raw_states = [state.to_redis_dict() for _, _, state in updates if state is not None]
+        packed_states = [state.to_packed() for _, _, state in updates if state is not None]
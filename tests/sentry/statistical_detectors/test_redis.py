@@ -0,0 +1,103 @@
+from datetime import UTC, datetime
+from unittest import mock
+
+import pytest
+
+from sentry.models.statistical_detectors import RegressionType
+from sentry.statistical_detectors.algorithm import PACKED_STATE, MovingAverageDetectorState
+from sentry.statistical_detectors.base import DetectorPayload
+from sentry.statistical_detectors.redis import (
+    STATE_TTL,
+    PackedRedisDetectorStore,
+    RedisDetectorStore,
+)
+
+
+@pytest.fixture
+def payloads():
+    return [
+        DetectorPayload(
+            project_id=1,
+            group=i,
+            fingerprint=f"{i:x}",
+            count=100,
+            value=100,
+            timestamp=datetime(2023, 8, 1, 12, 0, tzinfo=UTC),
+        )
+        for i in range(5)
+    ]
+
+
+def make_state(i: int) -> MovingAverageDetectorState:
+    return MovingAverageDetectorState(
+        timestamp=datetime(2023, 8, 1, 12, 0, tzinfo=UTC),
+        count=i + 1,
+        moving_avg_short=100 + i,
+        moving_avg_long=50 + i,
+    )
+
+
+def test_packed_store_round_trip(payloads) -> None:
+    store = PackedRedisDetectorStore(RegressionType.FUNCTION)
+    states = [make_state(i).to_packed() for i in range(len(payloads))]
+
+    assert store.bulk_read_states(payloads) == [None] * len(payloads)
+
+    store.bulk_write_states(payloads, states)
+    assert store.bulk_read_states(payloads) == states
+
+
+def test_packed_store_skips_empty_states(payloads) -> None:
+    store = PackedRedisDetectorStore(RegressionType.FUNCTION)
+    states = [make_state(i).to_packed() if i % 2 else None for i in range(len(payloads))]
+
+    store.bulk_write_states(payloads, states)
+    assert store.bulk_read_states(payloads) == states
+
+
+def test_packed_store_sets_ttl(payloads) -> None:
+    store = PackedRedisDetectorStore(RegressionType.FUNCTION)
+    store.bulk_write_states(payloads, [make_state(i).to_packed() for i in range(len(payloads))])
+
+    for payload in payloads:
+        assert 0 < store.client.ttl(store.make_key(payload)) <= STATE_TTL
+
+
+def test_packed_store_chunks_pipelines(payloads) -> None:
+    store = PackedRedisDetectorStore(RegressionType.FUNCTION, chunk_size=2)
+    states = [make_state(i).to_packed() for i in range(len(payloads))]
+    client = store.client
+
+    with mock.patch.object(store, "_client", mock.Mock(wraps=client)) as wrapped:
+        store.bulk_write_states(payloads, states)
+        assert wrapped.pipeline.call_count == 3
+
+        wrapped.pipeline.reset_mock()
+        assert store.bulk_read_states(payloads) == states
+        assert wrapped.pipeline.call_count == 3
+        assert all(
+            call.kwargs == {"transaction": False} for call in wrapped.pipeline.call_args_list
+        )
+
+
+def test_packed_store_falls_back_to_hash_states(payloads) -> None:
+    hash_store = RedisDetectorStore(RegressionType.FUNCTION)
+    store = PackedRedisDetectorStore(RegressionType.FUNCTION, chunk_size=2)
+
+    # only some of the states have been written by the legacy store
+    hash_states = [make_state(i).to_redis_dict() if i % 2 else None for i in range(len(payloads))]
+    hash_store.bulk_write_states(payloads, hash_states)
+
+    raw_states = store.bulk_read_states(payloads)
+    for i, raw_state in enumerate(raw_states):
+        if i % 2:
+            assert MovingAverageDetectorState.from_redis_dict(raw_state) == make_state(i)
+        else:
+            assert raw_state is None
+
+    # once written by the packed store, the packed state takes precedence
+    packed_states = [make_state(i + 10).to_packed() for i in range(len(payloads))]
+    store.bulk_write_states(payloads, packed_states)
+    raw_states = store.bulk_read_states(payloads)
+    assert raw_states == packed_states
+    assert all(len(raw_state) == PACKED_STATE.size for raw_state in raw_states)
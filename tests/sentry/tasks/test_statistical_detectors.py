@@ -22,7 +22,7 @@ from sentry.models.statistical_detectors import (
     get_regression_groups,
 )
 from sentry.seer.breakpoints import BreakpointData
-from sentry.statistical_detectors.algorithm import MovingAverageDetectorState
+from sentry.statistical_detectors.algorithm import PACKED_STATE, MovingAverageDetectorState
 from sentry.statistical_detectors.base import DetectorPayload, TrendType
 from sentry.statistical_detectors.detector import TrendBundle, generate_fingerprint
 from sentry.tasks.statistical_detectors import (
@@ -479,6 +479,67 @@ def test_detect_function_trends(
         assert not detect_function_change_points.apply_async.called
 
 
+@mock.patch("sentry.tasks.statistical_detectors.query_functions")
+@mock.patch("sentry.tasks.statistical_detectors.detect_function_change_points")
+@django_db_all
+def test_detect_function_trends_packed_states(
+    detect_function_change_points,
+    query_functions,
+    timestamp,
+    project,
+):
+    n = 50
+    timestamps = [timestamp - timedelta(hours=n - i) for i in range(n)]
+
+    payloads = [
+        DetectorPayload(
+            project_id=project.id,
+            group=123,
+            fingerprint=f"{123:x}",
+            count=100,
+            value=100 if i < n / 2 else 300,
+            timestamp=ts,
+        )
+        for i, ts in enumerate(timestamps)
+    ]
+    query_functions.side_effect = [[payload] for payload in payloads]
+
+    hash_store = FunctionRegressionDetector.detector_store_factory()
+    packed_store = FunctionRegressionDetector.packed_detector_store_factory()
+
+    # the first half of the states are written to hashes before packed states are enabled
+    with override_options(
+        {
+            "statistical_detectors.enable": True,
+            "statistical_detectors.packed_states.enabled": False,
+        }
+    ):
+        for ts in timestamps[: n // 2]:
+            detect_function_trends([project.id], ts.isoformat())
+
+    [hash_state] = hash_store.bulk_read_states(payloads[:1])
+    assert MovingAverageDetectorState.from_redis_dict(hash_state).count == n // 2
+    assert packed_store.client.get(packed_store.make_key(payloads[0])) is None
+
+    with override_options(
+        {
+            "statistical_detectors.enable": True,
+            "statistical_detectors.packed_states.enabled": True,
+        }
+    ):
+        for ts in timestamps[n // 2 :]:
+            detect_function_trends([project.id], ts.isoformat())
+
+    # the hash state is migrated and kept up to date as a packed state
+    packed_state = packed_store.client.get(packed_store.make_key(payloads[0]))
+    assert len(packed_state) == PACKED_STATE.size
+    state = MovingAverageDetectorState.from_packed(packed_state)
+    assert state.count == n
+    assert state.timestamp == timestamps[-1].replace(microsecond=0)
+
+    assert detect_function_change_points.apply_async.called
+
+
 @mock.patch("sentry.tasks.statistical_detectors.functions.query")
 @mock.patch("sentry.tasks.statistical_detectors.detect_function_change_points")
 @mock.patch("sentry.statistical_detectors.detector.produce_occurrence_to_kafka")
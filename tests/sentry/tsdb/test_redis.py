@@ -1,5 +1,6 @@
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from unittest import mock
 
 import pytest
 
@@ -10,6 +11,11 @@ from sentry.tsdb.redis import CountMinScript, RedisTSDB, SuppressionWrapper
 from sentry.utils.dates import to_datetime
 
 
+class NonDurableRedisTSDB(RedisTSDB):
+    def get_cluster(self, environment_id):
+        return self.cluster, False
+
+
 def test_suppression_wrapper() -> None:
     @contextmanager
     def raise_after():
@@ -422,6 +428,108 @@ class RedisTSDBTest(TestCase):
             environment_ids=[0, 1],
         )
 
+    @override_options(
+        {"redis.clusters": {"tsdb": {"hosts": {i - 6: {"db": i} for i in range(6, 9)}}}}
+    )
+    def test_write_behind(self) -> None:
+        db = NonDurableRedisTSDB(
+            rollups=((ONE_HOUR, 24),),
+            vnodes=64,
+            enable_frequency_sketches=True,
+            cluster="tsdb",
+            write_behind={"flush_interval": 3600, "max_keys": 1000},
+        )
+        assert db.write_behind is not None
+
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp() // ONE_HOUR) * ONE_HOUR
+        distinct_model = TSDBModel.users_affected_by_group
+        frequency_model = TSDBModel.frequent_issues_by_project
+
+        for _ in range(3):
+            db.incr_multi([(TSDBModel.project, 1), (TSDBModel.group, 2)], now, count=2)
+            db.record(distinct_model, 1, ("foo", "bar"), now)
+            db.record_frequency_multi(
+                ((frequency_model, {"organization:1": {"project:1": 1}}),), now
+            )
+        db.record(distinct_model, 1, ("baz",), now)
+
+        # Nothing has been written yet
+        assert db.get_range(TSDBModel.project, [1], now, now) == {1: [(timestamp, 0)]}
+
+        db.write_behind.flush()
+
+        assert db.get_range(TSDBModel.project, [1], now, now) == {1: [(timestamp, 6)]}
+        assert db.get_range(TSDBModel.group, [2], now, now) == {2: [(timestamp, 6)]}
+        assert db.get_distinct_counts_totals(distinct_model, [1], now, now) == {1: 3}
+        assert db.get_frequency_series(
+            frequency_model, {"organization:1": ("project:1",)}, now, now, rollup=ONE_HOUR
+        ) == {"organization:1": [(timestamp, {"project:1": 3.0})]}
+
+        # Reaching `max_keys` flushes immediately
+        db.write_behind.max_keys = 1
+        db.incr(TSDBModel.project, 1, now)
+        assert db.get_range(TSDBModel.project, [1], now, now) == {1: [(timestamp, 7)]}
+
+    @override_options(
+        {"redis.clusters": {"tsdb": {"hosts": {i - 6: {"db": i} for i in range(6, 9)}}}}
+    )
+    def test_write_behind_durable_writes_through(self) -> None:
+        db = RedisTSDB(
+            rollups=((ONE_HOUR, 24),),
+            vnodes=64,
+            cluster="tsdb",
+            write_behind={"flush_interval": 3600, "max_keys": 1000},
+        )
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp() // ONE_HOUR) * ONE_HOUR
+
+        db.incr(TSDBModel.project, 1, now, count=2)
+        assert db.get_range(TSDBModel.project, [1], now, now) == {1: [(timestamp, 2)]}
+
+        # Errors writing to durable clusters reach the caller
+        with mock.patch.object(db, "write_counters", side_effect=Exception("Boom!")):
+            with pytest.raises(Exception):
+                db.incr(TSDBModel.project, 1, now)
+
+    @override_options(
+        {"redis.clusters": {"tsdb": {"hosts": {i - 6: {"db": i} for i in range(6, 9)}}}}
+    )
+    def test_write_behind_failed_flush(self) -> None:
+        db = NonDurableRedisTSDB(
+            rollups=((ONE_HOUR, 24),),
+            vnodes=64,
+            cluster="tsdb",
+            write_behind={"flush_interval": 3600, "max_keys": 1000},
+        )
+        assert db.write_behind is not None
+        now = datetime.now(timezone.utc)
+        timestamp = int(now.timestamp() // ONE_HOUR) * ONE_HOUR
+        distinct_model = TSDBModel.users_affected_by_group
+
+        db.incr(TSDBModel.project, 1, now, count=2)
+        db.record(distinct_model, 1, ("foo", "bar"), now)
+
+        with (
+            mock.patch.object(
+                db.cluster, "get_pool_for_host", side_effect=ConnectionError("Boom!")
+            ),
+            mock.patch("sentry.tsdb.redis.metrics") as metrics,
+        ):
+            db.write_behind.flush()
+
+        # Nothing was written, but the failures are reported and the writes kept
+        metrics.incr.assert_any_call("tsdb.write_behind.flush_failed")
+        assert db.get_range(TSDBModel.project, [1], now, now) == {1: [(timestamp, 0)]}
+        assert db.get_distinct_counts_totals(distinct_model, [1], now, now) == {1: 0}
+
+        db.incr(TSDBModel.project, 1, now)
+        db.write_behind.flush()
+
+        # The failed writes are retried along with the ones buffered since
+        assert db.get_range(TSDBModel.project, [1], now, now) == {1: [(timestamp, 3)]}
+        assert db.get_distinct_counts_totals(distinct_model, [1], now, now) == {1: 2}
+
     def test_frequency_table_import_export_no_estimators(self) -> None:
         client = self.db.cluster.get_local_client_for_key("key")
 
@@ -3,15 +3,18 @@ from __future__ import annotations
 import functools
 import os
 from collections.abc import Callable
+from datetime import timedelta
+from types import ModuleType
 from unittest import mock
 
 import pytest
 
-from sentry.utils.kvstore.bigtable import BigtableKVStorage
+from sentry.testutils.skips import requires_pytest_benchmark
+from sentry.utils.kvstore.bigtable import BigtableError, BigtableKVStorage
 
 
 def create_store(
-    request: pytest.FixtureRequest, compression: str | None = None
+    request: pytest.FixtureRequest, compression: str | None = None, read_concurrency: int = 1
 ) -> BigtableKVStorage:
     if "BIGTABLE_EMULATOR_HOST" not in os.environ:
         pytest.skip(
@@ -22,6 +25,7 @@ def create_store(
         instance="test",
         table_name="test",
         compression=compression,
+        read_concurrency=read_concurrency,
     )
     store.bootstrap()
     request.addfinalizer(store.destroy)
@@ -104,3 +108,55 @@ def test_get_uses_5s_timeout_for_retry() -> None:
         retry_arg = kwargs["retry"]
         assert hasattr(retry_arg, "_timeout")
         assert retry_arg._timeout == 5.0
+
+
+def test_set_many_batches_mutations() -> None:
+    store = BigtableKVStorage("test", "test", "test", default_ttl=timedelta(days=1))
+    mock_table = mock.Mock()
+    mock_table.mutate_rows.side_effect = lambda rows: [mock.Mock(code=0) for _ in rows]
+    with (
+        mock.patch.object(store, "_get_table", return_value=mock_table),
+        mock.patch.object(BigtableKVStorage, "mutate_rows_batch_size", 2),
+    ):
+        store.set_many([(f"key-{i}", b"value") for i in range(5)])
+
+    assert [len(call.args[0]) for call in mock_table.mutate_rows.call_args_list] == [2, 2, 1]
+    assert mock_table.direct_row.call_count == 5
+
+
+def test_set_many_raises_on_failed_rows() -> None:
+    store = BigtableKVStorage("test", "test", "test")
+    mock_table = mock.Mock()
+    mock_table.mutate_rows.return_value = [mock.Mock(code=0), mock.Mock(code=4, message="nope")]
+    with (
+        mock.patch.object(store, "_get_table", return_value=mock_table),
+        pytest.raises(BigtableError),
+    ):
+        store.set_many([("a", b"value"), ("b", b"value")])
+
+
+def test_concurrent_get_many(request: pytest.FixtureRequest) -> None:
+    store = create_store(request, read_concurrency=4)
+
+    items = {f"key-{i}": f"value-{i}".encode() for i in range(20)}
+    store.set_many(list(items.items()), ttl=timedelta(seconds=30))
+
+    assert dict(store.get_many([*items.keys(), "missing"])) == items
+
+
+@requires_pytest_benchmark
+@pytest.mark.parametrize("batched", [False, True], ids=["set", "set_many"])
+def test_benchmark_writes(
+    batched: bool, request: pytest.FixtureRequest, benchmark: ModuleType
+) -> None:
+    store = create_store(request, compression="zstd")
+    items = [(f"node-{i}", b'{"event_id":"%d"}' % i * 50) for i in range(500)]
+
+    def write_rows() -> None:
+        if batched:
+            store.set_many(items, ttl=timedelta(days=1))
+        else:
+            for key, value in items:
+                store.set(key, value, ttl=timedelta(days=1))
+
+    benchmark.pedantic(write_rows, rounds=10)
@@ -128,3 +128,20 @@ def test_multiple_key_operations(properties: Properties) -> None:
     store.delete_many(all_keys)
 
     assert dict(store.get_many(all_keys)) == {}
+
+
+def test_set_many(properties: Properties) -> None:
+    store = properties.store
+
+    # Test setting keys with no prior value.
+    items = dict(itertools.islice(properties.items, 10))
+    store.set_many(list(items.items()))
+    assert dict(store.get_many(list(items.keys()))) == items
+
+    # Test overwriting keys with prior values and a new TTL.
+    items = {key: next(properties.values) for key in items}
+    store.set_many(list(items.items()), ttl=timedelta(seconds=30))
+    assert dict(store.get_many(list(items.keys()))) == items
+
+    store.delete_many(list(items.keys()))
+    assert dict(store.get_many(list(items.keys()))) == {}
@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import pytest
 
+from sentry import tsdb
 from sentry.issues.grouptype import GroupCategory, PerformanceNPlusOneGroupType
 from sentry.models.group import Group
 from sentry.testutils.helpers.datetime import before_now
@@ -13,6 +14,8 @@ from sentry.workflow_engine.handlers.condition.event_frequency_query_handlers im
     EventFrequencyQueryHandler,
     EventUniqueUserFrequencyQueryHandler,
     PercentSessionsQueryHandler,
+    QueryWindow,
+    plan_shared_series_queries,
 )
 from tests.sentry.workflow_engine.handlers.condition.test_base import EventFrequencyQueryTestBase
 from tests.snuba.rules.conditions.test_event_frequency import BaseEventFrequencyPercentTest
@@ -102,6 +105,61 @@ class EventFrequencyQueryTest(EventFrequencyQueryTestBase):
         )
         assert batch_query == {self.event3.group_id: 1}
 
+    def test_get_rate_bulk_windows(self) -> None:
+        current = QueryWindow(start=self.start, end=self.end)
+        longer = QueryWindow(start=self.end - timedelta(minutes=15), end=self.end)
+        comparison = QueryWindow(
+            start=self.start - timedelta(minutes=5), end=self.end - timedelta(minutes=5)
+        )
+
+        with patch.object(
+            tsdb.backend, "get_range", wraps=tsdb.backend.get_range
+        ) as mock_get_range:
+            results = self.handler().get_rate_bulk_windows(
+                {
+                    current: self.groups,
+                    longer: self.groups,
+                    comparison: [self.groups[0]],
+                },
+                environment_id=self.environment.id,
+                filters=None,
+            )
+
+        # one shared fetch for each of the error and performance groups
+        assert mock_get_range.call_count == 2
+        assert results == {
+            current: {
+                self.event.group_id: 1,
+                self.event2.group_id: 1,
+                self.perf_event.group_id: 1,
+            },
+            longer: {
+                self.event.group_id: 1,
+                self.event2.group_id: 1,
+                self.perf_event.group_id: 1,
+            },
+            comparison: {self.groups[0]["id"]: 0},
+        }
+
+    def test_plan_shared_series_queries(self) -> None:
+        current = QueryWindow(start=self.start, end=self.end)
+        comparison = QueryWindow(
+            start=self.start - timedelta(minutes=5), end=self.end - timedelta(minutes=5)
+        )
+        # a week ago is too far away to share the 10 second buckets
+        last_week = QueryWindow(
+            start=self.start - timedelta(weeks=1), end=self.end - timedelta(weeks=1)
+        )
+
+        shared_queries, separate_windows = plan_shared_series_queries(
+            {current: self.groups, comparison: self.groups, last_week: self.groups}
+        )
+
+        assert len(shared_queries) == 1
+        assert shared_queries[0].rollup == 10
+        assert set(shared_queries[0].window_buckets) == {current, comparison}
+        assert separate_windows == {last_week: self.groups}
+
     def test_batch_query_with_upsampling_enabled_counts_upsampled(self) -> None:
         # Create two sampled error events in a dedicated group
         event_a = self.store_event(
@@ -15,6 +15,7 @@ from sentry.rules.conditions.event_frequency import ComparisonType
 from sentry.rules.match import MatchType
 from sentry.services.eventstore.models import Event, GroupEvent
 from sentry.testutils.helpers.datetime import before_now, freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.utils import json
 from sentry.utils.snuba import RateLimitExceeded
 from sentry.workflow_engine.buffer.batch_client import DelayedWorkflowClient
@@ -22,6 +23,7 @@ from sentry.workflow_engine.handlers.condition.event_frequency_query_handlers im
     BaseEventFrequencyQueryHandler,
     EventFrequencyQueryHandler,
     EventUniqueUserFrequencyQueryHandler,
+    PercentSessionsQueryHandler,
     QueryResult,
 )
 from sentry.workflow_engine.models import (
@@ -44,7 +46,10 @@ from sentry.workflow_engine.processors.delayed_workflow import (
     EventKey,
     EventRedisData,
     GroupQueryParams,
+    MergedConditionQuery,
     UniqueConditionQuery,
+    _fan_back_results,
+    _ProjectBatch,
     bulk_fetch_events,
     cleanup_redis_buffer,
     fetch_project,
@@ -55,6 +60,9 @@ from sentry.workflow_engine.processors.delayed_workflow import (
     get_condition_query_groups,
     get_group_to_groupevent,
     get_groups_to_fire,
+    get_merged_condition_group_results,
+    merge_condition_query_groups,
+    process_delayed_workflows_for_projects,
 )
 from tests.sentry.workflow_engine.test_base import BaseWorkflowTest
 from tests.snuba.rules.conditions.test_event_frequency import BaseEventFrequencyPercentTest
@@ -593,6 +601,28 @@ class TestGetSnubaResults(BaseWorkflowTest):
             offset_percent_query: {group_id: 1},
         }
 
+    @override_options({"workflow_engine.delayed_workflow.shared_window_queries": True})
+    def test_shared_window_queries(self) -> None:
+        count_dc = self.create_event_frequency_condition()
+        percent_dc = self.create_event_frequency_condition(type=Condition.EVENT_FREQUENCY_PERCENT)
+        condition_groups, group_id, all_queries = self.create_condition_groups(
+            [count_dc, percent_dc]
+        )
+
+        with patch(
+            "sentry.workflow_engine.handlers.condition.event_frequency_query_handlers.EventFrequencyQueryHandler.shared_series_query",
+            wraps=EventFrequencyQueryHandler().shared_series_query,
+        ) as mock_shared_series_query:
+            results = get_condition_group_results(condition_groups)
+
+        count_query, _, offset_percent_query = all_queries
+        assert results == {
+            count_query: {group_id: 4},
+            offset_percent_query: {group_id: 1},
+        }
+        # The current and comparison windows come from a single fetch.
+        assert mock_shared_series_query.call_count == 1
+
     def test_get_condition_group_results_exception_propagation(self) -> None:
         """
         When we get an exception from the handler, we should propagate it.
@@ -640,6 +670,120 @@ class TestGetSnubaResults(BaseWorkflowTest):
         assert result == {}
 
 
+class TestMergeConditionQueries(BaseWorkflowTest):
+    def setUp(self) -> None:
+        super().setUp()
+        self.project_two = self.create_project(organization=self.organization)
+        self.other_org_project = self.create_project(organization=self.create_organization())
+        self.count_query = UniqueConditionQuery(
+            handler=EventFrequencyQueryHandler, interval="1h", environment_id=None
+        )
+        self.sessions_query = UniqueConditionQuery(
+            handler=PercentSessionsQueryHandler, interval="1h", environment_id=None
+        )
+
+    def create_batch(
+        self, project: Project, condition_groups: dict[UniqueConditionQuery, GroupQueryParams]
+    ) -> _ProjectBatch:
+        return _ProjectBatch(
+            project=project,
+            event_data=EventRedisData(events={}),
+            workflows_to_envs={},
+            data_condition_groups=[],
+            dcg_to_slow_conditions={},
+            condition_groups=condition_groups,
+            verbose=False,
+        )
+
+    def test_merge_within_organization(self) -> None:
+        earlier = FROZEN_TIME - timedelta(minutes=1)
+        batches = [
+            self.create_batch(
+                self.project,
+                {
+                    self.count_query: GroupQueryParams(group_ids={1}, timestamp=earlier),
+                    self.sessions_query: GroupQueryParams(group_ids={1}),
+                },
+            ),
+            self.create_batch(
+                self.project_two,
+                {
+                    self.count_query: GroupQueryParams(group_ids={2}, timestamp=FROZEN_TIME),
+                    self.sessions_query: GroupQueryParams(group_ids={2}),
+                },
+            ),
+            self.create_batch(
+                self.other_org_project, {self.count_query: GroupQueryParams(group_ids={3})}
+            ),
+        ]
+
+        assert merge_condition_query_groups(batches) == {
+            MergedConditionQuery(self.count_query, self.organization.id): GroupQueryParams(
+                group_ids={1, 2}, timestamp=FROZEN_TIME
+            ),
+            # Session counts are per project, so these are never merged.
+            MergedConditionQuery(
+                self.sessions_query, self.organization.id, self.project.id
+            ): GroupQueryParams(group_ids={1}),
+            MergedConditionQuery(
+                self.sessions_query, self.organization.id, self.project_two.id
+            ): GroupQueryParams(group_ids={2}),
+            MergedConditionQuery(
+                self.count_query, self.other_org_project.organization_id
+            ): GroupQueryParams(group_ids={3}),
+        }
+
+    def test_fan_back_results(self) -> None:
+        batch = self.create_batch(
+            self.project, {self.count_query: GroupQueryParams(group_ids={1, 3})}
+        )
+        merged_results: dict[MergedConditionQuery, QueryResult] = {
+            MergedConditionQuery(self.count_query, self.organization.id): {1: 5, 2: 7, 3: 0},
+        }
+
+        assert _fan_back_results(batch, merged_results) == {self.count_query: {1: 5, 3: 0}}
+
+    def test_merged_results_exception_propagation(self) -> None:
+        mock_handler = Mock(spec=BaseEventFrequencyQueryHandler)
+        mock_handler.get_rate_bulk_windows.side_effect = ValueError("Escaping exception")
+        mock_handler.intervals = {"1h": ("fake", timedelta(seconds=1))}
+
+        unique_query = UniqueConditionQuery(
+            handler=lambda: mock_handler,  # type: ignore[arg-type]
+            interval="1h",
+            environment_id=None,
+        )
+        merged_query = MergedConditionQuery(unique_query, self.organization.id)
+
+        with pytest.raises(ValueError, match="Escaping exception"):
+            get_merged_condition_group_results(
+                {merged_query: GroupQueryParams(group_ids={1})}, max_workers=2
+            )
+
+
+class TestProcessDelayedWorkflowsForProjects(TestDelayedWorkflowBase):
+    @patch("sentry.workflow_engine.processors.delayed_workflow.fire_actions_for_groups")
+    def test_merges_queries_across_projects(self, mock_fire: MagicMock) -> None:
+        self._push_base_events()
+
+        stats = process_delayed_workflows_for_projects(
+            self.batch_client, [self.project.id, self.project2.id]
+        )
+
+        assert stats.projects == 2
+        # The workflows without an environment make the same queries in both projects.
+        assert stats.merged_queries < stats.project_queries
+
+        # Only the workflows without a slow WHEN condition fire, through their passing filters.
+        assert [set(call.args[1].keys()) for call in mock_fire.call_args_list] == [
+            {self.group2.id},
+            {self.group4.id},
+        ]
+
+        for project in (self.project, self.project2):
+            assert self.batch_client.for_project(project.id).get_hash_data(batch_key=None) == {}
+
+
 class TestGetGroupsToFire(TestDelayedWorkflowBase):
     def setUp(self) -> None:
         super().setUp()
@@ -0,0 +1,150 @@
+from unittest import mock
+
+from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
+from sentry.workflow_engine.caches.evaluation_plan import (
+    clear_evaluation_plans,
+    get_evaluation_plan,
+)
+from sentry.workflow_engine.models import DataConditionGroup
+from sentry.workflow_engine.models.data_condition import Condition, DataCondition
+from sentry.workflow_engine.processors.data_condition_group import (
+    evaluate_data_conditions,
+    evaluate_plan,
+    process_data_condition_group,
+)
+from sentry.workflow_engine.processors.evaluation_plan import (
+    ConditionCost,
+    EvaluationPlan,
+    compile_evaluation_plan,
+    get_plan_version,
+)
+from sentry.workflow_engine.types import DetectorPriorityLevel
+
+
+class TestCompileEvaluationPlan(TestCase):
+    def setUp(self) -> None:
+        self.assigned_to = DataCondition(
+            type=Condition.ASSIGNED_TO,
+            comparison={"target_type": "Unassigned"},
+            condition_result=True,
+        )
+        self.first_seen = DataCondition(
+            type=Condition.FIRST_SEEN_EVENT, comparison=True, condition_result=True
+        )
+        self.greater = DataCondition(type=Condition.GREATER, comparison=5, condition_result=True)
+        self.conditions = [self.assigned_to, self.first_seen, self.greater]
+
+    def compile(self, logic_type: DataConditionGroup.Type) -> EvaluationPlan:
+        return compile_evaluation_plan(
+            logic_type, self.conditions, get_plan_version(logic_type, self.conditions)
+        )
+
+    def test_all_orders_by_cost(self) -> None:
+        plan = self.compile(DataConditionGroup.Type.ALL)
+
+        assert plan.reordered
+        assert [compiled.condition for compiled in plan.conditions] == [
+            self.greater,
+            self.first_seen,
+            self.assigned_to,
+        ]
+        assert [compiled.cost for compiled in plan.conditions] == [
+            ConditionCost.OPERATOR,
+            ConditionCost.HANDLER,
+            ConditionCost.EXPENSIVE_HANDLER,
+        ]
+        assert [compiled.position for compiled in plan.conditions] == [2, 1, 0]
+
+    def test_keeps_order(self) -> None:
+        for logic_type in (
+            DataConditionGroup.Type.ANY,
+            DataConditionGroup.Type.ANY_SHORT_CIRCUIT,
+            DataConditionGroup.Type.NONE,
+        ):
+            plan = self.compile(logic_type)
+            assert not plan.reordered
+            assert [compiled.condition for compiled in plan.conditions] == self.conditions
+
+    def test_all_short_circuits(self) -> None:
+        with mock.patch.object(DataCondition, "_evaluate_handler") as evaluate_handler:
+            plan = self.compile(DataConditionGroup.Type.ALL)
+            evaluation = evaluate_plan(plan, 1)
+
+        evaluate_handler.assert_not_called()
+        assert evaluation.triggered is False
+        assert evaluation.error is None
+        assert evaluation.data["condition_evaluations"] == []
+
+    def test_all_restores_order(self) -> None:
+        with mock.patch.object(DataCondition, "_evaluate_handler", return_value=True):
+            plan = self.compile(DataConditionGroup.Type.ALL)
+            evaluation = evaluate_plan(plan, 10)
+
+        assert evaluation.triggered is True
+        assert [e.condition for e in evaluation.data["condition_evaluations"]] == self.conditions
+
+
+class TestEvaluatePlan(TestCase):
+    def setUp(self) -> None:
+        self.conditions = [
+            DataCondition(
+                type=Condition.GREATER, comparison=5, condition_result=DetectorPriorityLevel.HIGH
+            ),
+            DataCondition(
+                type=Condition.GREATER, comparison=3, condition_result=DetectorPriorityLevel.LOW
+            ),
+            DataCondition(type=Condition.LESS, comparison=8, condition_result=True),
+            DataCondition(type=Condition.EQUAL, comparison="invalid", condition_result=True),
+        ]
+
+    def test_matches_evaluate_data_conditions(self) -> None:
+        for logic_type in DataConditionGroup.Type:
+            plan = compile_evaluation_plan(
+                logic_type, self.conditions, get_plan_version(logic_type, self.conditions)
+            )
+            for value in (1, 4, 6, 10, None):
+                expected = evaluate_data_conditions(
+                    [(condition, value) for condition in self.conditions], logic_type
+                )
+                assert evaluate_plan(plan, value) == expected, (logic_type, value)
+
+
+class TestProcessDataConditionGroupPlan(TestCase):
+    def setUp(self) -> None:
+        clear_evaluation_plans()
+        self.group = self.create_data_condition_group(logic_type=DataConditionGroup.Type.ALL)
+        self.condition = self.create_data_condition(
+            type=Condition.GREATER,
+            comparison=5,
+            condition_result=True,
+            condition_group=self.group,
+        )
+
+    @override_options({"workflow_engine.evaluation_plans_enabled": True})
+    def test_process(self) -> None:
+        evaluation, slow_conditions = process_data_condition_group(self.group, 10)
+        assert evaluation.triggered is True
+        assert slow_conditions == []
+
+        evaluation, _ = process_data_condition_group(self.group, 1)
+        assert evaluation.triggered is False
+
+    @override_options({"workflow_engine.evaluation_plans_enabled": True})
+    def test_recompiles_on_update(self) -> None:
+        process_data_condition_group(self.group, 10)
+        plan = get_evaluation_plan(self.group.id, DataConditionGroup.Type.ALL, [self.condition])
+
+        self.condition.comparison = 20
+        self.condition.save()
+        evaluation, _ = process_data_condition_group(self.group, 10)
+
+        assert evaluation.triggered is False
+        assert (
+            get_evaluation_plan(
+                self.group.id,
+                DataConditionGroup.Type.ALL,
+                list(DataCondition.objects.filter(condition_group=self.group)),
+            )
+            is not plan
+        )
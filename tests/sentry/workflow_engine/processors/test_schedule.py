@@ -18,6 +18,7 @@ from sentry.workflow_engine.processors.schedule import (
     mark_projects_processed,
     process_buffered_workflows,
     process_in_batches,
+    process_projects,
 )
 
 FROZEN_TIME = before_now(days=1).replace(hour=1, minute=30, second=0, microsecond=0)
@@ -156,6 +157,67 @@ class ProcessInBatchesTest(CreateEventTestCase):
         assert not original_data
 
 
+class ProcessProjectsTest(CreateEventTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.rule = self.create_alert_rule()
+        self.project_two = self.create_project(organization=self.organization)
+        self.other_org_project = self.create_project(organization=self.create_organization())
+        self.large_project = self.create_project(organization=self.organization)
+
+        for project in (self.project, self.project_two, self.other_org_project):
+            self.push_to_hash(project.id, self.rule.id, self.create_group(project).id)
+        for _ in range(3):
+            self.push_to_hash(self.large_project.id, self.rule.id, self.create_group().id)
+
+    @override_options(
+        {
+            "delayed_processing.batch_size": 3,
+            "workflow_engine.delayed_workflow.projects_per_task": 10,
+        }
+    )
+    @patch(
+        "sentry.workflow_engine.tasks.delayed_workflows.process_delayed_workflows_for_projects.apply_async"
+    )
+    @patch("sentry.workflow_engine.tasks.delayed_workflows.process_delayed_workflows.apply_async")
+    def test_groups_small_projects_by_organization(
+        self, mock_apply_delayed: MagicMock, mock_apply_delayed_for_projects: MagicMock
+    ) -> None:
+        process_projects(
+            self.batch_client,
+            [
+                self.project.id,
+                self.project_two.id,
+                self.other_org_project.id,
+                self.large_project.id,
+            ],
+        )
+
+        mock_apply_delayed_for_projects.assert_called_once_with(
+            kwargs={"project_ids": sorted([self.project.id, self.project_two.id])},
+            headers={"sentry-propagate-traces": False},
+        )
+        # The project of the other organization is processed on its own, and
+        # the large project in batches.
+        large_project_kwargs, other_org_kwargs = (
+            call[1]["kwargs"] for call in mock_apply_delayed.call_args_list
+        )
+        assert large_project_kwargs["project_id"] == self.large_project.id
+        assert large_project_kwargs["batch_key"]
+        assert other_org_kwargs == {"project_id": self.other_org_project.id}
+
+    @override_options(
+        {
+            "delayed_processing.batch_size": 3,
+            "workflow_engine.delayed_workflow.projects_per_task": 0,
+        }
+    )
+    @patch("sentry.workflow_engine.processors.schedule.process_in_batches")
+    def test_disabled(self, mock_process_in_batches: MagicMock) -> None:
+        process_projects(self.batch_client, [self.project.id, self.project_two.id])
+        assert mock_process_in_batches.call_count == 2
+
+
 class FetchGroupToEventDataTest(CreateEventTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -304,3 +304,35 @@ class StreamGroupSerializerTestCase(APITestCase, BaseMetricsTestCase):
             request=self.make_request(),
         )
         assert result[0]["id"] == str(group.id)
+
+    def test_concurrent_attr_loaders(self) -> None:
+        group = self.create_group()
+        serializer = StreamGroupSerializerSnuba(
+            stats_period="24h",
+            organization_id=group.project.organization_id,
+            search_filters=[SearchFilter(SearchKey("environment"), "=", SearchValue("prod"))],
+        )
+
+        def get_range(model, keys, conditions=None, **kwargs):
+            return {key: [(0, 2 if conditions else 5)] for key in keys}
+
+        with mock.patch(
+            "sentry.api.serializers.models.group_stream.snuba_tsdb.get_range",
+            side_effect=get_range,
+        ):
+            serial_result = serialize([group], self.user, serializer=serializer)
+            with (
+                self.options({"api.group-stream.attr-loader-workers": 4}),
+                mock.patch("sentry.api.serializers.models.group_stream.metrics") as mock_metrics,
+            ):
+                concurrent_result = serialize([group], self.user, serializer=serializer)
+
+        assert concurrent_result == serial_result
+        assert concurrent_result[0]["stats"] == {"24h": [(0, 5)]}
+        assert concurrent_result[0]["filtered"]["stats"] == {"24h": [(0, 2)]}
+        loader_tags = {
+            call.kwargs["tags"]["loader"]
+            for call in mock_metrics.timer.call_args_list
+            if call.args[0] == "group_stream.get_attrs.loader.duration"
+        }
+        assert loader_tags == {"base", "stats", "filtered_stats"}